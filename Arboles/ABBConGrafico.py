@@ -0,0 +1,1450 @@
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+# Formato de las instantáneas de guardar/cargar (little-endian):
+#   cabecera: b"ABBP", versión (uint32), tipo de las claves
+#             ('q' o 'd', 1 byte, más 7 de relleno), n (uint64)       24 bytes
+#   claves:   las n claves en preorden, int64 o float64                8n bytes
+#   derechos: posición en el preorden del hijo derecho de cada
+#             nodo, o -1 si no tiene (int32)                           4n bytes
+#   banderas: un byte por nodo; bit 0 = tiene hijo izquierdo,
+#             bit 1 = tiene hijo derecho                               n bytes
+#
+# En preorden el hijo izquierdo de un nodo, si existe, es el nodo que le sigue;
+# con las banderas basta para reconstruir la forma exacta del árbol sin comparar
+# claves. Los derechos sólo los usa ArbolMapeado para bajar por el árbol sin
+# cargarlo.
+MAGIA = b"ABBP"
+VERSION = 1
+CABECERA = struct.Struct("<4sIc7xQ")
+IZQUIERDO = 1
+DERECHO = 2
+
+# Desde cuántas claves buscar_muchos reparte la búsqueda entre varios procesos.
+UMBRAL_PARALELO = 1_000_000
+
+# Cuántos píxeles puede tener, a lo más, la imagen de mostrar_graficamente.
+MAX_PIXELES = 16_000_000
+
+
+class Nodo:
+    # Sin __dict__ por instancia: cada nodo ocupa sólo lo que necesitan sus atributos.
+    __slots__ = ("dato", "izquierdo", "derecho", "tamano", "altura")
+
+    def __init__(self, dato):
+        """
+        Inicializa un nuevo nodo con el valor 'dato' y establece
+        los punteros 'izquierdo' y 'derecho' a None.
+        Además guarda el tamaño (cantidad de nodos) y la altura del subárbol
+        que cuelga de él; para un nodo recién creado ambos valen 1.
+        """
+        self.dato = dato
+        self.izquierdo = None
+        self.derecho = None
+        self.tamano = 1
+        self.altura = 1
+
+class ArbolBinarioBusqueda:
+    def __init__(self):
+        """
+        Inicializa un nuevo árbol de búsqueda binaria con la raíz establecida a None.
+        """
+        self.raiz = None
+
+    def insertar(self, dato):
+        """
+        Inserta un nuevo nodo con el valor 'dato' en el árbol.
+        Si el árbol está vacío, crea un nuevo nodo y lo establece como la raíz.
+        De lo contrario, llama al método '_insertar' para insertar el nodo en la posición correcta.
+        """
+        if self.raiz is None:
+            self.raiz = Nodo(dato)
+        else:
+            self._insertar(dato, self.raiz)
+
+    def _insertar(self, dato, nodo):
+        """
+        Método auxiliar que realiza la inserción iterativa de un nodo en el árbol.
+        Desde 'nodo' compara el valor 'dato' con el del nodo actual y baja por el
+        subárbol izquierdo o derecho, según corresponda, hasta encontrar un hueco.
+        En el camino suma 1 al tamaño de cada nodo y al final corrige las alturas.
+        """
+        camino = []
+        while True:
+            camino.append(nodo)
+            nodo.tamano += 1
+            if dato < nodo.dato:
+                if nodo.izquierdo is None:
+                    nodo.izquierdo = Nodo(dato)
+                    break
+                nodo = nodo.izquierdo
+            else:
+                if nodo.derecho is None:
+                    nodo.derecho = Nodo(dato)
+                    break
+                nodo = nodo.derecho
+        self._actualizar_alturas(camino)
+
+    def _actualizar_alturas(self, camino):
+        """
+        Método auxiliar que corrige la altura de los nodos de 'camino' (una lista que
+        parte en la raíz) después de colgar una hoja nueva bajo el último de ellos.
+        Cada nodo debe medir al menos la distancia hasta esa hoja; en cuanto uno ya
+        la cumple, la altura de sus ancestros tampoco cambia y se detiene.
+        """
+        altura = 1
+        for nodo in reversed(camino):
+            altura += 1
+            if nodo.altura >= altura:
+                break
+            nodo.altura = altura
+
+    def _actualizar(self, nodo):
+        """
+        Método auxiliar que recalcula el tamaño y la altura de 'nodo' a partir
+        de los de sus hijos.
+        """
+        izquierdo, derecho = nodo.izquierdo, nodo.derecho
+        nodo.tamano = 1 + self._numero_total_nodos(izquierdo) + self._numero_total_nodos(derecho)
+        nodo.altura = 1 + max(self._altura(izquierdo), self._altura(derecho))
+
+    @classmethod
+    def desde_ordenados(cls, datos):
+        """
+        Construye un árbol perfectamente balanceado a partir de 'datos', que debe
+        venir ordenado de menor a mayor (no se verifica). Cada subárbol toma como
+        raíz el elemento central de su tramo, así que la construcción es O(n) y
+        no hace comparaciones.
+        """
+        if not isinstance(datos, (list, tuple)):
+            datos = list(datos)
+        arbol = cls()
+        arbol.raiz = arbol._construir_balanceado(datos, 0, len(datos))
+        return arbol
+
+    @classmethod
+    def desde_iterable(cls, datos):
+        """
+        Construye un árbol balanceado a partir de 'datos' en cualquier orden:
+        los ordena una sola vez y luego usa 'desde_ordenados'.
+        """
+        return cls.desde_ordenados(sorted(datos))
+
+    def _construir_balanceado(self, datos, inicio, fin):
+        """
+        Método auxiliar que construye el subárbol balanceado de datos[inicio:fin]
+        y retorna su raíz. La profundidad de la recursión es O(log n).
+        """
+        if inicio >= fin:
+            return None
+        medio = (inicio + fin) // 2
+        nodo = Nodo(datos[medio])
+        nodo.izquierdo = self._construir_balanceado(datos, inicio, medio)
+        nodo.derecho = self._construir_balanceado(datos, medio + 1, fin)
+        self._actualizar(nodo)
+        return nodo
+
+    def insertar_muchos(self, datos):
+        """
+        Inserta todos los elementos de 'datos' en el árbol.
+        Si el árbol está vacío, o si insertarlos uno por uno costaría al menos lo
+        que reconstruir (n + m, con m datos nuevos y n existentes; ver
+        '_costo_insertar'), mezcla el inorden del árbol con los datos ordenados y
+        reconstruye un árbol balanceado en O(n + m log m); si no, los inserta
+        uno a uno.
+        """
+        nuevos = sorted(datos)
+        n = self.numero_total_nodos()
+        limite = n + len(nuevos)
+        if n == 0 or self._costo_insertar(nuevos, limite) >= limite:
+            todos = list(heapq.merge(self.iter_inorden(), nuevos))
+            self.raiz = self._construir_balanceado(todos, 0, len(todos))
+        else:
+            insertar = self.insertar
+            for dato in nuevos:
+                insertar(dato)
+
+    def _costo_insertar(self, nuevos, limite):
+        """
+        Método auxiliar que estima cuántos pasos costaría insertar uno por uno
+        los datos ordenados 'nuevos'. Además de la altura actual, cuenta la
+        altura que crean los propios datos: los que caen seguidos en el mismo
+        hueco del árbol (mismo 'rango') se encadenan uno bajo otro, así que el
+        k-ésimo de una racha baja k niveles más. Deja de contar en cuanto la
+        estimación llega a 'limite', de modo que estimar nunca cuesta más que
+        reconstruir.
+        """
+        altura = self.altura()
+        costo, racha, hueco_anterior = 0, 0, None
+        for dato in nuevos:
+            hueco = self.rango(dato)
+            racha = racha + 1 if hueco == hueco_anterior else 0
+            hueco_anterior = hueco
+            costo += altura + racha
+            if costo >= limite:
+                break
+        return costo
+
+    def eliminar(self, dato):
+        """
+        Elimina del árbol un nodo con el valor 'dato'. Retorna True si lo encontró
+        y False si 'dato' no estaba. Cuesta O(h) y no reconstruye el árbol.
+        """
+        camino = self._desenganchar(dato)
+        if camino is None:
+            return False
+        self._tras_eliminar(camino)
+        return True
+
+    def _desenganchar(self, dato):
+        """
+        Método auxiliar que saca del árbol un nodo con el valor 'dato' y retorna el
+        camino (desde la raíz) hasta el padre del nodo que se desenganchó, con los
+        tamaños ya descontados; retorna None si 'dato' no está.
+        - Si el nodo es una hoja o tiene un solo hijo, ese hijo ocupa su lugar.
+        - Si tiene dos hijos, se copia en él el dato de su sucesor inorden (el mínimo
+          del subárbol derecho) y se desengancha el sucesor, que no tiene hijo izquierdo.
+        """
+        camino = []
+        nodo = self.raiz
+        while nodo is not None and nodo.dato != dato:
+            camino.append(nodo)
+            nodo = nodo.izquierdo if dato < nodo.dato else nodo.derecho
+        if nodo is None:
+            return None
+        if nodo.izquierdo is not None and nodo.derecho is not None:
+            camino.append(nodo)
+            sucesor = nodo.derecho
+            while sucesor.izquierdo is not None:
+                camino.append(sucesor)
+                sucesor = sucesor.izquierdo
+            nodo.dato = sucesor.dato
+            nodo = sucesor
+        hijo = nodo.izquierdo if nodo.izquierdo is not None else nodo.derecho
+        if not camino:
+            self.raiz = hijo
+        elif camino[-1].izquierdo is nodo:
+            camino[-1].izquierdo = hijo
+        else:
+            camino[-1].derecho = hijo
+        for ancestro in camino:
+            ancestro.tamano -= 1
+        return camino
+
+    def _tras_eliminar(self, camino):
+        """
+        Método auxiliar que recalcula las alturas de 'camino' después de eliminar,
+        desde el último nodo hacia la raíz, deteniéndose en el primero que no cambia.
+        """
+        for nodo in reversed(camino):
+            altura = 1 + max(self._altura(nodo.izquierdo), self._altura(nodo.derecho))
+            if altura == nodo.altura:
+                break
+            nodo.altura = altura
+
+    def buscar(self, dato):
+        """
+        Busca un valor 'dato' en el árbol. Llama al método '_buscar'
+        para realizar la búsqueda.
+        """
+        return self._buscar(dato, self.raiz)
+
+    def _buscar(self, dato, nodo):
+        """
+        Método auxiliar que realiza la búsqueda iterativa de un valor 'dato' en el árbol.
+        Compara el valor 'dato' con el valor del nodo actual y continúa la búsqueda en
+        el subárbol izquierdo o derecho, según corresponda.
+        """
+        while nodo is not None:
+            if dato == nodo.dato:
+                return True
+            nodo = nodo.izquierdo if dato < nodo.dato else nodo.derecho
+        return False
+
+    def buscar_muchos(self, claves, procesos=None, umbral=UMBRAL_PARALELO):
+        """
+        Busca todos los valores de 'claves' y retorna una lista de booleanos, en
+        el mismo orden, que indica si cada uno está en el árbol (como 'buscar').
+        - Con menos de 'umbral' claves, o con menos claves que nodos tiene el
+          árbol, las busca en este proceso con '_buscar_ordenadas'.
+        - Si no, guarda una instantánea del árbol en un archivo temporal y
+          reparte las claves en bloques entre 'procesos' procesos (por omisión,
+          uno por CPU). Cada proceso abre la instantánea con ArbolMapeado una sola
+          vez, al iniciar, así que a las tareas sólo se les envían las claves y el
+          árbol no se serializa. Guardar la instantánea cuesta O(n); por eso
+          sólo conviene cuando hay más claves que nodos.
+        Si las claves del árbol no caben exactamente en una instantánea (ver
+        'guardar'), se busca siempre en este proceso.
+        """
+        if not isinstance(claves, (list, tuple)):
+            claves = list(claves)
+        procesos = procesos or os.cpu_count() or 1
+        if len(claves) < max(umbral, self.numero_total_nodos()) or procesos < 2:
+            return self._buscar_ordenadas(claves)
+
+        import tempfile
+        descriptor, ruta = tempfile.mkstemp(suffix=".abbp")
+        os.close(descriptor)
+        try:
+            try:
+                self.guardar(ruta)
+            except ValueError:
+                return self._buscar_ordenadas(claves)
+            return _buscar_en_procesos(ruta, claves, procesos)
+        finally:
+            os.remove(ruta)
+
+    def _buscar_ordenadas(self, claves):
+        """
+        Método auxiliar de buscar_muchos que busca 'claves' en este proceso.
+        Las ordena y las mezcla con el árbol en un solo descenso: cada nodo
+        separa con búsqueda binaria las claves menores, que siguen por su
+        subárbol izquierdo, de las mayores, que siguen por el derecho. Así cada
+        nodo se visita a lo más una vez por lote, y sólo si alguna clave cae en
+        su subárbol; los niveles de arriba se comparten entre todas las claves.
+        """
+        orden = sorted(range(len(claves)), key=claves.__getitem__)
+        ordenadas = [claves[i] for i in orden]
+        encontradas = [False] * len(claves)
+        pila = [(self.raiz, 0, len(ordenadas))]
+        while pila:
+            nodo, inicio, fin = pila.pop()
+            while nodo is not None and inicio < fin:
+                dato = nodo.dato
+                medio = bisect_left(ordenadas, dato, inicio, fin)
+                despues = bisect_right(ordenadas, dato, medio, fin)
+                for k in range(medio, despues):
+                    encontradas[orden[k]] = True
+                if medio > inicio:
+                    pila.append((nodo.izquierdo, inicio, medio))
+                nodo, inicio = nodo.derecho, despues
+        return encontradas
+
+    def __iter__(self):
+        """
+        Permite recorrer el árbol con 'for', entregando los datos en inorden
+        (de menor a mayor) sin construir una lista.
+        """
+        return self.iter_inorden()
+
+    def recorrido_preorden(self):
+        """
+        Realiza un recorrido en preorden (Raíz-Izquierda-Derecha) del árbol.
+        """
+        return self._recorrido_preorden(self.raiz)
+
+    def _recorrido_preorden(self, nodo):
+        """
+        Método auxiliar que retorna en una lista el recorrido en preorden desde 'nodo'.
+        """
+        return list(self._iter_preorden(nodo))
+
+    def iter_preorden(self):
+        """
+        Recorre el árbol en preorden (Raíz-Izquierda-Derecha), entregando los
+        datos de a uno. Usa memoria O(h), donde h es la altura del árbol.
+        """
+        return self._iter_preorden(self.raiz)
+
+    def _iter_preorden(self, nodo):
+        """
+        Generador auxiliar del recorrido en preorden, con una pila explícita que
+        sólo guarda los hijos derechos pendientes.
+        """
+        pila = []
+        while pila or nodo is not None:
+            if nodo is None:
+                nodo = pila.pop()
+            yield nodo.dato
+            if nodo.derecho is not None:
+                pila.append(nodo.derecho)
+            nodo = nodo.izquierdo
+
+    def recorrido_inorden(self):
+        """
+        Realiza un recorrido en inorden (Izquierda-Raíz-Derecha) del árbol.
+        """
+        return self._recorrido_inorden(self.raiz)
+
+    def _recorrido_inorden(self, nodo):
+        """
+        Método auxiliar que retorna en una lista el recorrido en inorden desde 'nodo'.
+        """
+        return list(self._iter_inorden(nodo))
+
+    def iter_inorden(self):
+        """
+        Recorre el árbol en inorden (Izquierda-Raíz-Derecha), entregando los
+        datos de a uno. Usa memoria O(h), donde h es la altura del árbol.
+        """
+        return self._iter_inorden(self.raiz)
+
+    def _iter_inorden(self, nodo):
+        """
+        Generador auxiliar del recorrido en inorden: baja por la izquierda apilando
+        nodos y, al desapilar, entrega el dato y pasa al subárbol derecho.
+        """
+        pila = []
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            nodo = pila.pop()
+            yield nodo.dato
+            nodo = nodo.derecho
+
+    def recorrido_postorden(self):
+        """
+        Realiza un recorrido en postorden (Izquierda-Derecha-Raíz) del árbol.
+        """
+        return self._recorrido_postorden(self.raiz)
+
+    def _recorrido_postorden(self, nodo):
+        """
+        Método auxiliar que retorna en una lista el recorrido en postorden desde 'nodo'.
+        """
+        return list(self._iter_postorden(nodo))
+
+    def iter_postorden(self):
+        """
+        Recorre el árbol en postorden (Izquierda-Derecha-Raíz), entregando los
+        datos de a uno. Usa memoria O(h), donde h es la altura del árbol.
+        """
+        return self._iter_postorden(self.raiz)
+
+    def _iter_postorden(self, nodo):
+        """
+        Generador auxiliar del recorrido en postorden. Un nodo se entrega cuando
+        ya no tiene subárbol derecho pendiente, es decir, cuando no tiene hijo
+        derecho o éste fue el último nodo entregado.
+        """
+        pila = []
+        ultimo = None
+        while pila or nodo is not None:
+            if nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+            else:
+                cima = pila[-1]
+                if cima.derecho is not None and cima.derecho is not ultimo:
+                    nodo = cima.derecho
+                else:
+                    yield cima.dato
+                    ultimo = pila.pop()
+
+    def recorrido_por_niveles(self):
+        """
+        Realiza un recorrido por niveles (anchura) del árbol.
+        """
+        return list(self.iter_por_niveles())
+
+    def iter_por_niveles(self, por_nivel=False):
+        """
+        Recorre el árbol por niveles (anchura) entregando los datos de a uno.
+        Si 'por_nivel' es True entrega, en cambio, una lista con los datos de
+        cada nivel, desde la raíz hacia las hojas.
+        La cola es un deque, así que sacar el siguiente nodo cuesta O(1).
+        """
+        if self.raiz is None:
+            return
+        cola = deque([self.raiz])
+        while cola:
+            if por_nivel:
+                nivel = []
+                for _ in range(len(cola)):
+                    nodo = cola.popleft()
+                    nivel.append(nodo.dato)
+                    if nodo.izquierdo is not None:
+                        cola.append(nodo.izquierdo)
+                    if nodo.derecho is not None:
+                        cola.append(nodo.derecho)
+                yield nivel
+            else:
+                nodo = cola.popleft()
+                yield nodo.dato
+                if nodo.izquierdo is not None:
+                    cola.append(nodo.izquierdo)
+                if nodo.derecho is not None:
+                    cola.append(nodo.derecho)
+
+    def numero_total_nodos(self):
+        """
+        Retorna el número total de nodos en el árbol, en O(1).
+        """
+        return self._numero_total_nodos(self.raiz)
+
+    def _numero_total_nodos(self, nodo):
+        """
+        Método auxiliar que retorna el tamaño guardado en 'nodo', o 0 si es None.
+        """
+        return nodo.tamano if nodo is not None else 0
+
+    def valor_maximo(self):
+        """
+        Retorna el valor máximo almacenado en el árbol.
+        """
+        if self.raiz is None:
+            return None
+        return self._valor_maximo(self.raiz)
+    def _valor_maximo(self, nodo):
+        """
+        Método auxiliar que encuentra el valor máximo bajando siempre por la derecha.
+        """
+        current = nodo
+        while current.derecho is not None:
+            current = current.derecho
+        return current.dato
+
+    def valor_minimo(self):
+        """
+        Retorna el valor mínimo almacenado en el árbol.
+        """
+        if self.raiz is None:
+            return None
+        return self._valor_minimo(self.raiz)
+
+    def _valor_minimo(self, nodo):
+        """
+        Método auxiliar que encuentra el valor mínimo bajando siempre por la izquierda.
+        """
+        while nodo.izquierdo is not None:
+            nodo = nodo.izquierdo
+        return nodo.dato
+
+    def piso(self, dato):
+        """
+        Retorna el mayor valor del árbol que es menor o igual que 'dato',
+        o None si no existe. Recorre un solo camino desde la raíz: O(h).
+        """
+        resultado = None
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.dato == dato:
+                return nodo.dato
+            if nodo.dato < dato:
+                resultado = nodo.dato
+                nodo = nodo.derecho
+            else:
+                nodo = nodo.izquierdo
+        return resultado
+
+    def techo(self, dato):
+        """
+        Retorna el menor valor del árbol que es mayor o igual que 'dato',
+        o None si no existe. Recorre un solo camino desde la raíz: O(h).
+        """
+        resultado = None
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.dato == dato:
+                return nodo.dato
+            if nodo.dato > dato:
+                resultado = nodo.dato
+                nodo = nodo.izquierdo
+            else:
+                nodo = nodo.derecho
+        return resultado
+
+    def iter_rango(self, desde, hasta):
+        """
+        Entrega en orden, de a uno, los valores del árbol entre 'desde' y 'hasta'
+        (ambos incluidos). Es un inorden que no baja a la izquierda de los nodos
+        menores que 'desde' y termina en el primer valor mayor que 'hasta', así
+        que cuesta O(h + k), con k la cantidad de valores entregados.
+        """
+        pila = []
+        nodo = self.raiz
+        while True:
+            while nodo is not None:
+                if nodo.dato < desde:
+                    nodo = nodo.derecho
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierdo
+            if not pila:
+                return
+            nodo = pila.pop()
+            if nodo.dato > hasta:
+                return
+            yield nodo.dato
+            nodo = nodo.derecho
+
+    def altura(self):
+        """
+        Retorna la altura del árbol, en O(1).
+        """
+        return self._altura(self.raiz)
+
+    def _altura(self, nodo):
+        """
+        Método auxiliar que retorna la altura guardada en 'nodo', o 0 si es None.
+        """
+        return nodo.altura if nodo is not None else 0
+
+    def k_esimo(self, k):
+        """
+        Retorna el k-ésimo dato más pequeño del árbol (k = 1 es el mínimo), o None
+        si 'k' está fuera de rango. Usa los tamaños guardados en los nodos para
+        decidir en cada paso hacia qué lado bajar, así que cuesta O(h).
+        """
+        if k < 1 or k > self.numero_total_nodos():
+            return None
+        nodo = self.raiz
+        while True:
+            izquierdos = self._numero_total_nodos(nodo.izquierdo)
+            if k <= izquierdos:
+                nodo = nodo.izquierdo
+            elif k == izquierdos + 1:
+                return nodo.dato
+            else:
+                k -= izquierdos + 1
+                nodo = nodo.derecho
+
+    def rango(self, dato):
+        """
+        Retorna el rango de 'dato': la cantidad de datos del árbol estrictamente
+        menores que él, en O(h). Si 'dato' está en el árbol, se cumple que
+        k_esimo(rango(dato) + 1) == dato.
+        """
+        menores = 0
+        nodo = self.raiz
+        while nodo is not None:
+            if nodo.dato < dato:
+                menores += self._numero_total_nodos(nodo.izquierdo) + 1
+                nodo = nodo.derecho
+            else:
+                nodo = nodo.izquierdo
+        return menores
+
+    def guardar(self, ruta, tipo=None):
+        """
+        Guarda una instantánea del árbol en el archivo 'ruta', con el formato
+        binario descrito al comienzo del módulo. Las claves se escriben con ancho
+        fijo según 'tipo' ('q': enteros de 64 bits, 'd': números reales); si no se
+        indica, se usa 'd' si alguna clave es float y 'q' en otro caso.
+        Lanza ValueError, sin escribir el archivo, si alguna clave no se puede
+        guardar exactamente en ese tipo: enteros fuera de 64 bits, reales con
+        'q', enteros que un float no representa exactamente con 'd', o claves
+        que no son números.
+        Recorre el árbol una vez en preorden; la posición del hijo derecho de cada
+        nodo sale del tamaño guardado en su hijo izquierdo.
+        """
+        n = self.numero_total_nodos()
+        claves = [None] * n
+        derechos = array("i", [-1]) * n
+        banderas = bytearray(n)
+        pila = []
+        nodo = self.raiz
+        for i in range(n):
+            if nodo is None:
+                nodo = pila.pop()
+            claves[i] = nodo.dato
+            izquierdo, derecho = nodo.izquierdo, nodo.derecho
+            bandera = 0
+            if izquierdo is not None:
+                bandera = IZQUIERDO
+            if derecho is not None:
+                bandera |= DERECHO
+                derechos[i] = i + 1 + (izquierdo.tamano if izquierdo is not None else 0)
+                pila.append(derecho)
+            banderas[i] = bandera
+            nodo = izquierdo
+        if tipo is None:
+            tipo = "d" if any(isinstance(clave, float) for clave in claves) else "q"
+        claves = _codificar_claves(claves, tipo)
+        if sys.byteorder == "big":
+            claves.byteswap()
+            derechos.byteswap()
+        with open(ruta, "wb") as archivo:
+            archivo.write(CABECERA.pack(MAGIA, VERSION, tipo.encode("ascii"), n))
+            archivo.write(claves.tobytes())
+            archivo.write(derechos.tobytes())
+            archivo.write(banderas)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Reconstruye un árbol guardado con 'guardar', con exactamente la misma
+        forma, en O(n) y sin comparar claves: recorre las claves en preorden
+        colgando cada nodo como hijo izquierdo del anterior, si éste lo espera,
+        o si no como hijo derecho del último nodo que tiene uno pendiente.
+        Después calcula tamaños y alturas recorriendo los nodos al revés, lo que
+        visita a cada hijo antes que a su padre.
+        """
+        with open(ruta, "rb") as archivo:
+            contenido = archivo.read()
+        tipo, n = _leer_cabecera(contenido, ruta)
+        inicio_claves = CABECERA.size
+        inicio_banderas = inicio_claves + 12 * n
+        claves = array(tipo)
+        claves.frombytes(contenido[inicio_claves:inicio_claves + 8 * n])
+        if sys.byteorder == "big":
+            claves.byteswap()
+        banderas = contenido[inicio_banderas:inicio_banderas + n]
+
+        arbol = cls()
+        nodos = [None] * n
+        pendientes = []
+        padre = None
+        for i, (dato, bandera) in enumerate(zip(claves, banderas)):
+            nodo = nodos[i] = Nodo(dato)
+            if padre is not None:
+                padre.izquierdo = nodo
+            elif pendientes:
+                pendientes.pop().derecho = nodo
+            else:
+                arbol.raiz = nodo
+            if bandera & DERECHO:
+                pendientes.append(nodo)
+            padre = nodo if bandera & IZQUIERDO else None
+
+        for nodo in reversed(nodos):
+            izquierdo, derecho = nodo.izquierdo, nodo.derecho
+            if izquierdo is not None:
+                if derecho is not None:
+                    nodo.tamano = 1 + izquierdo.tamano + derecho.tamano
+                    nodo.altura = 1 + max(izquierdo.altura, derecho.altura)
+                else:
+                    nodo.tamano = 1 + izquierdo.tamano
+                    nodo.altura = 1 + izquierdo.altura
+            elif derecho is not None:
+                nodo.tamano = 1 + derecho.tamano
+                nodo.altura = 1 + derecho.altura
+        return arbol
+    def _disposicion(self, max_niveles=None):
+        """
+        Método auxiliar que calcula en O(n), sin recursión, la posición de cada nodo
+        para dibujar el árbol: la coordenada x es la posición del nodo en el inorden
+        y la y es menos su profundidad, de modo que dos nodos nunca se superponen.
+        Si se indica 'max_niveles', sólo considera los nodos de esos primeros niveles.
+        Retorna las listas de coordenadas x, coordenadas y, datos y aristas
+        (cada arista es un par de puntos).
+        """
+        limite = max_niveles if max_niveles is not None else float("inf")
+        xs, ys, datos, nodos = [], [], [], []
+        indices = {}
+        pila = []
+        nodo, profundidad = self.raiz, 0
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append((nodo, profundidad))
+                nodo = nodo.izquierdo if profundidad + 1 < limite else None
+                profundidad += 1
+            nodo, profundidad = pila.pop()
+            indices[id(nodo)] = len(nodos)
+            xs.append(len(nodos))
+            ys.append(-profundidad)
+            datos.append(nodo.dato)
+            nodos.append(nodo)
+            nodo = nodo.derecho if profundidad + 1 < limite else None
+            profundidad += 1
+        aristas = []
+        for i, nodo in enumerate(nodos):
+            for hijo in (nodo.izquierdo, nodo.derecho):
+                j = indices.get(id(hijo)) if hijo is not None else None
+                if j is not None:
+                    aristas.append(((xs[i], ys[i]), (xs[j], ys[j])))
+        return xs, ys, datos, aristas
+
+    def mostrar_graficamente(self, archivo=None, max_niveles=None, max_etiquetas=300):
+        """
+        Dibuja el árbol con matplotlib. Las aristas se dibujan todas juntas con una
+        LineCollection y los nodos con un único 'scatter', así que sirve para
+        árboles de miles de nodos.
+        - Si se indica 'archivo', guarda la imagen (PNG, SVG, etc., según la extensión)
+          usando el backend Agg, sin abrir ventanas; sirve en servidores sin pantalla.
+          De lo contrario, muestra la figura con plt.show().
+        - 'max_niveles' limita el dibujo a los primeros niveles del árbol.
+        - Los datos sólo se escriben dentro de los nodos si hay a lo más
+          'max_etiquetas' nodos dibujados.
+        El tamaño de la figura crece con el árbol, pero la resolución se reduce
+        para que la imagen no pase de MAX_PIXELES píxeles.
+        """
+        if self.raiz is None:
+            print("El árbol está vacío.")
+            return
+
+        from matplotlib.collections import LineCollection
+
+        xs, ys, datos, aristas = self._disposicion(max_niveles)
+        niveles = -min(ys) + 1
+        ancho = min(max(8, 0.4 * len(xs)), 200)
+        alto = min(max(4, 0.8 * niveles), 100)
+        dpi = min(100, (MAX_PIXELES / (ancho * alto)) ** 0.5)
+        con_etiquetas = len(xs) <= max_etiquetas
+        tamano_nodo = 600 if con_etiquetas else 20
+
+        if archivo is None:
+            import matplotlib.pyplot as plt
+            figura = plt.figure(figsize=(ancho, alto), dpi=dpi)
+        else:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            figura = Figure(figsize=(ancho, alto), dpi=dpi)
+            FigureCanvasAgg(figura)
+
+        ax = figura.add_subplot()
+        ax.add_collection(LineCollection(aristas, colors="gray", linewidths=1, zorder=1))
+        ax.scatter(xs, ys, s=tamano_nodo, c="skyblue", edgecolors="steelblue", zorder=2)
+        if con_etiquetas:
+            for x, y, dato in zip(xs, ys, datos):
+                ax.text(x, y, str(dato), ha="center", va="center", fontsize=9, zorder=3)
+        ax.set_axis_off()
+        ax.margins(0.05)
+
+        if archivo is None:
+            plt.show()
+        else:
+            figura.savefig(archivo, dpi=dpi, bbox_inches="tight")
+
+class ArbolAVL(ArbolBinarioBusqueda):
+    """
+    Árbol de búsqueda binaria autobalanceado (AVL).
+    Ofrece la misma interfaz que 'ArbolBinarioBusqueda', pero después de cada
+    inserción o eliminación recorre el camino de vuelta a la raíz y aplica
+    rotaciones para que las alturas de los subárboles de cada nodo difieran a
+    lo más en 1. Así la altura queda acotada por 'altura_maxima(n)'
+    (~1.44·log2(n)) e 'insertar', 'eliminar' y 'buscar' son O(log n), incluso
+    con datos ya ordenados.
+    """
+
+    def insertar(self, dato):
+        """
+        Inserta 'dato' en el árbol y rebalancea los nodos del camino recorrido.
+        El descenso es iterativo: se guarda el camino en una pila para poder
+        actualizar las alturas desde la hoja hacia la raíz. Los tamaños se
+        incrementan al bajar, ya que las rotaciones no cambian el total.
+        """
+        if self.raiz is None:
+            self.raiz = Nodo(dato)
+            return
+        camino = []
+        nodo = self.raiz
+        while nodo is not None:
+            camino.append(nodo)
+            nodo.tamano += 1
+            nodo = nodo.izquierdo if dato < nodo.dato else nodo.derecho
+        padre = camino[-1]
+        if dato < padre.dato:
+            padre.izquierdo = Nodo(dato)
+        else:
+            padre.derecho = Nodo(dato)
+        self._rebalancear_camino(camino)
+
+    def _tras_eliminar(self, camino):
+        """
+        Después de eliminar, rebalancea el camino desde el padre del nodo
+        desenganchado hasta la raíz.
+        """
+        self._rebalancear_camino(camino)
+
+    def _rebalancear_camino(self, camino):
+        """
+        Método auxiliar que rebalancea, desde el último hasta el primero, los
+        nodos de 'camino' (una lista que parte en la raíz). Se detiene en cuanto
+        un nodo conserva su altura sin necesitar rotación, porque entonces sus
+        ancestros tampoco cambian.
+        """
+        for i in range(len(camino) - 1, -1, -1):
+            nodo = camino[i]
+            altura_anterior = nodo.altura
+            nuevo = self._rebalancear(nodo)
+            if nuevo is nodo and nodo.altura == altura_anterior:
+                break
+            if i == 0:
+                self.raiz = nuevo
+            elif camino[i - 1].izquierdo is nodo:
+                camino[i - 1].izquierdo = nuevo
+            else:
+                camino[i - 1].derecho = nuevo
+
+    def _factor_balance(self, nodo):
+        """
+        Retorna la diferencia entre la altura del subárbol izquierdo y la del derecho.
+        """
+        return self._altura(nodo.izquierdo) - self._altura(nodo.derecho)
+
+    def _rotar_derecha(self, nodo):
+        """
+        Rota 'nodo' hacia la derecha y retorna la nueva raíz del subárbol
+        (su antiguo hijo izquierdo).
+        """
+        pivote = nodo.izquierdo
+        nodo.izquierdo = pivote.derecho
+        pivote.derecho = nodo
+        self._actualizar(nodo)
+        self._actualizar(pivote)
+        return pivote
+
+    def _rotar_izquierda(self, nodo):
+        """
+        Rota 'nodo' hacia la izquierda y retorna la nueva raíz del subárbol
+        (su antiguo hijo derecho).
+        """
+        pivote = nodo.derecho
+        nodo.derecho = pivote.izquierdo
+        pivote.izquierdo = nodo
+        self._actualizar(nodo)
+        self._actualizar(pivote)
+        return pivote
+
+    def _rebalancear(self, nodo):
+        """
+        Actualiza la altura de 'nodo' y, si quedó desbalanceado, aplica la
+        rotación simple o doble que corresponda. Retorna la raíz del subárbol.
+        """
+        self._actualizar(nodo)
+        balance = self._factor_balance(nodo)
+        if balance > 1:
+            if self._factor_balance(nodo.izquierdo) < 0:
+                nodo.izquierdo = self._rotar_izquierda(nodo.izquierdo)
+            return self._rotar_derecha(nodo)
+        if balance < -1:
+            if self._factor_balance(nodo.derecho) > 0:
+                nodo.derecho = self._rotar_derecha(nodo.derecho)
+            return self._rotar_izquierda(nodo)
+        return nodo
+
+    @staticmethod
+    def altura_maxima(n):
+        """
+        Retorna la mayor altura que puede alcanzar un árbol AVL con 'n' nodos.
+        Un AVL de altura h tiene al menos N(h) = N(h-1) + N(h-2) + 1 nodos,
+        así que basta avanzar por esa recurrencia hasta superar 'n'.
+        """
+        h = 0
+        minimo_actual, minimo_anterior = 0, 0
+        while True:
+            siguiente = minimo_actual + minimo_anterior + 1 if h > 0 else 1
+            if siguiente > n:
+                return h
+            minimo_anterior, minimo_actual = minimo_actual, siguiente
+            h += 1
+
+
+class ArbolCompacto:
+    """
+    Árbol de búsqueda binaria con almacenamiento compacto (estructura de arreglos).
+    En lugar de un objeto por nodo, el nodo i se representa por la posición i de
+    tres arreglos de tipo 'array': 'datos' con las claves y 'izquierdos' y
+    'derechos' con los índices de los hijos (-1 cuando no hay hijo). Así cada
+    clave entera ocupa unos 16 bytes, en vez de los ~70 que ocupa un 'Nodo'.
+    Las claves deben caber en el tipo del arreglo ('q': enteros de 64 bits por
+    omisión, 'd' para números reales). No admite eliminación.
+    """
+
+    def __init__(self, tipo="q"):
+        """
+        Inicializa un árbol compacto vacío cuyas claves son del tipo 'tipo'.
+        La raíz es el índice de su nodo, o -1 si el árbol está vacío.
+        """
+        self.datos = array(tipo)
+        self.izquierdos = array("i")
+        self.derechos = array("i")
+        self.raiz = -1
+        self._altura = 0
+
+    @classmethod
+    def desde_ordenados(cls, datos, tipo="q"):
+        """
+        Construye un árbol compacto balanceado a partir de 'datos' ordenados de
+        menor a mayor (no se verifica), en O(n). El nodo i guarda el i-ésimo dato,
+        así que el arreglo de claves es simplemente una copia de 'datos'.
+        """
+        arbol = cls(tipo)
+        arbol.datos = array(tipo, datos)
+        n = len(arbol.datos)
+        arbol.izquierdos = array("i", [-1]) * n
+        arbol.derechos = array("i", [-1]) * n
+        arbol.raiz = arbol._enlazar_balanceado(0, n)
+        arbol._altura = n.bit_length()
+        return arbol
+
+    @classmethod
+    def desde_iterable(cls, datos, tipo="q"):
+        """
+        Construye un árbol compacto balanceado a partir de 'datos' en cualquier orden.
+        """
+        return cls.desde_ordenados(sorted(datos), tipo)
+
+    def _enlazar_balanceado(self, inicio, fin):
+        """
+        Método auxiliar que enlaza como subárbol balanceado los nodos inicio..fin-1
+        y retorna el índice de su raíz (-1 si el tramo está vacío).
+        """
+        if inicio >= fin:
+            return -1
+        medio = (inicio + fin) // 2
+        self.izquierdos[medio] = self._enlazar_balanceado(inicio, medio)
+        self.derechos[medio] = self._enlazar_balanceado(medio + 1, fin)
+        return medio
+
+    def insertar(self, dato):
+        """
+        Inserta 'dato' en el árbol: baja iterativamente comparando con las claves
+        y agrega el nuevo nodo al final de los tres arreglos.
+        """
+        nuevo = len(self.datos)
+        self.datos.append(dato)
+        self.izquierdos.append(-1)
+        self.derechos.append(-1)
+        if self.raiz == -1:
+            self.raiz = nuevo
+            self._altura = 1
+            return
+        datos, izquierdos, derechos = self.datos, self.izquierdos, self.derechos
+        indice = self.raiz
+        profundidad = 1
+        while True:
+            profundidad += 1
+            hijos = izquierdos if dato < datos[indice] else derechos
+            if hijos[indice] == -1:
+                hijos[indice] = nuevo
+                break
+            indice = hijos[indice]
+        if profundidad > self._altura:
+            self._altura = profundidad
+
+    def buscar(self, dato):
+        """
+        Busca un valor 'dato' en el árbol y retorna True si lo encuentra.
+        """
+        datos, izquierdos, derechos = self.datos, self.izquierdos, self.derechos
+        indice = self.raiz
+        while indice != -1:
+            actual = datos[indice]
+            if dato == actual:
+                return True
+            indice = izquierdos[indice] if dato < actual else derechos[indice]
+        return False
+
+    def __iter__(self):
+        """
+        Permite recorrer el árbol con 'for', entregando los datos en inorden.
+        """
+        return self.iter_inorden()
+
+    def iter_inorden(self):
+        """
+        Recorre el árbol en inorden con una pila explícita de índices, entregando
+        los datos de a uno.
+        """
+        datos, izquierdos, derechos = self.datos, self.izquierdos, self.derechos
+        pila = []
+        indice = self.raiz
+        while pila or indice != -1:
+            while indice != -1:
+                pila.append(indice)
+                indice = izquierdos[indice]
+            indice = pila.pop()
+            yield datos[indice]
+            indice = derechos[indice]
+
+    def recorrido_inorden(self):
+        """
+        Realiza un recorrido en inorden (Izquierda-Raíz-Derecha) del árbol.
+        """
+        return list(self.iter_inorden())
+
+    def numero_total_nodos(self):
+        """
+        Retorna el número total de nodos en el árbol, en O(1).
+        """
+        return len(self.datos)
+
+    def altura(self):
+        """
+        Retorna la altura del árbol, en O(1): como no hay eliminación, basta
+        recordar la mayor profundidad alcanzada al insertar.
+        """
+        return self._altura
+
+    def valor_minimo(self):
+        """
+        Retorna el valor mínimo almacenado en el árbol.
+        """
+        return self._extremo(self.izquierdos)
+
+    def valor_maximo(self):
+        """
+        Retorna el valor máximo almacenado en el árbol.
+        """
+        return self._extremo(self.derechos)
+
+    def _extremo(self, hijos):
+        """
+        Método auxiliar que baja desde la raíz siguiendo siempre 'hijos' y retorna
+        el dato del último nodo, o None si el árbol está vacío.
+        """
+        if self.raiz == -1:
+            return None
+        indice = self.raiz
+        while hijos[indice] != -1:
+            indice = hijos[indice]
+        return self.datos[indice]
+
+
+def _codificar_claves(claves, tipo):
+    """
+    Retorna un arreglo de tipo 'tipo' con 'claves', o lanza ValueError si
+    alguna no cabe exactamente en él. array ya rechaza los reales con 'q', los
+    enteros fuera de rango y lo que no es un número; con 'd' además convierte
+    sin avisar enteros grandes que un float no representa, así que se
+    comprueba que cada clave quede igual.
+    """
+    try:
+        codificadas = array(tipo, claves)
+    except (TypeError, OverflowError) as error:
+        raise ValueError(f"las claves no se pueden guardar como '{tipo}': {error}") from None
+    if tipo == "d":
+        for clave, codificada in zip(claves, codificadas):
+            if clave != codificada:
+                raise ValueError(f"la clave {clave!r} no se puede guardar exactamente como 'd'")
+    return codificadas
+
+
+def _leer_cabecera(contenido, ruta):
+    """
+    Valida la cabecera de una instantánea guardada con 'guardar' y retorna el
+    tipo de las claves y la cantidad de nodos. Lanza ValueError si 'contenido'
+    no corresponde a una instantánea completa.
+    """
+    if len(contenido) < CABECERA.size:
+        raise ValueError(f"{ruta} no es una instantánea de árbol válida")
+    magia, version, tipo, n = CABECERA.unpack_from(contenido, 0)
+    if magia != MAGIA or version != VERSION or tipo not in (b"q", b"d") \
+            or len(contenido) != CABECERA.size + 13 * n:
+        raise ValueError(f"{ruta} no es una instantánea de árbol válida")
+    return tipo.decode("ascii"), n
+
+
+# ArbolMapeado que abre cada proceso de buscar_muchos al iniciar.
+_instantanea = None
+
+
+def _abrir_instantanea(ruta):
+    """
+    Inicializador de los procesos de buscar_muchos: abre la instantánea una
+    sola vez por proceso.
+    """
+    global _instantanea
+    _instantanea = ArbolMapeado(ruta)
+
+
+def _buscar_en_instantanea(claves):
+    """
+    Tarea de los procesos de buscar_muchos: busca un bloque de claves.
+    """
+    return _instantanea.buscar_muchos(claves)
+
+
+def _buscar_en_procesos(ruta, claves, procesos):
+    """
+    Reparte 'claves' en bloques entre 'procesos' procesos que abren la
+    instantánea 'ruta', y junta las respuestas en el orden de 'claves'.
+    Se hacen unos cuatro bloques por proceso para que ninguno quede ocioso
+    si otro recibe un bloque más lento.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    largo = -(-len(claves) // (4 * procesos))
+    bloques = [claves[i:i + largo] for i in range(0, len(claves), largo)]
+    encontradas = []
+    with ProcessPoolExecutor(procesos, initializer=_abrir_instantanea, initargs=(ruta,)) as ejecutor:
+        for respuesta in ejecutor.map(_buscar_en_instantanea, bloques):
+            encontradas.extend(respuesta)
+    return encontradas
+
+
+class ArbolMapeado:
+    """
+    Vista de sólo lectura de una instantánea guardada con 'guardar'. Abre el
+    archivo con mmap y responde las consultas directamente sobre él, sin crear
+    ningún nodo, así que abrirlo es O(1) y varios procesos que abren el mismo
+    archivo comparten sus páginas en memoria. Los nodos son posiciones del
+    preorden: el hijo izquierdo del nodo i es i + 1 cuando su bandera lo indica,
+    y el derecho es derechos[i] (-1 si no tiene).
+    """
+
+    def __init__(self, ruta):
+        """
+        Abre la instantánea 'ruta'. Lanza ValueError si el archivo no es válido
+        o si la máquina no es little-endian.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("ArbolMapeado requiere una máquina little-endian")
+        with open(ruta, "rb") as archivo:
+            self.mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            tipo, n = _leer_cabecera(self.mapa, ruta)
+        except ValueError:
+            self.mapa.close()
+            raise
+        vista = memoryview(self.mapa)
+        inicio_claves = CABECERA.size
+        inicio_derechos = inicio_claves + 8 * n
+        inicio_banderas = inicio_derechos + 4 * n
+        self.claves = vista[inicio_claves:inicio_derechos].cast(tipo)
+        self.derechos = vista[inicio_derechos:inicio_banderas].cast("i")
+        self.banderas = vista[inicio_banderas:inicio_banderas + n]
+        self.raiz = 0 if n else -1
+
+    def __len__(self):
+        return len(self.claves)
+
+    def numero_total_nodos(self):
+        """
+        Retorna el número total de nodos en el árbol, en O(1).
+        """
+        return len(self.claves)
+
+    def buscar(self, dato):
+        """
+        Busca un valor 'dato' en el árbol y retorna True si lo encuentra, en O(h).
+        """
+        claves, derechos, banderas = self.claves, self.derechos, self.banderas
+        indice = self.raiz
+        while indice != -1:
+            actual = claves[indice]
+            if dato == actual:
+                return True
+            if dato < actual:
+                indice = indice + 1 if banderas[indice] & IZQUIERDO else -1
+            else:
+                indice = derechos[indice]
+        return False
+
+    def buscar_muchos(self, claves):
+        """
+        Busca todos los valores de 'claves' y retorna una lista de booleanos, en
+        el mismo orden, con el mismo descenso compartido que
+        ArbolBinarioBusqueda._buscar_ordenadas.
+        """
+        claves_arbol, derechos, banderas = self.claves, self.derechos, self.banderas
+        orden = sorted(range(len(claves)), key=claves.__getitem__)
+        ordenadas = [claves[i] for i in orden]
+        encontradas = [False] * len(claves)
+        pila = [(self.raiz, 0, len(ordenadas))]
+        while pila:
+            indice, inicio, fin = pila.pop()
+            while indice != -1 and inicio < fin:
+                dato = claves_arbol[indice]
+                medio = bisect_left(ordenadas, dato, inicio, fin)
+                despues = bisect_right(ordenadas, dato, medio, fin)
+                for k in range(medio, despues):
+                    encontradas[orden[k]] = True
+                if medio > inicio and banderas[indice] & IZQUIERDO:
+                    pila.append((indice + 1, inicio, medio))
+                indice, inicio = derechos[indice], despues
+        return encontradas
+
+    def __iter__(self):
+        """
+        Permite recorrer el árbol con 'for', entregando los datos en inorden.
+        """
+        return self.iter_inorden()
+
+    def iter_inorden(self):
+        """
+        Recorre el árbol en inorden con una pila explícita de posiciones,
+        entregando los datos de a uno.
+        """
+        return self.iter_rango(float("-inf"), float("inf"))
+
+    def iter_rango(self, desde, hasta):
+        """
+        Entrega en orden, de a uno, los valores del árbol entre 'desde' y 'hasta'
+        (ambos incluidos), en O(h + k) como en ArbolBinarioBusqueda.
+        """
+        claves, derechos, banderas = self.claves, self.derechos, self.banderas
+        pila = []
+        indice = self.raiz
+        while True:
+            while indice != -1:
+                if claves[indice] < desde:
+                    indice = derechos[indice]
+                else:
+                    pila.append(indice)
+                    indice = indice + 1 if banderas[indice] & IZQUIERDO else -1
+            if not pila:
+                return
+            indice = pila.pop()
+            dato = claves[indice]
+            if dato > hasta:
+                return
+            yield dato
+            indice = derechos[indice]
+
+    def valor_minimo(self):
+        """
+        Retorna el valor mínimo almacenado en el árbol, o None si está vacío.
+        """
+        if self.raiz == -1:
+            return None
+        indice = self.raiz
+        while self.banderas[indice] & IZQUIERDO:
+            indice += 1
+        return self.claves[indice]
+
+    def valor_maximo(self):
+        """
+        Retorna el valor máximo almacenado en el árbol, o None si está vacío.
+        """
+        if self.raiz == -1:
+            return None
+        indice = self.raiz
+        while self.derechos[indice] != -1:
+            indice = self.derechos[indice]
+        return self.claves[indice]
+
+    def cerrar(self):
+        """
+        Libera el mapeo del archivo.
+        """
+        self.claves.release()
+        self.derechos.release()
+        self.banderas.release()
+        self.mapa.close()
+
+if __name__ == "__main__":
+    # Crear un árbol de búsqueda binaria
+    abb = ArbolBinarioBusqueda()
+
+    # Insertar elementos en el árbol
+    abb.insertar(21)
+    abb.insertar(13)
+    abb.insertar(33)
+    abb.insertar(10)
+    abb.insertar(18)
+    abb.insertar(25)
+    abb.insertar(40)
+    # Mostrar el árbol gráficamente
+    abb.mostrar_graficamente()
+
+    # Cantidad de nodos
+    print("Número total de nodos:", abb.numero_total_nodos())
+
+    # Valor máximo
+    print("Valor máximo:", abb.valor_maximo())
+
+    # Altura
+    print("Altura del árbol:", abb.altura())
+
+    # Estadísticos de orden
+    print("Tercer valor más pequeño:", abb.k_esimo(3))  # 18
+    print("Datos menores que 25:", abb.rango(25))  # 4
+
+    # Consultas por rango, piso y techo
+    print("Valor mínimo:", abb.valor_minimo())  # 10
+    print("Valores entre 15 y 30:", list(abb.iter_rango(15, 30)))  # [18, 21, 25]
+    print("Piso de 20:", abb.piso(20), "- Techo de 20:", abb.techo(20))  # 18 - 21
+
+    # Recorrido en preorden
+    print("\nRecorrido en preorden:")
+    print(abb.recorrido_preorden())
+
+    # Recorrido en inorden
+    print("\nRecorrido en inorden:")
+    print(abb.recorrido_inorden())
+
+    # Recorrido en postorden
+    print("\nRecorrido en postorden:")
+    print(abb.recorrido_postorden())
+
+    # Recorrido por niveles
+    print("\nRecorrido por niveles:")
+    print(abb.recorrido_por_niveles())
+    print("Agrupado por nivel:", list(abb.iter_por_niveles(por_nivel=True)))
+
+    # Búsqueda de elementos
+    print("\nBúsqueda de elementos:")
+    print("Buscar 40:", abb.buscar(40))  # True
+    print("Buscar 9:", abb.buscar(9))  # False
+
+    # Eliminación de elementos
+    abb.eliminar(13)  # nodo con dos hijos: lo reemplaza su sucesor, 18
+    print("\nInorden tras eliminar 13:", abb.recorrido_inorden())
+
+    # Otro ejemplo
+    abb1 = ArbolBinarioBusqueda()
+    abb1.insertar(68)
+    abb1.insertar(35)
+    abb1.insertar(90)
+    abb1.insertar(30)
+    abb1.insertar(60)
+    abb1.insertar(70)
+    abb1.insertar(98)
+    abb1.insertar(10)
+    abb1.insertar(54)
+    abb1.insertar(65)
+    abb1.insertar(92)
+    abb1.insertar(99)
+    # Mostrar el árbol gráficamente
+    abb1.mostrar_graficamente()
+    # Recorrido en preorden
+    print("\nRecorrido en preorden:")
+    print(abb1.recorrido_preorden())
+
+    # Recorrido en inorden
+    print("\nRecorrido en inorden:")
+    print(abb1.recorrido_inorden())
+
+    # Recorrido en postorden
+    print("\nRecorrido en postorden:")
+    print(abb1.recorrido_postorden())
+
+    # Recorrido por niveles
+    print("\nRecorrido por niveles:")
+    print(abb1.recorrido_por_niveles())
+
+    # Otro árbol
+    abb2 = ArbolBinarioBusqueda()
+    abb2.insertar(1)
+    abb2.insertar(2)
+    abb2.insertar(3)
+    abb2.insertar(4)
+    abb2.insertar(5)
+    abb2.insertar(6)
+    abb2.insertar(7)
+    abb2.insertar(8)
+    abb2.insertar(9)
+    abb2.insertar(10)
+    abb2.insertar(11)
+    abb2.insertar(12)
+    abb2.insertar(13)
+    abb2.insertar(14)
+    abb2.insertar(15)
+    abb2.insertar(16)
+    abb2.insertar(17)
+    abb2.insertar(18)
+    abb2.insertar(19)
+    # Mostrar el árbol gráficamente
+    abb2.mostrar_graficamente()
+
+    # El mismo ejemplo con un árbol AVL: los datos ordenados ya no producen una lista
+    avl2 = ArbolAVL()
+    for i in range(1, 20):
+        avl2.insertar(i)
+    print("\nAltura con ABB:", abb2.altura())
+    print("Altura con AVL:", avl2.altura(), "(cota:", ArbolAVL.altura_maxima(avl2.numero_total_nodos()), ")")
+    avl2.mostrar_graficamente()
+
+    # Construcción en bloque: a partir de datos ordenados se arma un árbol balanceado en O(n)
+    abb3 = ArbolBinarioBusqueda.desde_ordenados(range(1, 20))
+    print("Altura construyendo en bloque:", abb3.altura())
+
+    # Instantáneas: guardar y cargar conservan la forma exacta del árbol
+    import os
+    import tempfile
+    ruta = os.path.join(tempfile.mkdtemp(), "abb1.abbp")
+    abb1.guardar(ruta)
+    print("\nPreorden tras cargar:", ArbolBinarioBusqueda.cargar(ruta).recorrido_preorden())
+    mapeado = ArbolMapeado(ruta)
+    print("Buscar 54 sin cargar el árbol:", mapeado.buscar(54))  # True
+    mapeado.cerrar()
@@ -0,0 +1,12 @@
+"""
+Árboles de búsqueda binaria: ArbolBinarioBusqueda, ArbolAVL, ArbolCompacto y
+ArbolMapeado (vista de sólo lectura de una instantánea guardada en disco).
+
+Importar el paquete no carga matplotlib; se carga recién la primera vez que
+se llama a mostrar_graficamente. La demostración se ejecuta con:
+
+    python -m Arboles.ABBConGrafico
+"""
+from .ABBConGrafico import ArbolAVL, ArbolBinarioBusqueda, ArbolCompacto, ArbolMapeado, Nodo
+
+__all__ = ["ArbolAVL", "ArbolBinarioBusqueda", "ArbolCompacto", "ArbolMapeado", "Nodo"]
@@ -0,0 +1,288 @@
+"""
+Cachés en memoria construidos sobre la lista circular doblemente enlazada de
+ListasCiDob.
+
+Cada caché guarda un diccionario clave -> nodo del anillo, así que encontrar,
+reordenar y desalojar una entrada cuesta O(1): el nodo se mueve o se desenlaza
+directamente con mover_al_frente / eliminar_nodo, sin recorrer la lista.
+
+- CacheLRU desaloja la entrada usada hace más tiempo.
+- CacheLFU desaloja la entrada usada menos veces; entre las empatadas, la
+  usada hace más tiempo.
+
+Ambas admiten un límite de entradas, un límite opcional de bytes, expiración
+opcional por tiempo (TTL) y llevan contadores de aciertos, fallos, desalojos
+y expiraciones.
+"""
+import sys
+import time
+
+from .ListasCiDob import ListaCircularSimple as Anillo
+
+
+class _Entrada:
+    """
+    Dato guardado en cada nodo del anillo.
+    """
+    __slots__ = ("clave", "valor", "peso", "expira", "frecuencia")
+
+    def __init__(self, clave, valor, peso, expira):
+        self.clave = clave
+        self.valor = valor
+        self.peso = peso
+        self.expira = expira
+        self.frecuencia = 1
+
+
+class _Grupo:
+    """
+    Grupo de CacheLFU: las entradas que llevan 'frecuencia' usos, en un anillo.
+    """
+    __slots__ = ("frecuencia", "entradas")
+
+    def __init__(self, frecuencia):
+        self.frecuencia = frecuencia
+        self.entradas = Anillo()
+
+
+class _CacheBase:
+    """
+    Lógica común de los cachés: límites, expiración y contadores.
+    Las subclases deciden en qué anillo vive cada entrada y cuál se desaloja.
+    """
+
+    def __init__(self, capacidad, max_bytes=None, tamano_de=sys.getsizeof, ttl=None, reloj=time.monotonic):
+        """
+        - capacidad: cantidad máxima de entradas.
+        - max_bytes: suma máxima de los tamaños de los valores (opcional).
+        - tamano_de: función que estima el tamaño en bytes de un valor;
+          sólo se usa si hay 'max_bytes'.
+        - ttl: segundos que dura cada entrada por omisión (opcional).
+        - reloj: función que entrega la hora actual en segundos.
+        """
+        if capacidad < 1:
+            raise ValueError("la capacidad debe ser al menos 1")
+        self.capacidad = capacidad
+        self.max_bytes = max_bytes
+        self.tamano_de = tamano_de
+        self.ttl = ttl
+        self.reloj = reloj
+        self.mapa = {}
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.expirados = 0
+
+    def __len__(self):
+        return len(self.mapa)
+
+    def __contains__(self, clave):
+        """
+        Retorna True si 'clave' está y no ha expirado. No cuenta como uso.
+        """
+        nodo = self.mapa.get(clave)
+        return nodo is not None and not self._expirada(nodo.dato)
+
+    def obtener(self, clave, defecto=None):
+        """
+        Retorna el valor guardado para 'clave', o 'defecto' si no está o expiró.
+        Un acierto cuenta como uso de la entrada.
+        """
+        nodo = self.mapa.get(clave)
+        if nodo is None:
+            self.fallos += 1
+            return defecto
+        entrada = nodo.dato
+        if self._expirada(entrada):
+            self._quitar(nodo)
+            self.expirados += 1
+            self.fallos += 1
+            return defecto
+        self.aciertos += 1
+        self._usar(nodo)
+        return entrada.valor
+
+    def guardar(self, clave, valor, ttl=None):
+        """
+        Guarda 'valor' para 'clave' y desaloja entradas hasta respetar los límites.
+        'ttl' reemplaza, sólo para esta entrada, la duración por omisión.
+        Lanza ValueError si el valor por sí solo supera 'max_bytes'; en ese caso
+        el caché no cambia, y si 'clave' ya estaba conserva su valor anterior.
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expira = self.reloj() + ttl if ttl is not None else None
+        peso = self.tamano_de(valor) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and peso > self.max_bytes:
+            raise ValueError(f"el valor pesa {peso} bytes y el caché admite a lo más {self.max_bytes}")
+        nodo = self.mapa.get(clave)
+        if nodo is not None:
+            entrada = nodo.dato
+            self.bytes += peso - entrada.peso
+            entrada.valor = valor
+            entrada.peso = peso
+            entrada.expira = expira
+            self._usar(nodo)
+            self._desalojar(0)
+        else:
+            # se desaloja antes de agregar, para que la entrada nueva no
+            # sea elegida como víctima (en LFU es la de menor frecuencia)
+            self._desalojar(peso, espacio=1)
+            self.mapa[clave] = self._agregar(_Entrada(clave, valor, peso, expira))
+            self.bytes += peso
+
+    def eliminar(self, clave):
+        """
+        Saca 'clave' del caché. Retorna True si estaba.
+        """
+        nodo = self.mapa.get(clave)
+        if nodo is None:
+            return False
+        self._quitar(nodo)
+        return True
+
+    def purgar_expirados(self):
+        """
+        Saca todas las entradas expiradas, en O(n). Retorna cuántas eran.
+        """
+        vencidas = [nodo for nodo in self.mapa.values() if self._expirada(nodo.dato)]
+        for nodo in vencidas:
+            self._quitar(nodo)
+        self.expirados += len(vencidas)
+        return len(vencidas)
+
+    def estadisticas(self):
+        """
+        Retorna un diccionario con los contadores del caché.
+        """
+        consultas = self.aciertos + self.fallos
+        return {
+            "entradas": len(self.mapa),
+            "bytes": self.bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "expirados": self.expirados,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+        }
+
+    def _expirada(self, entrada):
+        """
+        Retorna True si 'entrada' tiene fecha de expiración y ya pasó.
+        """
+        return entrada.expira is not None and entrada.expira <= self.reloj()
+
+    def _desalojar(self, peso, espacio=0):
+        """
+        Desaloja víctimas hasta que quepan 'espacio' entradas más y 'peso' bytes más.
+        """
+        while self.mapa and (
+            len(self.mapa) + espacio > self.capacidad
+            or (self.max_bytes is not None and self.bytes + peso > self.max_bytes)
+        ):
+            self._quitar(self._victima())
+            self.desalojos += 1
+
+    def _quitar(self, nodo):
+        """
+        Saca del caché la entrada de 'nodo'.
+        """
+        entrada = nodo.dato
+        del self.mapa[entrada.clave]
+        self.bytes -= entrada.peso
+        self._desenlazar(nodo)
+
+
+class CacheLRU(_CacheBase):
+    """
+    Caché que desaloja la entrada usada hace más tiempo (Least Recently Used).
+    Las entradas viven en un solo anillo ordenado de la más a la menos reciente.
+    """
+
+    def __init__(self, capacidad, **opciones):
+        super().__init__(capacidad, **opciones)
+        self.anillo = Anillo()
+
+    def _agregar(self, entrada):
+        return self.anillo.agregar_inicio(entrada)
+
+    def _usar(self, nodo):
+        self.anillo.mover_al_frente(nodo)
+
+    def _victima(self):
+        return self.anillo.ultimo
+
+    def _desenlazar(self, nodo):
+        self.anillo.eliminar_nodo(nodo)
+
+
+class CacheLFU(_CacheBase):
+    """
+    Caché que desaloja la entrada usada menos veces (Least Frequently Used).
+    Las entradas con la misma frecuencia de uso viven en un anillo ordenado por
+    recencia, y esos grupos forman a su vez un anillo ordenado de menor a mayor
+    frecuencia. Al usar una entrada pasa al grupo siguiente, que se crea justo
+    después del suyo si no existe, y los grupos vacíos se sacan; así la menor
+    frecuencia siempre es la del primer grupo, y obtener, guardar y desalojar
+    son O(1) aunque se eliminen entradas.
+    """
+
+    def __init__(self, capacidad, **opciones):
+        super().__init__(capacidad, **opciones)
+        self.grupos = Anillo()
+        self.anillos = {}
+
+    def _grupo(self, frecuencia, anterior):
+        """
+        Retorna el nodo del grupo de 'frecuencia', creándolo si no existe justo
+        después del nodo de grupo 'anterior' (al inicio si es None).
+        """
+        nodo = self.anillos.get(frecuencia)
+        if nodo is None:
+            grupo = _Grupo(frecuencia)
+            if anterior is None:
+                nodo = self.grupos.agregar_inicio(grupo)
+            else:
+                nodo = self.grupos.insertar_despues(anterior, grupo)
+            self.anillos[frecuencia] = nodo
+        return nodo
+
+    def _agregar(self, entrada):
+        return self._grupo(1, None).dato.entradas.agregar_inicio(entrada)
+
+    def _usar(self, nodo):
+        entrada = nodo.dato
+        frecuencia = entrada.frecuencia
+        anillos = self.anillos
+        nodo_grupo = anillos[frecuencia]
+        grupo = nodo_grupo.dato
+        siguiente = anillos.get(frecuencia + 1)
+        entrada.frecuencia = frecuencia + 1
+        if len(grupo.entradas) == 1 and siguiente is None:
+            # la entrada está sola y no hay grupo siguiente: el grupo pasa
+            # a ser el de la frecuencia nueva sin moverse de su lugar
+            del anillos[frecuencia]
+            grupo.frecuencia = frecuencia + 1
+            anillos[frecuencia + 1] = nodo_grupo
+            return
+        if siguiente is None:
+            siguiente = self.grupos.insertar_despues(nodo_grupo, _Grupo(frecuencia + 1))
+            anillos[frecuencia + 1] = siguiente
+        grupo.entradas.eliminar_nodo(nodo)
+        if len(grupo.entradas) == 0:
+            del anillos[frecuencia]
+            self.grupos.eliminar_nodo(nodo_grupo)
+        self.mapa[entrada.clave] = siguiente.dato.entradas.agregar_inicio(entrada)
+
+    def _victima(self):
+        return self.grupos.primero.dato.entradas.ultimo
+
+    def _desenlazar(self, nodo):
+        # saca el nodo de su grupo, y el grupo si queda vacío
+        frecuencia = nodo.dato.frecuencia
+        nodo_grupo = self.anillos[frecuencia]
+        entradas = nodo_grupo.dato.entradas
+        entradas.eliminar_nodo(nodo)
+        if len(entradas) == 0:
+            del self.anillos[frecuencia]
+            self.grupos.eliminar_nodo(nodo_grupo)
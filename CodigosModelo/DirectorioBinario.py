@@ -0,0 +1,200 @@
+# Carga masiva y persistencia binaria para los directorios de personas.
+#
+# Formato del archivo (little-endian):
+#   cabecera:   b"DIRP", versión (uint32), n (uint64)          16 bytes
+#   ruts:       n enteros int64, ordenados de menor a mayor     8n bytes
+#   posiciones: n + 1 enteros uint64 con el inicio de cada
+#               nombre dentro del montón (el último es su largo)
+#   montón:     los nombres en UTF-8, uno tras otro
+#
+# Como la columna de RUTs tiene ancho fijo y está ordenada, un
+# DirectorioMapeado puede abrir el archivo con mmap y responder
+# buscarPersona con búsqueda binaria, sin construir ningún nodo.
+
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import islice
+
+MAGIA = b"DIRP"
+VERSION = 1
+CABECERA = struct.Struct("<4sIQ")
+
+# desde cuántos RUTs buscarPersonas reparte la búsqueda
+# entre varios procesos
+UMBRAL_PARALELO = 1_000_000
+NO_ENCONTRADO = "RUT NO ENCONTRADO"
+
+
+# leerCSV: str int bool -> iterador de listas de (str, int)
+# lee un CSV con columnas nombre,rut de a bloques de
+# 'tamano_bloque' filas, sin cargar el archivo completo.
+# Con encabezado=True se salta la primera fila. Las filas
+# en blanco se ignoran.
+
+def leerCSV(ruta, tamano_bloque=100_000, encabezado=False):
+    with open(ruta, newline="", encoding="utf-8", buffering=1 << 20) as archivo:
+        filas = csv.reader(archivo)
+        if encabezado:
+            next(filas, None)
+        while True:
+            leidas = list(islice(filas, tamano_bloque))
+            if not leidas:
+                return
+            bloque = [(fila[0], int(fila[1])) for fila in leidas if fila]
+            if bloque:
+                yield bloque
+
+
+# guardarBinario: str iterable de (str, int) -> None
+# escribe las personas en 'ruta' con el formato descrito
+# arriba, ordenándolas por RUT.
+
+def guardarBinario(ruta, personas):
+    ordenadas = sorted(personas, key=lambda persona: persona[1])
+    ruts = array("q", (rut for _, rut in ordenadas))
+    posiciones = array("Q", [0])
+    monton = bytearray()
+    for nombre, _ in ordenadas:
+        monton += nombre.encode("utf-8")
+        posiciones.append(len(monton))
+    if sys.byteorder == "big":
+        ruts.byteswap()
+        posiciones.byteswap()
+    with open(ruta, "wb") as archivo:
+        archivo.write(CABECERA.pack(MAGIA, VERSION, len(ruts)))
+        archivo.write(ruts.tobytes())
+        archivo.write(posiciones.tobytes())
+        archivo.write(monton)
+
+
+# Directorio de sólo lectura respaldado por un archivo escrito
+# con guardarBinario. Responde buscarPersona directamente sobre
+# el archivo mapeado en memoria, así que abrirlo es O(1).
+class DirectorioMapeado:
+
+    def __init__(self, ruta):
+        if sys.byteorder != "little":
+            raise ValueError("DirectorioMapeado requiere una máquina little-endian")
+        invalido = ValueError(f"{ruta} no es un directorio binario válido")
+        with open(ruta, "rb") as archivo:
+            if os.fstat(archivo.fileno()).st_size < CABECERA.size:
+                # mmap no acepta archivos vacíos
+                raise invalido
+            self.mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, version, n = CABECERA.unpack_from(self.mapa, 0)
+        inicio_ruts = CABECERA.size
+        inicio_posiciones = inicio_ruts + 8 * n
+        self.inicio_monton = inicio_posiciones + 8 * (n + 1)
+        # el archivo debe alcanzar hasta el final del montón, cuyo
+        # largo es la última posición
+        valido = magia == MAGIA and version == VERSION and len(self.mapa) >= self.inicio_monton
+        if valido:
+            (largo_monton,) = struct.unpack_from("<Q", self.mapa, self.inicio_monton - 8)
+            valido = len(self.mapa) >= self.inicio_monton + largo_monton
+        if not valido:
+            self.mapa.close()
+            raise invalido
+        vista = memoryview(self.mapa)
+        self.ruts = vista[inicio_ruts:inicio_posiciones].cast("q")
+        self.posiciones = vista[inicio_posiciones:self.inicio_monton].cast("Q")
+
+    def __len__(self):
+        return len(self.ruts)
+
+    # nombreEn: int -> str
+    # decodifica el nombre de la i-ésima persona (en orden de RUT).
+
+    def nombreEn(self, i):
+        inicio = self.inicio_monton + self.posiciones[i]
+        fin = self.inicio_monton + self.posiciones[i + 1]
+        return self.mapa[inicio:fin].decode("utf-8")
+
+    # buscarPersona: int -> str
+    # igual que en Directorio, pero con búsqueda binaria
+    # sobre la columna de RUTs: O(log n).
+
+    def buscarPersona(self, rut):
+        i = bisect_left(self.ruts, rut)
+        if i < len(self.ruts) and self.ruts[i] == rut:
+            return self.nombreEn(i)
+        return NO_ENCONTRADO
+
+    # buscarPersonas: lista de int -> lista de str
+    # busca muchos RUTs de una vez y entrega sus nombres en
+    # el mismo orden. Los recorre ordenados, así cada búsqueda
+    # binaria parte donde terminó la anterior y las páginas
+    # del archivo se leen en orden.
+
+    def buscarPersonas(self, ruts):
+        columna = self.ruts
+        n = len(columna)
+        nombres = [NO_ENCONTRADO] * len(ruts)
+        i = 0
+        for k in sorted(range(len(ruts)), key=ruts.__getitem__):
+            rut = ruts[k]
+            i = bisect_left(columna, rut, i)
+            if i < n and columna[i] == rut:
+                nombres[k] = self.nombreEn(i)
+        return nombres
+
+    # personas: -> iterador de (str, int)
+    # entrega todas las personas en orden de RUT.
+
+    def personas(self):
+        for i in range(len(self.ruts)):
+            yield self.nombreEn(i), self.ruts[i]
+
+    # cerrar: -> None
+    # libera el mapeo del archivo.
+
+    def cerrar(self):
+        self.ruts.release()
+        self.posiciones.release()
+        self.mapa.close()
+
+
+# DirectorioMapeado que abre cada proceso de
+# buscarEnProcesos al iniciar.
+_mapeado = None
+
+
+# inicializador de cada proceso: abre el archivo una sola vez.
+def _abrirMapeado(ruta):
+    global _mapeado
+    _mapeado = DirectorioMapeado(ruta)
+
+
+# tarea de cada proceso: busca un bloque de RUTs.
+def _buscarBloque(ruts):
+    return _mapeado.buscarPersonas(ruts)
+
+
+# buscarEnProcesos: iterable de (str, int) lista de int int -> lista de str
+# busca 'ruts' entre las personas repartiéndolos en bloques
+# entre 'procesos' procesos. Las personas se escriben una sola
+# vez con guardarBinario en un archivo temporal, que cada proceso
+# abre como DirectorioMapeado al iniciar: a las tareas sólo se
+# les envían los RUTs, nunca el directorio.
+
+def buscarEnProcesos(personas, ruts, procesos):
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    descriptor, ruta = tempfile.mkstemp(suffix=".bin")
+    os.close(descriptor)
+    try:
+        guardarBinario(ruta, personas)
+        largo = -(-len(ruts) // (4 * procesos))
+        bloques = [ruts[i:i + largo] for i in range(0, len(ruts), largo)]
+        nombres = []
+        with ProcessPoolExecutor(procesos, initializer=_abrirMapeado, initargs=(ruta,)) as ejecutor:
+            for respuesta in ejecutor.map(_buscarBloque, bloques):
+                nombres.extend(respuesta)
+        return nombres
+    finally:
+        os.remove(ruta)
@@ -0,0 +1,86 @@
+# Directorio de personas seguro para usar desde varios hilos.
+# Extiende el directorio con lista circular doblemente enlazada
+# pensando en el caso de muchas lecturas y pocas escrituras:
+#
+# - buscarPersona no toma ningún candado. Sólo lee el índice
+#   RUT -> nodo con una operación de diccionario, que es atómica,
+#   y el nodo se registra en el índice recién cuando ya está
+#   completamente enlazado en el anillo (publicación atómica).
+# - Las escrituras (agregarPersona, agregarPersonas, renombrar)
+#   se serializan con un único candado reentrante. agregarPersonas
+#   lo toma una sola vez por lote.
+# - Las búsquedas por nombre recorren una lista que las escrituras
+#   reordenan, así que también toman el candado y entregan una
+#   copia de los resultados.
+#
+# Las garantías de atomicidad de las operaciones de diccionario y
+# de asignación de atributos son las del intérprete CPython con GIL.
+
+import threading
+
+from .DirectorioListaCircularDoble import Directorio
+
+
+class DirectorioConcurrente(Directorio):
+
+    def __init__(self):
+        super().__init__()
+        self.candado = threading.RLock()
+
+    # agregarPersona: str int -> None
+    # igual que en Directorio, pero excluyendo a otros escritores.
+
+    def agregarPersona(self, nombre, rut):
+        with self.candado:
+            super().agregarPersona(nombre, rut)
+
+    # agregarPersonas: iterable de (str, int) -> None
+    # agrega el lote completo tomando el candado una sola vez.
+    # El iterable se consume antes de tomarlo, para no bloquear
+    # a otros escritores mientras se produce el lote.
+
+    def agregarPersonas(self, personas):
+        personas = list(personas)
+        with self.candado:
+            super().agregarPersonas(personas)
+
+    # renombrar: Nodo str -> None
+    # cambia el nombre de una persona excluyendo a otros escritores.
+    # agregarPersona y agregarPersonas llaman a este método con el
+    # candado ya tomado; por eso el candado es reentrante (RLock).
+
+    def renombrar(self, nodo, nombre):
+        with self.candado:
+            super().renombrar(nodo, nombre)
+
+    # buscarPorNombre: str bool -> iterador de (str, int)
+    # igual que en Directorio, pero sobre una copia tomada con
+    # el candado, para no ver el índice a medio reordenar.
+
+    def buscarPorNombre(self, nombre, exacto=False):
+        with self.candado:
+            return iter(list(super().buscarPorNombre(nombre, exacto)))
+
+    # buscarPorPrefijo: str -> iterador de (str, int)
+    # igual que en Directorio, pero sobre una copia tomada con
+    # el candado.
+
+    def buscarPorPrefijo(self, prefijo):
+        with self.candado:
+            return iter(list(super().buscarPorPrefijo(prefijo)))
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    d = DirectorioConcurrente()
+    d.agregarPersonas((f"Persona {rut}", rut) for rut in range(1000))
+
+    # un hilo agrega personas mientras otros buscan
+    with ThreadPoolExecutor(max_workers=4) as hilos:
+        escritura = hilos.submit(d.agregarPersonas, ((f"Persona {rut}", rut) for rut in range(1000, 2000)))
+        nombres = list(hilos.map(d.buscarPersona, range(0, 2000, 250)))
+        escritura.result()
+
+    print(nombres)
+    print(d.buscarPersona(1999))  # imprime en pantalla "Persona 1999"
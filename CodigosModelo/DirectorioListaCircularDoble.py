@@ -0,0 +1,136 @@
+from .NucleoDirectorio import NucleoDirectorio
+
+class Nodo:
+    # Constructor: 
+    # str int -> Nodo
+    def __init__(self, nombre, rut):
+        self.nombre = nombre
+        self.rut = rut
+        self.sgte = None
+        self.ant = None
+    
+
+# Consiste en un repositorio de personas
+# Se codifica como una lista circular doblemente enlazada.
+# Además mantiene un diccionario RUT -> nodo, de modo que
+# buscar a una persona por su RUT no requiere recorrer la lista.
+# Para las búsquedas por nombre mantiene un IndiceNombres ordenado.
+class Directorio(NucleoDirectorio):
+
+    # agregarPersona: str int -> None
+    # agrega una persona representada por su nombre
+    # y su RUT. Si el RUT ya estaba registrado, se
+    # actualiza el nombre en lugar de agregar otro nodo.
+    # ej: agregaPersona("Juan José",12345678)
+
+    def agregarPersona(self, nombre, rut):
+        nodo = self.indice.get(rut)
+        if nodo is not None:
+            self.renombrar(nodo, nombre)
+            return
+
+        nuevo_nodo = Nodo(nombre, rut)
+        
+        if self.primero is None:
+            # La lista está vacía, así que inicializamos el primer nodo
+            nuevo_nodo.sgte = nuevo_nodo
+            nuevo_nodo.ant = nuevo_nodo
+            self.primero = nuevo_nodo
+        else:
+            # Insertar el nuevo nodo al final de la lista circular.
+            # Primero se enlaza el nodo nuevo y sólo después se hace
+            # visible desde el anillo, así quien recorra la lista hacia
+            # adelante nunca encuentra un nodo a medio enlazar.
+            ultimo = self.primero.ant
+            nuevo_nodo.ant = ultimo
+            nuevo_nodo.sgte = self.primero
+            ultimo.sgte = nuevo_nodo
+            self.primero.ant = nuevo_nodo
+
+        # se registra en los índices una vez que ya está en la lista
+        self.indice[rut] = nuevo_nodo
+        self.nombres.agregar(nombre, rut)
+
+    # agregarPersonas: iterable de (str, int) -> None
+    # agrega muchas personas de una vez: arma aparte una cadena
+    # con los nodos nuevos y la empalma al final del anillo en
+    # un solo paso. Recién entonces los registra en los índices
+    # (el de nombres se reordena una sola vez).
+    # ej: agregarPersonas([("Juan", 123), ("Ana", 456)])
+
+    def agregarPersonas(self, personas):
+        indice = self.indice
+        nuevos = {}
+        for nombre, rut in personas:
+            nodo = nuevos.get(rut)
+            if nodo is not None:
+                # repetido dentro del mismo lote: aún no está en los índices
+                nodo.nombre = nombre
+                continue
+            nodo = indice.get(rut)
+            if nodo is not None:
+                self.renombrar(nodo, nombre)
+                continue
+            nuevos[rut] = Nodo(nombre, rut)
+        if not nuevos:
+            return
+
+        # encadenar los nodos nuevos entre sí
+        cadena = list(nuevos.values())
+        for anterior, siguiente in zip(cadena, cadena[1:]):
+            anterior.sgte = siguiente
+            siguiente.ant = anterior
+        primero_nuevo, ultimo_nuevo = cadena[0], cadena[-1]
+
+        if self.primero is None:
+            ultimo_nuevo.sgte = primero_nuevo
+            primero_nuevo.ant = ultimo_nuevo
+            self.primero = primero_nuevo
+        else:
+            # la cadena queda enlazada antes de hacerla visible desde el anillo
+            ultimo = self.primero.ant
+            primero_nuevo.ant = ultimo
+            ultimo_nuevo.sgte = self.primero
+            ultimo.sgte = primero_nuevo
+            self.primero.ant = ultimo_nuevo
+
+        indice.update(nuevos)
+        self.nombres.agregarMuchos((nodo.nombre, nodo.rut) for nodo in cadena)
+
+    # personas: -> iterador de (str, int)
+    # entrega los (nombre, rut) de todas las personas,
+    # en el orden de la lista.
+
+    def personas(self):
+        if self.primero is None:
+            return
+        aux = self.primero
+        while True:
+            yield aux.nombre, aux.rut
+            aux = aux.sgte
+            if aux == self.primero:
+                break
+
+if __name__ == "__main__":
+    d = Directorio()
+    d.agregarPersona("Juan",123)
+    d.agregarPersona("Felipe",1234)
+    d.agregarPersona("Pedro",154623)
+    d.agregarPersona("Richard",444555)
+    d.agregarPersona("Mónica",66777)
+
+    print(list(d.buscarPorNombre("monica")))
+    print(list(d.buscarPorPrefijo("p")))
+    print(d.buscarPersona(66777)) # imprime en pantalla "Mónica"
+
+#Diferencias entre este y el anterior:
+#Se agregaron dos atributos: sgte (siguiente) y ant (anterior) a la clase Nodo.
+#Se agregó un atributo ultimo para mantener una referencia al último nodo de la lista a la clase directorio.
+#Método agregarPersona:
+#Se actualizan los enlaces para mantener la circularidad y doble enlace (tanto hacia adelante como hacia atrás).
+#Si la lista está vacía, el primer nodo es tanto el primero como el ultimo, y se enlaza a sí mismo.
+#Si la lista no está vacía, se inserta el nuevo nodo al final y se actualizan los enlaces correspondientes.
+#Método buscarPersona:
+#Recorrer la lista exigiría partir desde el primer nodo y continuar hasta volver a él, manteniendo la circularidad.
+#Para evitarlo, ambos directorios mantienen un índice (diccionario RUT -> nodo) que agregarPersona actualiza,
+#así buscarPersona responde en O(1). Si se agrega un RUT que ya existe, se actualiza el nombre de su nodo en vez de duplicarlo.
\ No newline at end of file
@@ -0,0 +1,96 @@
+# Registro de personas identificadas por su nombre y su RUT.
+# Se implementa mediante una lista enlazada donde cada nodo de esta
+# contiene el nombre y el rut de cada persona.
+
+from .NucleoDirectorio import NucleoDirectorio
+
+class Nodo:
+
+    # Constructor: 
+    # str int -> Nodo
+    def __init__(self, nombre, rut, sgte=None):
+
+        self.nombre = nombre
+        self.rut = rut
+        self.sgte = sgte
+    
+
+# Consiste en un repositorio de personas
+# Se codifica como una lista lista enlazada.
+# Además mantiene un diccionario RUT -> nodo, de modo que
+# buscar a una persona por su RUT no requiere recorrer la lista.
+# Para las búsquedas por nombre mantiene un IndiceNombres ordenado.
+class Directorio(NucleoDirectorio):
+
+    # agregarPersona: str int -> None
+    # agrega una persona representada por su nombre
+    # y su RUT. Si el RUT ya estaba registrado, se
+    # actualiza el nombre en lugar de agregar otro nodo.
+    # ej: agregaPersona("Juan José",12345678)
+
+    def agregarPersona(self, nombre, rut):
+        nodo = self.indice.get(rut)
+        if nodo is not None:
+            self.renombrar(nodo, nombre)
+            return
+
+        self.primero = Nodo(nombre, rut, self.primero)
+        self.indice[rut] = self.primero
+        self.nombres.agregar(nombre, rut)
+
+    # agregarPersonas: iterable de (str, int) -> None
+    # agrega muchas personas de una vez: arma la cadena de
+    # nodos nuevos delante de la lista y la publica asignando
+    # 'primero' una sola vez. Recién entonces los registra en
+    # los índices (el de nombres se reordena una sola vez).
+    # ej: agregarPersonas([("Juan", 123), ("Ana", 456)])
+
+    def agregarPersonas(self, personas):
+        indice = self.indice
+        nuevos = {}
+        primero = self.primero
+        for nombre, rut in personas:
+            nodo = nuevos.get(rut)
+            if nodo is not None:
+                # repetido dentro del mismo lote: aún no está en los índices
+                nodo.nombre = nombre
+                continue
+            nodo = indice.get(rut)
+            if nodo is not None:
+                self.renombrar(nodo, nombre)
+                continue
+            primero = Nodo(nombre, rut, primero)
+            nuevos[rut] = primero
+        self.primero = primero
+        indice.update(nuevos)
+        self.nombres.agregarMuchos((nodo.nombre, nodo.rut) for nodo in nuevos.values())
+
+    # personas: -> iterador de (str, int)
+    # entrega los (nombre, rut) de todas las personas,
+    # en el orden de la lista.
+
+    def personas(self):
+        aux = self.primero
+        while aux is not None:
+            yield aux.nombre, aux.rut
+            aux = aux.sgte
+
+if __name__ == "__main__":
+    d = Directorio()
+    d.agregarPersona("Juan",123)
+    d.agregarPersona("Felipe",1234)
+    d.agregarPersona("Pedro",154623)
+    d.agregarPersona("Richard",444555)
+    d.agregarPersona("Mónica",66777)
+
+    print(list(d.buscarPorNombre("monica")))
+    print(list(d.buscarPorPrefijo("p")))
+    print(d.buscarPersona(66777)) 
+
+
+
+
+#def nombreMetodo(param1, param2):
+#    # instrucciones:
+#    valor = 1
+#    return valor
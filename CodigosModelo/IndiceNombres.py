@@ -0,0 +1,106 @@
+# Índice de nombres para los directorios de personas.
+# Guarda pares (nombre, RUT) en una lista ordenada por el nombre
+# normalizado (sin tildes y sin distinguir mayúsculas), de modo que
+# las búsquedas por nombre o por prefijo usan búsqueda binaria
+# en lugar de recorrer todos los nodos del directorio.
+
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
+
+# hasta cuántas personas agregarMuchos las inserta de a una
+POCAS = 64
+
+
+# normalizar: str -> str
+# quita tildes y diacríticos y pasa a minúsculas, para que
+# "Mónica", "MONICA" y "monica" se consideren el mismo nombre.
+# ej: normalizar("Mónica Núñez") entrega "monica nunez"
+
+def normalizar(nombre):
+    descompuesto = unicodedata.normalize("NFKD", nombre)
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return sin_tildes.casefold()
+
+
+class IndiceNombres:
+
+    # Cada entrada es una tupla (nombre normalizado, nombre, rut)
+    # y la lista se mantiene siempre ordenada.
+    def __init__(self):
+        self.entradas = []
+
+    # agregar: str int -> None
+    # registra la persona en el índice: O(log n) comparaciones
+    # más el desplazamiento de la lista al insertar.
+
+    def agregar(self, nombre, rut):
+        insort(self.entradas, (normalizar(nombre), nombre, rut))
+
+    # agregarMuchos: iterable de (str, int) -> None
+    # registra varias personas a la vez. Ordena sólo las nuevas
+    # y las mezcla con la lista: cada una se ubica con búsqueda
+    # binaria a partir de la anterior y la lista se arma copiando
+    # los tramos antiguos entre ellas, así que cuesta
+    # O(k log n) comparaciones más una copia de la lista, sin
+    # volver a comparar las n entradas antiguas. Con pocas
+    # nuevas (hasta POCAS) conviene insertarlas con insort, que
+    # sólo desplaza la lista.
+
+    def agregarMuchos(self, personas):
+        nuevas = sorted((normalizar(nombre), nombre, rut) for nombre, rut in personas)
+        entradas = self.entradas
+        if len(nuevas) <= POCAS:
+            for entrada in nuevas:
+                insort(entradas, entrada)
+            return
+        mezcla = []
+        inicio = 0
+        for entrada in nuevas:
+            fin = bisect_right(entradas, entrada, inicio)
+            mezcla += entradas[inicio:fin]
+            mezcla.append(entrada)
+            inicio = fin
+        mezcla += entradas[inicio:]
+        self.entradas = mezcla
+
+    # quitar: str int -> None
+    # elimina del índice la entrada de esa persona, si existe.
+
+    def quitar(self, nombre, rut):
+        entrada = (normalizar(nombre), nombre, rut)
+        i = bisect_left(self.entradas, entrada)
+        if i < len(self.entradas) and self.entradas[i] == entrada:
+            del self.entradas[i]
+
+    # buscar: str bool -> iterador de (str, int)
+    # entrega los (nombre, rut) cuyo nombre coincide con el buscado
+    # sin distinguir tildes ni mayúsculas. Con exacto=True, sólo los
+    # escritos exactamente igual. Cuesta O(log n + k).
+    # Recorre la lista que había al empezar: si mientras tanto
+    # agregarMuchos la reemplaza, no mezcla la vieja con la nueva.
+    # ej: buscar("monica") entrega ("Mónica", 66777)
+
+    def buscar(self, nombre, exacto=False):
+        entradas = self.entradas
+        clave = normalizar(nombre)
+        i = bisect_left(entradas, (clave,))
+        while i < len(entradas) and entradas[i][0] == clave:
+            _, original, rut = entradas[i]
+            if not exacto or original == nombre:
+                yield original, rut
+            i += 1
+
+    # buscarPrefijo: str -> iterador de (str, int)
+    # entrega, en orden alfabético, los (nombre, rut) cuyo nombre
+    # normalizado comienza con el prefijo normalizado. O(log n + k).
+    # Igual que buscar, recorre la lista que había al empezar.
+    # ej: buscarPrefijo("mó") entrega ("Mónica", 66777)
+
+    def buscarPrefijo(self, prefijo):
+        entradas = self.entradas
+        clave = normalizar(prefijo)
+        i = bisect_left(entradas, (clave,))
+        while i < len(entradas) and entradas[i][0].startswith(clave):
+            _, original, rut = entradas[i]
+            yield original, rut
+            i += 1
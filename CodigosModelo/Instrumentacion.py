@@ -0,0 +1,436 @@
+"""
+Instrumentación opcional de los árboles, las listas y los directorios.
+
+instrumentar(estructura) cambia la clase de esa instancia (y no de las demás)
+por una subclase que, en cada operación pública, cuenta:
+
+- comparaciones: nodos cuya clave ('dato' o 'rut') se leyó para compararla
+  con la buscada (o, al recorrer, para entregarla). Las lecturas seguidas de
+  la clave de un mismo nodo cuentan como una sola comparación: buscar lee la
+  clave dos veces por nodo (== y <), pero cuenta una por nodo visitado, como
+  en el análisis de costo de los libros;
+- visitados: veces que se siguió un enlace hacia un nodo;
+- escrituras: asignaciones de enlaces entre nodos, incluidas las de la raíz o
+  de los extremos de la lista;
+- segundos: tiempo de reloj de la operación.
+
+Los conteos se obtienen cambiando también la clase de los nodos por una
+subclase con propiedades en los enlaces y la clave. El cambio es perezoso: cada
+nodo se convierte la primera vez que se llega a él por un enlace, así que
+instrumentar cuesta O(1); desinstrumentar recorre la estructura completa para
+devolver cada nodo a su clase.
+
+Las clases originales no se modifican, de modo que las estructuras sin
+instrumentar no pagan ningún costo. Con la instrumentación activa, en cambio,
+cada acceso a un enlace pasa por una propiedad y las operaciones son varias
+veces más lentas.
+
+ArbolCompacto y ListaArreglo guardan los enlaces en arreglos, sin objetos nodo:
+de ellas sólo se miden las llamadas y el tiempo.
+
+Cada hilo mide sus propias operaciones, y un mismo Estadisticas puede recibir
+mediciones de varios hilos (por ejemplo, de los lectores de un
+DirectorioConcurrente): registrarlas toma un candado.
+
+Las operaciones anidadas (eliminar, que llama a eliminar_nodo, o agregarPersona,
+que llama a renombrar) se registran una sola vez, con el nombre de la externa.
+Los métodos que retornan generadores (__iter__, iter_inorden, ...) no se miden.
+"""
+import threading
+import time
+from types import FunctionType
+
+# bandera de co_flags de las funciones generadoras (inspect.CO_GENERATOR)
+CO_GENERATOR = 0x20
+
+# clase de nodo -> (nombres de los enlaces, nombre de la clave o None)
+NODOS = {}
+
+# clase de estructura -> atributos que apuntan a nodos (raíz o extremos)
+ESTRUCTURAS = {}
+
+
+def _registrar():
+    """
+    Llena NODOS y ESTRUCTURAS la primera vez que se instrumenta algo. Se hace
+    aquí y no al importar el módulo, para que importarlo no cargue los árboles
+    ni los directorios.
+    """
+    if ESTRUCTURAS:
+        return
+    from Arboles.ABBConGrafico import ArbolBinarioBusqueda, ArbolCompacto
+    from Arboles.ABBConGrafico import Nodo as NodoArbol
+
+    from . import DirectorioListaCircularDoble, DirectorioSimple
+    from .ListaArreglo import ListaArreglo
+    from .ListaDesenrollada import Bloque, ListaDesenrollada
+    from .NucleoListas import NodoDoble, NodoSimple, NucleoSimple
+
+    NODOS.update({
+        NodoSimple: (("siguiente",), "dato"),
+        NodoDoble: (("siguiente", "anterior"), "dato"),
+        Bloque: (("siguiente", "anterior"), None),
+        NodoArbol: (("izquierdo", "derecho"), "dato"),
+        DirectorioSimple.Nodo: (("sgte",), "rut"),
+        DirectorioListaCircularDoble.Nodo: (("sgte", "ant"), "rut"),
+    })
+    ESTRUCTURAS.update({
+        NucleoSimple: ("primero", "ultimo"),
+        ListaDesenrollada: ("primero", "ultimo"),
+        ArbolBinarioBusqueda: ("raiz",),
+        DirectorioSimple.Directorio: ("primero",),
+        DirectorioListaCircularDoble.Directorio: ("primero",),
+        ArbolCompacto: (),
+        ListaArreglo: (),
+    })
+
+
+class _Estado(threading.local):
+    """
+    Medición en curso en cada hilo (None fuera de una operación instrumentada).
+    """
+    medicion = None
+
+
+_estado = _Estado()
+
+
+class Medicion:
+    """
+    Conteos de una operación. 'comparado' es el último nodo cuya clave se
+    leyó, para contar una sola comparación por nodo.
+    """
+    __slots__ = ("comparaciones", "visitados", "escrituras", "segundos", "comparado")
+
+    def __init__(self):
+        self.comparaciones = 0
+        self.visitados = 0
+        self.escrituras = 0
+        self.segundos = 0.0
+        self.comparado = None
+
+    def __repr__(self):
+        return (f"Medicion(comparaciones={self.comparaciones}, visitados={self.visitados}, "
+                f"escrituras={self.escrituras}, segundos={self.segundos:.6f})")
+
+
+class Histograma:
+    """
+    Histograma con cubetas de potencias de dos: la cubeta k cuenta los valores
+    entre 2**(k-1) y 2**k - 1 (la cubeta 0 cuenta los ceros).
+    """
+
+    def __init__(self):
+        self.cubetas = {}
+        self.total = 0
+
+    def agregar(self, valor):
+        cubeta = int(valor).bit_length()
+        self.cubetas[cubeta] = self.cubetas.get(cubeta, 0) + 1
+        self.total += 1
+
+    def percentil(self, p):
+        """
+        Retorna una cota superior del percentil 'p' (entre 0 y 100): el mayor
+        valor de la cubeta donde cae.
+        """
+        if self.total == 0:
+            return None
+        objetivo = p / 100 * self.total
+        acumulado = 0
+        for cubeta in sorted(self.cubetas):
+            acumulado += self.cubetas[cubeta]
+            if acumulado >= objetivo:
+                return (1 << cubeta) - 1
+        return (1 << max(self.cubetas)) - 1
+
+    def filas(self):
+        """
+        Retorna una lista de (desde, hasta, cantidad), de menor a mayor.
+        """
+        return [
+            ((1 << (cubeta - 1)) if cubeta else 0, (1 << cubeta) - 1, self.cubetas[cubeta])
+            for cubeta in sorted(self.cubetas)
+        ]
+
+
+class Resumen:
+    """
+    Totales de una operación y sus histogramas de nodos visitados y de
+    latencia (en microsegundos).
+    """
+
+    def __init__(self):
+        self.llamadas = 0
+        self.comparaciones = 0
+        self.visitados = 0
+        self.escrituras = 0
+        self.segundos = 0.0
+        self.histograma_visitados = Histograma()
+        self.histograma_latencia = Histograma()
+
+    def agregar(self, medicion):
+        self.llamadas += 1
+        self.comparaciones += medicion.comparaciones
+        self.visitados += medicion.visitados
+        self.escrituras += medicion.escrituras
+        self.segundos += medicion.segundos
+        self.histograma_visitados.agregar(medicion.visitados)
+        self.histograma_latencia.agregar(medicion.segundos * 1e6)
+
+
+class Estadisticas:
+    """
+    Acumula las mediciones de una o más estructuras instrumentadas, por
+    nombre de operación. Si se entrega 'al_terminar', se llama con
+    (operacion, medicion) al final de cada operación, fuera del candado.
+    """
+
+    def __init__(self, al_terminar=None):
+        self.al_terminar = al_terminar
+        self.por_operacion = {}
+        self.candado = threading.Lock()
+
+    def registrar(self, operacion, medicion):
+        with self.candado:
+            resumen = self.por_operacion.get(operacion)
+            if resumen is None:
+                resumen = self.por_operacion[operacion] = Resumen()
+            resumen.agregar(medicion)
+        if self.al_terminar is not None:
+            self.al_terminar(operacion, medicion)
+
+    def reiniciar(self):
+        with self.candado:
+            self.por_operacion.clear()
+
+    def tabla(self):
+        """
+        Retorna un texto con los promedios por llamada de cada operación.
+        """
+        lineas = [f"{'operación':<22}{'llamadas':>10}{'comparac.':>11}{'visitados':>11}"
+                  f"{'escrituras':>11}{'µs':>10}{'p99 visit.':>11}"]
+        with self.candado:
+            resumenes = sorted(self.por_operacion.items())
+        for operacion, r in resumenes:
+            lineas.append(
+                f"{operacion:<22}{r.llamadas:>10}{r.comparaciones / r.llamadas:>11.1f}"
+                f"{r.visitados / r.llamadas:>11.1f}{r.escrituras / r.llamadas:>11.1f}"
+                f"{r.segundos / r.llamadas * 1e6:>10.1f}{r.histograma_visitados.percentil(99):>11}"
+            )
+        return "\n".join(lineas)
+
+
+# clase original -> subclase contada (nodos y estructuras)
+_contadas = {}
+# clase de un nodo -> clase a la que se convierte (None si no hay que convertirlo)
+_conversion = {}
+
+
+def _acceso(clase, nombre):
+    """
+    Retorna (leer, escribir) para el atributo 'nombre' de 'clase', saltándose
+    cualquier propiedad de una subclase: el descriptor del slot si lo hay, o
+    el diccionario de la instancia.
+    """
+    for base in clase.__mro__:
+        descriptor = base.__dict__.get(nombre)
+        if descriptor is not None and hasattr(descriptor, "__set__"):
+            return descriptor.__get__, descriptor.__set__
+
+    def leer(objeto):
+        return objeto.__dict__[nombre]
+
+    def escribir(objeto, valor):
+        objeto.__dict__[nombre] = valor
+
+    return leer, escribir
+
+
+def _convertir(valor):
+    """
+    Cambia 'valor' a su clase contada si es un nodo de una clase conocida.
+    """
+    clase = type(valor)
+    destino = _conversion.get(clase, False)
+    if destino is False:
+        destino = _clase_contada(clase) if _configuracion(NODOS, clase) else None
+        _conversion[clase] = destino
+    if destino is not None:
+        valor.__class__ = destino
+
+
+def _propiedad_enlace(clase, nombre):
+    leer, escribir = _acceso(clase, nombre)
+
+    def obtener(objeto):
+        valor = leer(objeto)
+        if valor is not None:
+            _convertir(valor)
+            medicion = _estado.medicion
+            if medicion is not None:
+                medicion.visitados += 1
+        return valor
+
+    def asignar(objeto, valor):
+        if valor is not None:
+            _convertir(valor)
+        medicion = _estado.medicion
+        if medicion is not None:
+            medicion.escrituras += 1
+        escribir(objeto, valor)
+
+    return property(obtener, asignar)
+
+
+def _propiedad_clave(clase, nombre):
+    leer, escribir = _acceso(clase, nombre)
+
+    def obtener(objeto):
+        medicion = _estado.medicion
+        if medicion is not None and medicion.comparado is not objeto:
+            medicion.comparaciones += 1
+            medicion.comparado = objeto
+        return leer(objeto)
+
+    return property(obtener, escribir)
+
+
+def _configuracion(tabla, clase):
+    for base in clase.__mro__:
+        if base in tabla:
+            return tabla[base]
+    return None
+
+
+def _medida(nombre, metodo):
+    """
+    Envuelve 'metodo' para medirlo y registrarlo como 'nombre'. Si ya hay una
+    operación en curso en este hilo, sus conteos se suman a ella.
+    """
+
+    def medido(self, *args, **kwargs):
+        if _estado.medicion is not None or self._estadisticas is None:
+            return metodo(self, *args, **kwargs)
+        medicion = _estado.medicion = Medicion()
+        inicio = time.perf_counter()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            medicion.segundos = time.perf_counter() - inicio
+            medicion.comparado = None
+            _estado.medicion = None
+            self._estadisticas.registrar(nombre, medicion)
+
+    medido.__name__ = nombre
+    medido.__doc__ = metodo.__doc__
+    return medido
+
+
+def _clase_contada(clase):
+    """
+    Retorna (creándola la primera vez) la subclase contada de un nodo o de una
+    estructura.
+    """
+    contada = _contadas.get(clase)
+    if contada is not None:
+        return contada
+    atributos = {"__slots__": ()} if "__dict__" not in dir(clase) else {}
+    nodo = _configuracion(NODOS, clase)
+    if nodo is not None:
+        enlaces, clave = nodo
+        for enlace in enlaces:
+            atributos[enlace] = _propiedad_enlace(clase, enlace)
+        if clave is not None:
+            atributos[clave] = _propiedad_clave(clase, clave)
+    else:
+        # las instancias creadas directamente con la clase contada (por
+        # ejemplo con cls() en un classmethod) no tienen estadísticas: no se miden
+        atributos["_estadisticas"] = None
+        for raiz in _configuracion(ESTRUCTURAS, clase):
+            atributos[raiz] = _propiedad_enlace(clase, raiz)
+        # métodos públicos, recorriendo la jerarquía como la búsqueda de
+        # atributos: el primero que aparece con un nombre es el que vale.
+        # Los classmethod y staticmethod no son FunctionType en __dict__.
+        vistos = set()
+        for base in clase.__mro__:
+            for nombre, miembro in vars(base).items():
+                if nombre in vistos:
+                    continue
+                vistos.add(nombre)
+                if (nombre.startswith("_") or not isinstance(miembro, FunctionType)
+                        or miembro.__code__.co_flags & CO_GENERATOR):
+                    continue
+                atributos[nombre] = _medida(nombre, miembro)
+    contada = type(clase.__name__ + "Contado", (clase,), atributos)
+    _contadas[clase] = contada
+    _conversion[contada] = None
+    return contada
+
+
+def instrumentar(estructura, estadisticas=None, al_terminar=None):
+    """
+    Activa la instrumentación en 'estructura' y retorna el objeto Estadisticas
+    donde se acumulan sus mediciones (uno nuevo si no se entrega, con el
+    callback 'al_terminar').
+    """
+    _registrar()
+    clase = type(estructura)
+    if _configuracion(ESTRUCTURAS, clase) is None:
+        raise TypeError(f"no se sabe instrumentar {clase.__name__}")
+    if estadisticas is None:
+        estadisticas = Estadisticas(al_terminar)
+    if clase not in _conversion or _conversion[clase] is not None:
+        estructura.__class__ = _clase_contada(clase)
+    estructura._estadisticas = estadisticas
+    return estadisticas
+
+
+def desinstrumentar(estructura):
+    """
+    Devuelve 'estructura' y todos sus nodos a sus clases originales, en O(n).
+    """
+    contada = type(estructura)
+    if contada not in _conversion or _conversion[contada] is not None:
+        return
+    original = contada.__mro__[1]
+    estructura.__class__ = original
+    del estructura._estadisticas
+    originales = {contada_nodo: clase for clase, contada_nodo in _contadas.items()}
+    pendientes = [getattr(estructura, raiz) for raiz in _configuracion(ESTRUCTURAS, original)]
+    vistos = set()
+    while pendientes:
+        nodo = pendientes.pop()
+        if nodo is None or id(nodo) in vistos:
+            continue
+        vistos.add(id(nodo))
+        clase_nodo = originales.get(type(nodo))
+        if clase_nodo is not None:
+            nodo.__class__ = clase_nodo
+        enlaces, _ = _configuracion(NODOS, type(nodo))
+        pendientes.extend(getattr(nodo, enlace) for enlace in enlaces)
+
+
+if __name__ == "__main__":
+    import random
+
+    from Arboles.ABBConGrafico import ArbolBinarioBusqueda
+
+    from .ListaEn import ListaEnlazada
+
+    claves = random.Random(0).sample(range(100_000), 10_000)
+    arbol = ArbolBinarioBusqueda()
+    for clave in claves:
+        arbol.insertar(clave)
+    lista = ListaEnlazada.desde_iterable(claves[:1000])
+
+    estadisticas = Estadisticas()
+    instrumentar(arbol, estadisticas)
+    instrumentar(lista, estadisticas)
+    for clave in claves[:1000]:
+        arbol.buscar(clave)
+        lista.existe(clave)
+    print(estadisticas.tabla())
+    print("Nodos visitados por buscar:", estadisticas.por_operacion["buscar"].histograma_visitados.filas())
+    desinstrumentar(arbol)
+    desinstrumentar(lista)
@@ -0,0 +1,322 @@
+"""
+Lista doblemente enlazada guardada en arreglos paralelos, sin un objeto por nodo.
+
+El nodo i es la posición i de tres arreglos de tipo 'array': 'datos' con los
+valores y 'siguientes' y 'anteriores' con los índices de los nodos vecinos
+(-1 cuando no hay vecino). Los arreglos crecen al doble cuando se llenan y las
+posiciones de los nodos eliminados se encadenan en una lista libre, a través de
+'siguientes', para reutilizarlas en las próximas inserciones. Así agregar y
+eliminar no crean ni destruyen objetos (el recolector de basura no los
+recorre) y cada elemento entero ocupa 16 bytes más la holgura del crecimiento,
+en vez de los ~88 de un NodoDoble con su dato.
+
+Tiene la misma interfaz que NucleoDoble; los "nodos" que retornan los métodos
+que agregan son los índices de las posiciones.
+"""
+from array import array
+
+FIN = -1
+
+
+class ListaArreglo:
+    """
+    Lista doblemente enlazada sobre arreglos paralelos con reutilización de posiciones.
+    Los datos deben caber en el tipo del arreglo ('q': enteros de 64 bits por
+    omisión, 'd' para números reales).
+    """
+
+    def __init__(self, tipo="q", capacidad=0):
+        """
+        Inicializa una lista vacía con espacio reservado para 'capacidad' elementos.
+        'primero' y 'ultimo' son índices de posiciones, o -1 si la lista está vacía;
+        'libre' es la primera posición de la lista libre.
+        """
+        self.tipo = tipo
+        self.datos = array(tipo)
+        self.siguientes = array("i")
+        self.anteriores = array("i")
+        self.primero = FIN
+        self.ultimo = FIN
+        self.libre = FIN
+        self.tamano = 0
+        if capacidad:
+            self._crecer(capacidad)
+
+    @classmethod
+    def desde_iterable(cls, datos, tipo="q"):
+        """
+        Crea una lista con los 'datos' en el mismo orden, usando extender.
+        """
+        lista = cls(tipo)
+        lista.extender(datos)
+        return lista
+
+    def __len__(self):
+        """
+        Retorna la cantidad de elementos, en O(1).
+        """
+        return self.tamano
+
+    def __iter__(self):
+        """
+        Recorre los datos desde el primero hasta el último.
+        """
+        datos, siguientes = self.datos, self.siguientes
+        i = self.primero
+        while i != FIN:
+            yield datos[i]
+            i = siguientes[i]
+
+    def iter_inverso(self):
+        """
+        Recorre los datos desde el último hasta el primero.
+        """
+        datos, anteriores = self.datos, self.anteriores
+        i = self.ultimo
+        while i != FIN:
+            yield datos[i]
+            i = anteriores[i]
+
+    def capacidad(self):
+        """
+        Retorna cuántas posiciones tienen reservadas los arreglos, ocupadas o libres.
+        """
+        return len(self.datos)
+
+    def esta_vacia(self):
+        """
+        Retorna True si la lista no tiene elementos.
+        """
+        return self.tamano == 0
+
+    def obtener_cabeza(self):
+        """
+        Retorna el primer dato de la lista, o None si está vacía.
+        """
+        return self.datos[self.primero] if self.tamano else None
+
+    def obtener_cola(self):
+        """
+        Retorna el último dato de la lista, o None si está vacía.
+        """
+        return self.datos[self.ultimo] if self.tamano else None
+
+    def _crecer(self, minimo=1):
+        """
+        Método auxiliar que agranda los arreglos al doble (o en 'minimo'
+        posiciones, si es más) y encadena las posiciones nuevas en la lista libre.
+        """
+        actual = len(self.datos)
+        nueva = max(actual * 2, actual + minimo, 8)
+        extra = nueva - actual
+        self.datos.frombytes(bytes(extra * self.datos.itemsize))
+        self.anteriores.extend(array("i", [FIN]) * extra)
+        # cada posición nueva apunta a la siguiente y la última a la lista libre anterior
+        self.siguientes.extend(range(actual + 1, nueva))
+        self.siguientes.append(self.libre)
+        self.libre = actual
+
+    def _ocupar(self, dato):
+        """
+        Método auxiliar que toma una posición de la lista libre, guarda 'dato'
+        en ella y retorna su índice. El dato se guarda antes de sacar la
+        posición de la lista libre: si no cabe en el tipo del arreglo, la
+        excepción deja la posición libre.
+        """
+        if self.libre == FIN:
+            self._crecer()
+        i = self.libre
+        self.datos[i] = dato
+        self.libre = self.siguientes[i]
+        return i
+
+    def agregar_final(self, dato):
+        """
+        Agrega 'dato' al final de la lista en O(1) amortizado. Retorna su índice.
+        """
+        if self.libre == FIN:
+            self._crecer()
+        siguientes = self.siguientes
+        i = self.libre
+        self.datos[i] = dato  # antes de ocupar la posición, como en _ocupar
+        self.libre = siguientes[i]
+        siguientes[i] = FIN
+        ultimo = self.ultimo
+        self.anteriores[i] = ultimo
+        if ultimo == FIN:
+            self.primero = i
+        else:
+            siguientes[ultimo] = i
+        self.ultimo = i
+        self.tamano += 1
+        return i
+
+    def agregar_inicio(self, dato):
+        """
+        Agrega 'dato' al inicio de la lista en O(1) amortizado. Retorna su índice.
+        """
+        i = self._ocupar(dato)
+        self.anteriores[i] = FIN
+        self.siguientes[i] = self.primero
+        if self.tamano == 0:
+            self.ultimo = i
+        else:
+            self.anteriores[self.primero] = i
+        self.primero = i
+        self.tamano += 1
+        return i
+
+    def insertar_despues(self, nodo, dato):
+        """
+        Agrega 'dato' justo después de la posición 'nodo' en O(1). Retorna su índice.
+        """
+        if nodo == self.ultimo:
+            return self.agregar_final(dato)
+        i = self._ocupar(dato)
+        siguiente = self.siguientes[nodo]
+        self.anteriores[i] = nodo
+        self.siguientes[i] = siguiente
+        self.anteriores[siguiente] = i
+        self.siguientes[nodo] = i
+        self.tamano += 1
+        return i
+
+    def extender(self, datos):
+        """
+        Agrega todos los 'datos' al final de la lista, en orden. Los copia de una
+        vez a un bloque nuevo al final de los arreglos, cuyos enlaces se arman
+        con rangos, y enlaza el bloque a la lista una sola vez.
+        """
+        nuevos = array(self.tipo, datos)
+        m = len(nuevos)
+        if m == 0:
+            return
+        inicio = len(self.datos)
+        self.datos.extend(nuevos)
+        self.siguientes.extend(range(inicio + 1, inicio + m + 1))
+        self.siguientes[-1] = FIN
+        self.anteriores.extend(range(inicio - 1, inicio + m - 1))
+        self.anteriores[inicio] = self.ultimo
+        if self.tamano == 0:
+            self.primero = inicio
+        else:
+            self.siguientes[self.ultimo] = inicio
+        self.ultimo = inicio + m - 1
+        self.tamano += m
+
+    def a_lista(self):
+        """
+        Retorna una lista de Python con los datos, desde el primero hasta el último.
+        """
+        return list(self)
+
+    def existe(self, dato):
+        """
+        Retorna True si 'dato' está en la lista. Primero busca en el arreglo de
+        datos completo, a velocidad de C; sólo si aparece recorre los enlaces,
+        porque las posiciones libres pueden conservar datos antiguos.
+        """
+        if dato not in self.datos:
+            return False
+        datos, siguientes = self.datos, self.siguientes
+        i = self.primero
+        while i != FIN:
+            if datos[i] == dato:
+                return True
+            i = siguientes[i]
+        return False
+
+    def eliminar(self, dato):
+        """
+        Elimina el primer nodo que contiene 'dato'. Retorna True si lo encontró.
+        """
+        datos, siguientes = self.datos, self.siguientes
+        i = self.primero
+        while i != FIN:
+            if datos[i] == dato:
+                self.eliminar_nodo(i)
+                return True
+            i = siguientes[i]
+        return False
+
+    def eliminar_todos(self, predicado):
+        """
+        Elimina, en una sola pasada, todos los nodos cuyo dato cumple
+        'predicado(dato)'. Retorna cuántos eliminó.
+        """
+        datos, siguientes = self.datos, self.siguientes
+        eliminados = 0
+        i = self.primero
+        while i != FIN:
+            siguiente = siguientes[i]
+            if predicado(datos[i]):
+                self.eliminar_nodo(i)
+                eliminados += 1
+            i = siguiente
+        return eliminados
+
+    def eliminar_nodo(self, nodo):
+        """
+        Saca la posición 'nodo' de la lista en O(1), la devuelve a la lista libre
+        y retorna su dato.
+        """
+        siguientes, anteriores = self.siguientes, self.anteriores
+        anterior, siguiente = anteriores[nodo], siguientes[nodo]
+        if anterior == FIN:
+            self.primero = siguiente
+        else:
+            siguientes[anterior] = siguiente
+        if siguiente == FIN:
+            self.ultimo = anterior
+        else:
+            anteriores[siguiente] = anterior
+        siguientes[nodo] = self.libre
+        anteriores[nodo] = FIN
+        self.libre = nodo
+        self.tamano -= 1
+        return self.datos[nodo]
+
+    def mover_al_frente(self, nodo):
+        """
+        Mueve la posición 'nodo' al inicio de la lista en O(1).
+        """
+        if nodo == self.primero:
+            return
+        siguientes, anteriores = self.siguientes, self.anteriores
+        anterior, siguiente = anteriores[nodo], siguientes[nodo]
+        siguientes[anterior] = siguiente
+        if siguiente == FIN:
+            self.ultimo = anterior
+        else:
+            anteriores[siguiente] = anterior
+        anteriores[nodo] = FIN
+        siguientes[nodo] = self.primero
+        anteriores[self.primero] = nodo
+        self.primero = nodo
+
+    def compactar(self):
+        """
+        Reescribe los arreglos con los datos en orden y sin posiciones libres,
+        liberando la memoria de las eliminadas, en O(n). Después de compactar,
+        el nodo i es el i-ésimo dato, así que los índices obtenidos antes dejan
+        de ser válidos.
+        """
+        n = self.tamano
+        self.datos = array(self.tipo, self)
+        self.siguientes = array("i", range(1, n + 1))
+        self.anteriores = array("i", range(-1, n - 1))
+        if n:
+            self.siguientes[-1] = FIN
+        self.primero = 0 if n else FIN
+        self.ultimo = n - 1
+        self.libre = FIN
+
+    def imprimir_lista(self):
+        """
+        Muestra los datos de la lista en una sola línea.
+        """
+        if self.tamano == 0:
+            print("La lista está vacía.")
+        else:
+            print(*self, end=" ")
+            print()
@@ -0,0 +1,327 @@
+"""
+Lista enlazada desenrollada: cada nodo guarda un bloque de hasta 'capacidad'
+datos (64 por omisión) en una lista de Python, en vez de un solo dato.
+
+Recorrer la lista salta de bloque en bloque, así que hay unas 64 veces menos
+nodos que seguir, y dentro de cada bloque la búsqueda la hace 'in' a velocidad
+de C sobre un arreglo contiguo de referencias. Por eso existe y eliminar son
+mucho más rápidos que en ListaEn, ListaDoEn o ListasCiEn en listas largas.
+
+Los bloques se dividen al insertar en uno lleno y, al eliminar, los que quedan
+a menos de la mitad se fusionan con su vecino o le piden datos, de modo que
+siempre están al menos medio llenos (salvo, quizás, el primero o el último).
+Después de eliminar_todos sólo el último puede quedar a menos de la mitad.
+"""
+
+
+class Bloque:
+    """
+    Nodo de la lista desenrollada: una lista de datos y los enlaces al siguiente
+    y al anterior bloque.
+    """
+    __slots__ = ("datos", "siguiente", "anterior")
+
+    def __init__(self, datos=None):
+        self.datos = datos if datos is not None else []
+        self.siguiente = None
+        self.anterior = None
+
+
+class ListaDesenrollada:
+    """
+    Lista enlazada de bloques de datos con la interfaz de las listas del
+    repositorio (sin identificadores de nodo: los datos se mueven entre bloques).
+    """
+
+    def __init__(self, capacidad=64):
+        """
+        Inicializa una lista vacía cuyos bloques guardan hasta 'capacidad' datos.
+        """
+        if capacidad < 2:
+            raise ValueError("la capacidad de los bloques debe ser al menos 2")
+        self.capacidad = capacidad
+        self.primero = None
+        self.ultimo = None
+        self.tamano = 0
+
+    @classmethod
+    def desde_iterable(cls, datos, capacidad=64):
+        """
+        Crea una lista con los 'datos' en el mismo orden, usando extender.
+        """
+        lista = cls(capacidad)
+        lista.extender(datos)
+        return lista
+
+    def __len__(self):
+        """
+        Retorna la cantidad de elementos, en O(1).
+        """
+        return self.tamano
+
+    def __iter__(self):
+        """
+        Recorre los datos desde el primero hasta el último.
+        """
+        bloque = self.primero
+        while bloque is not None:
+            yield from bloque.datos
+            bloque = bloque.siguiente
+
+    def iter_inverso(self):
+        """
+        Recorre los datos desde el último hasta el primero.
+        """
+        bloque = self.ultimo
+        while bloque is not None:
+            yield from reversed(bloque.datos)
+            bloque = bloque.anterior
+
+    def esta_vacia(self):
+        """
+        Retorna True si la lista no tiene elementos.
+        """
+        return self.tamano == 0
+
+    def obtener_cabeza(self):
+        """
+        Retorna el primer dato de la lista, o None si está vacía.
+        """
+        return self.primero.datos[0] if self.primero else None
+
+    def obtener_cola(self):
+        """
+        Retorna el último dato de la lista, o None si está vacía.
+        """
+        return self.ultimo.datos[-1] if self.ultimo else None
+
+    def agregar_final(self, dato):
+        """
+        Agrega 'dato' al final de la lista en O(1): lo pone en el último bloque,
+        o en uno nuevo si está lleno.
+        """
+        if self.ultimo is None or len(self.ultimo.datos) >= self.capacidad:
+            self._enlazar_despues(self.ultimo, Bloque())
+        self.ultimo.datos.append(dato)
+        self.tamano += 1
+
+    def agregar_inicio(self, dato):
+        """
+        Agrega 'dato' al inicio de la lista en O(capacidad): lo pone al comienzo
+        del primer bloque, o en uno nuevo si está lleno.
+        """
+        if self.primero is None or len(self.primero.datos) >= self.capacidad:
+            self._enlazar_antes(self.primero, Bloque())
+        self.primero.datos.insert(0, dato)
+        self.tamano += 1
+
+    def insertar(self, posicion, dato):
+        """
+        Inserta 'dato' para que quede en la posición 'posicion' (0 es el inicio).
+        Si el bloque que la contiene está lleno, lo divide en dos mitades.
+        """
+        if posicion >= self.tamano:
+            self.agregar_final(dato)
+            return
+        bloque, i = self._ubicar(max(posicion, 0))
+        if len(bloque.datos) >= self.capacidad:
+            mitad = len(bloque.datos) // 2
+            nuevo = Bloque(bloque.datos[mitad:])
+            del bloque.datos[mitad:]
+            self._enlazar_despues(bloque, nuevo)
+            if i > mitad:
+                bloque, i = nuevo, i - mitad
+        bloque.datos.insert(i, dato)
+        self.tamano += 1
+
+    def extender(self, datos):
+        """
+        Agrega todos los 'datos' al final de la lista, en orden: completa el
+        último bloque y corta el resto en bloques llenos, enlazándolos de a uno.
+        """
+        datos = list(datos)
+        if not datos:
+            return
+        inicio = 0
+        if self.ultimo is not None:
+            inicio = self.capacidad - len(self.ultimo.datos)
+            self.ultimo.datos.extend(datos[:inicio])
+        for i in range(inicio, len(datos), self.capacidad):
+            self._enlazar_despues(self.ultimo, Bloque(datos[i:i + self.capacidad]))
+        self.tamano += len(datos)
+
+    def a_lista(self):
+        """
+        Retorna una lista de Python con los datos, desde el primero hasta el último.
+        """
+        resultado = []
+        bloque = self.primero
+        while bloque is not None:
+            resultado.extend(bloque.datos)
+            bloque = bloque.siguiente
+        return resultado
+
+    def existe(self, dato):
+        """
+        Retorna True si 'dato' está en la lista. Busca con 'in' dentro de cada bloque.
+        """
+        bloque = self.primero
+        while bloque is not None:
+            if dato in bloque.datos:
+                return True
+            bloque = bloque.siguiente
+        return False
+
+    def eliminar(self, dato):
+        """
+        Elimina la primera aparición de 'dato'. Retorna True si lo encontró.
+        """
+        bloque = self.primero
+        while bloque is not None:
+            if dato in bloque.datos:
+                bloque.datos.remove(dato)
+                self.tamano -= 1
+                self._reparar(bloque)
+                return True
+            bloque = bloque.siguiente
+        return False
+
+    def eliminar_todos(self, predicado):
+        """
+        Elimina, en una sola pasada, todos los datos que cumplen 'predicado(dato)',
+        y luego reequilibra los bloques con otra pasada. Retorna cuántos eliminó.
+        """
+        eliminados = 0
+        bloque = self.primero
+        while bloque is not None:
+            quedan = [dato for dato in bloque.datos if not predicado(dato)]
+            eliminados += len(bloque.datos) - len(quedan)
+            bloque.datos = quedan
+            siguiente = bloque.siguiente
+            if not quedan:
+                self._desenlazar(bloque)
+            bloque = siguiente
+        self.tamano -= eliminados
+        self._reequilibrar()
+        return eliminados
+
+    def _ubicar(self, posicion):
+        """
+        Método auxiliar que retorna el bloque que contiene la posición 'posicion'
+        y el índice dentro de él.
+        """
+        bloque = self.primero
+        while posicion >= len(bloque.datos):
+            posicion -= len(bloque.datos)
+            bloque = bloque.siguiente
+        return bloque, posicion
+
+    def _reparar(self, bloque):
+        """
+        Método auxiliar que, tras sacar datos de 'bloque', lo elimina si quedó
+        vacío o, si quedó a menos de la mitad, le pasa datos del siguiente bloque
+        o lo fusiona con él.
+        """
+        if not bloque.datos:
+            self._desenlazar(bloque)
+            return
+        minimo = self.capacidad // 2
+        siguiente = bloque.siguiente
+        if len(bloque.datos) >= minimo or siguiente is None:
+            return
+        if len(bloque.datos) + len(siguiente.datos) <= self.capacidad:
+            bloque.datos.extend(siguiente.datos)
+            self._desenlazar(siguiente)
+        else:
+            faltan = minimo - len(bloque.datos)
+            bloque.datos.extend(siguiente.datos[:faltan])
+            del siguiente.datos[:faltan]
+
+    def _reequilibrar(self):
+        """
+        Método auxiliar que, en una pasada, deja todos los bloques al menos medio
+        llenos: fusiona cada bloque con el siguiente si caben juntos en uno solo
+        y, si no caben pero el bloque quedó a menos de la mitad, le pasa datos
+        del siguiente (como '_reparar'). Al final, si el último quedó a menos de
+        la mitad, le pasa datos del penúltimo.
+        """
+        minimo = self.capacidad // 2
+        bloque = self.primero
+        while bloque is not None and bloque.siguiente is not None:
+            siguiente = bloque.siguiente
+            if len(bloque.datos) + len(siguiente.datos) <= self.capacidad:
+                bloque.datos.extend(siguiente.datos)
+                self._desenlazar(siguiente)
+                continue
+            faltan = minimo - len(bloque.datos)
+            if faltan > 0:
+                bloque.datos.extend(siguiente.datos[:faltan])
+                del siguiente.datos[:faltan]
+            bloque = siguiente
+        ultimo = self.ultimo
+        if ultimo is not None and ultimo.anterior is not None:
+            faltan = minimo - len(ultimo.datos)
+            if faltan > 0:
+                # el penúltimo no cabe junto al último, así que le sobran datos
+                anterior = ultimo.anterior
+                ultimo.datos[:0] = anterior.datos[-faltan:]
+                del anterior.datos[-faltan:]
+
+    def _enlazar_despues(self, bloque, nuevo):
+        """
+        Método auxiliar que enlaza 'nuevo' después de 'bloque' (None si la lista
+        no tiene bloques).
+        """
+        nuevo.anterior = bloque
+        if bloque is None:
+            nuevo.siguiente = None
+            self.primero = nuevo
+        else:
+            nuevo.siguiente = bloque.siguiente
+            bloque.siguiente = nuevo
+        if nuevo.siguiente is None:
+            self.ultimo = nuevo
+        else:
+            nuevo.siguiente.anterior = nuevo
+
+    def _enlazar_antes(self, bloque, nuevo):
+        """
+        Método auxiliar que enlaza 'nuevo' antes de 'bloque' (None si la lista
+        no tiene bloques).
+        """
+        if bloque is None or bloque.anterior is None:
+            nuevo.anterior = None
+            nuevo.siguiente = bloque
+            if bloque is None:
+                self.ultimo = nuevo
+            else:
+                bloque.anterior = nuevo
+            self.primero = nuevo
+        else:
+            self._enlazar_despues(bloque.anterior, nuevo)
+
+    def _desenlazar(self, bloque):
+        """
+        Método auxiliar que saca 'bloque' de la cadena de bloques.
+        """
+        anterior, siguiente = bloque.anterior, bloque.siguiente
+        if anterior is None:
+            self.primero = siguiente
+        else:
+            anterior.siguiente = siguiente
+        if siguiente is None:
+            self.ultimo = anterior
+        else:
+            siguiente.anterior = anterior
+        bloque.siguiente = None
+        bloque.anterior = None
+
+    def imprimir_lista(self):
+        """
+        Muestra los datos de la lista en una sola línea.
+        """
+        if self.tamano == 0:
+            print("La lista está vacía.")
+        else:
+            print(*self, end=" ")
+            print()
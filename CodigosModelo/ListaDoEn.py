@@ -0,0 +1,16 @@
+from .NucleoListas import NodoDoble, NucleoDoble
+
+Nodo = NodoDoble
+
+
+class ListaDolementeenlazada(NucleoDoble):
+    # Fachada sobre NucleoDoble con los nombres de métodos de esta lista.
+    estavacia = NucleoDoble.esta_vacia
+    agregaralfinal = NucleoDoble.agregar_final
+    agregarinicio = NucleoDoble.agregar_inicio
+    obtenercabeza = NucleoDoble.obtener_cabeza
+    obtenercola = NucleoDoble.obtener_cola
+
+    def imprimir(self):
+        for dato in self:
+            print(dato)
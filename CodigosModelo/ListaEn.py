@@ -0,0 +1,24 @@
+from .NucleoListas import NodoSimple, NucleoSimple
+
+Nodo = NodoSimple
+
+
+class ListaEnlazada(NucleoSimple):
+    # Fachada sobre NucleoSimple: 'inicio' y 'fin' son los nombres
+    # que usa esta lista para el primer y el último nodo. Asignarlos
+    # cambia 'primero' y 'ultimo' del núcleo, pero no el largo guardado.
+    @property
+    def inicio(self):
+        return self.primero
+
+    @inicio.setter
+    def inicio(self, nodo):
+        self.primero = nodo
+
+    @property
+    def fin(self):
+        return self.ultimo
+
+    @fin.setter
+    def fin(self, nodo):
+        self.ultimo = nodo
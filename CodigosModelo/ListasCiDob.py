@@ -0,0 +1,9 @@
+from .NucleoListas import NodoDoble, NucleoCircularDoble
+
+Nodo = NodoDoble
+
+
+class ListaCircularSimple(NucleoCircularDoble):
+    # Fachada sobre NucleoCircularDoble: pese al nombre, cada nodo conoce
+    # a su siguiente y a su anterior, y la lista se cierra sobre sí misma.
+    pass
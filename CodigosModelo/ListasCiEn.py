@@ -0,0 +1,8 @@
+from .NucleoListas import NodoSimple, NucleoCircularSimple
+
+Nodo = NodoSimple
+
+
+class ListaCircularSimple(NucleoCircularSimple):
+    # Fachada sobre NucleoCircularSimple: el último nodo apunta al primero.
+    pass
@@ -0,0 +1,214 @@
+from .NucleoListas import NodoDoble, NodoSimple, NucleoCircularSimple, NucleoDoble, NucleoSimple
+
+
+class _NombresEnIngles:
+    """
+    Nombres en inglés de los atributos de un nodo del núcleo común.
+    """
+    __slots__ = ()
+
+    @property
+    def value(self):
+        return self.dato
+
+    @value.setter
+    def value(self, value):
+        self.dato = value
+
+    @property
+    def next(self):
+        return self.siguiente
+
+    @next.setter
+    def next(self, node):
+        self.siguiente = node
+
+
+class Node(_NombresEnIngles, NodoSimple):
+    """
+    Clase que representa un nodo en una lista enlazada.
+    Cada nodo contiene un valor y un enlace al siguiente nodo. Es un NodoSimple
+    del núcleo común, con los nombres en inglés que usa este archivo.
+    """
+    __slots__ = ()
+
+
+class DoubleNode(_NombresEnIngles, NodoDoble):
+    """
+    Nodo de una lista doblemente enlazada: además del valor y el siguiente
+    nodo, conoce al anterior.
+    """
+    __slots__ = ()
+
+    @property
+    def prev(self):
+        return self.anterior
+
+    @prev.setter
+    def prev(self, node):
+        self.anterior = node
+
+
+class _FachadaEnIngles:
+    """
+    Nombres en inglés comunes a las tres listas de este archivo, sobre el núcleo
+    de NucleoListas: 'head' y 'tail' son el primer y el último nodo (asignarlos
+    no cambia el largo guardado).
+    """
+    Nodo = Node
+
+    @property
+    def head(self):
+        return self.primero
+
+    @head.setter
+    def head(self, node):
+        self.primero = node
+
+    @property
+    def tail(self):
+        return self.ultimo
+
+    @tail.setter
+    def tail(self, node):
+        self.ultimo = node
+
+    def insert_at_beginning(self, value):
+        """
+        Inserta un nuevo nodo al principio de la lista, en O(1), y lo retorna.
+        """
+        return self.agregar_inicio(value)
+
+    def insert_at_end(self, value):
+        """
+        Inserta un nuevo nodo al final de la lista, en O(1), y lo retorna.
+        """
+        return self.agregar_final(value)
+
+    def delete_node(self, value):
+        """
+        Elimina el primer nodo que contiene el valor especificado.
+        """
+        self.eliminar(value)
+
+    @classmethod
+    def from_iterable(cls, values):
+        """
+        Crea una lista con los valores dados, enlazando la cadena una sola vez.
+        """
+        return cls.desde_iterable(values)
+
+    def extend(self, values):
+        """
+        Inserta todos los valores al final de la lista, enlazándolos una sola vez.
+        """
+        self.extender(values)
+
+    def to_list(self):
+        """
+        Retorna una lista de Python con los valores, en orden.
+        """
+        return self.a_lista()
+
+    def delete_all(self, predicate):
+        """
+        Elimina en una sola pasada los nodos cuyo valor cumple el predicado.
+        Retorna cuántos eliminó.
+        """
+        return self.eliminar_todos(predicate)
+
+
+class LinkedList(_FachadaEnIngles, NucleoSimple):
+    """
+    Clase que representa una lista enlazada simple.
+    Proporciona métodos para insertar, eliminar y recorrer la lista.
+    """
+
+    def traverse(self):
+        """
+        Recorre la lista y muestra los valores de los nodos.
+        """
+        for value in self:
+            print(value)
+
+
+class DoublyLinkedList(_FachadaEnIngles, NucleoDoble):
+    """
+    Clase que representa una lista enlazada doble.
+    Proporciona métodos para insertar, eliminar y recorrer la lista en ambas direcciones.
+    Con los nodos que retornan los métodos insert_* se puede usar también
+    eliminar_nodo, insertar_despues y mover_al_frente, todos O(1).
+    """
+    Nodo = DoubleNode
+
+    def traverse_forward(self):
+        """
+        Recorre la lista de principio a fin y muestra los valores de los nodos.
+        """
+        for value in self:
+            print(value)
+
+    def traverse_backward(self):
+        """
+        Recorre la lista de fin a principio y muestra los valores de los nodos.
+        """
+        for value in self.iter_inverso():
+            print(value)
+
+
+class CircularLinkedList(_FachadaEnIngles, NucleoCircularSimple):
+    """
+    Clase que representa una lista enlazada circular.
+    Proporciona métodos para insertar, eliminar y recorrer la lista.
+    Como guarda el último nodo, insertar al principio o al final ya no
+    requiere dar la vuelta completa a la lista.
+    """
+
+    def traverse(self):
+        """
+        Recorre la lista y muestra los valores de los nodos.
+        """
+        for value in self:
+            print(value)
+
+
+if __name__ == "__main__":
+    # Prueba de lista enlazada simple
+    print("Lista Enlazada Simple:")
+    simple_list = LinkedList()
+    simple_list.insert_at_beginning(3)
+    simple_list.insert_at_beginning(2)
+    simple_list.insert_at_beginning(1)
+    simple_list.insert_at_end(4)
+    simple_list.traverse()
+    print("Eliminando nodo con valor 3...")
+    simple_list.delete_node(3)
+    simple_list.traverse()
+    print()
+
+    # Prueba de lista enlazada doble
+    print("Lista Enlazada Doble:")
+    double_list = DoublyLinkedList()
+    double_list.insert_at_beginning(3)
+    double_list.insert_at_beginning(2)
+    double_list.insert_at_beginning(1)
+    double_list.insert_at_end(4)
+    double_list.traverse_forward()
+    print("Recorriendo en orden inverso:")
+    double_list.traverse_backward()
+    print("Eliminando nodo con valor 2...")
+    double_list.delete_node(2)
+    double_list.traverse_forward()
+    print()
+
+    # Prueba de lista enlazada circular
+    print("Lista Enlazada Circular:")
+    circular_list = CircularLinkedList()
+    circular_list.insert_at_beginning(3)
+    circular_list.insert_at_beginning(2)
+    circular_list.insert_at_beginning(1)
+    circular_list.insert_at_end(4)
+    circular_list.traverse()
+    print("Eliminando nodo con valor 2...")
+    circular_list.delete_node(2)
+    circular_list.traverse()
@@ -0,0 +1,119 @@
+# Parte común de los directorios de personas (DirectorioSimple y
+# DirectorioListaCircularDoble). Cada directorio define su propio
+# Nodo y la forma de enlazarlo: agregarPersona, agregarPersonas y
+# personas. Aquí quedan los índices (RUT -> nodo y nombres) y todo
+# lo que sólo depende de ellos o de personas().
+
+import os
+
+from .DirectorioBinario import UMBRAL_PARALELO, DirectorioMapeado, buscarEnProcesos, guardarBinario, leerCSV
+from .IndiceNombres import IndiceNombres
+
+
+class NucleoDirectorio:
+
+    # Constructor: -> NucleoDirectorio
+    # 'primero' es el primer nodo de la lista (None si está
+    # vacía), 'indice' el diccionario RUT -> nodo y 'nombres'
+    # el índice ordenado de nombres.
+    def __init__(self):
+        self.primero = None
+        self.indice = {}
+        self.nombres = IndiceNombres()
+
+    # renombrar: Nodo str -> None
+    # cambia el nombre guardado en el nodo de una persona,
+    # manteniendo al día el índice de nombres.
+
+    def renombrar(self, nodo, nombre):
+        self.nombres.quitar(nodo.nombre, nodo.rut)
+        nodo.nombre = nombre
+        self.nombres.agregar(nombre, nodo.rut)
+
+    # cargar_csv: str int bool -> None
+    # agrega las personas de un CSV con columnas nombre,rut.
+    # El archivo se lee en bloques de 'tamano_bloque' filas y
+    # cada bloque se agrega con agregarPersonas.
+    # ej: cargar_csv("personas.csv")
+
+    def cargar_csv(self, ruta, tamano_bloque=100_000, encabezado=False):
+        for bloque in leerCSV(ruta, tamano_bloque, encabezado):
+            self.agregarPersonas(bloque)
+
+    # guardar: str -> None
+    # escribe el directorio en formato binario compacto
+    # (ver DirectorioBinario), que luego se abre con abrir().
+    # ej: guardar("personas.bin")
+
+    def guardar(self, ruta):
+        guardarBinario(ruta, self.personas())
+
+    # abrir: str -> DirectorioMapeado
+    # abre un archivo escrito con guardar() mapeándolo en
+    # memoria. El resultado responde buscarPersona de inmediato,
+    # sin reconstruir la lista, pero es de sólo lectura.
+    # ej: Directorio.abrir("personas.bin").buscarPersona(123)
+
+    @staticmethod
+    def abrir(ruta):
+        return DirectorioMapeado(ruta)
+
+    # buscarPersona: int -> str
+    # busca en el directorio una persona del rut 
+    # ingresado y devuelte su nombre. Usa el índice,
+    # así que no depende del largo de la lista: O(1).
+    # ej: buscarPersona(12345678) entrega "Juan José"
+
+    def buscarPersona(self, rut):
+        aux = self.indice.get(rut)
+
+        if aux is None:
+            return "RUT NO ENCONTRADO"
+
+        return aux.nombre
+
+    # buscarPersonas: iterable de int int int -> lista de str
+    # como buscarPersona, pero para muchos RUTs de una vez;
+    # entrega los nombres en el mismo orden que 'ruts'.
+    # Con pocos RUTs usa el índice directamente. Si son al
+    # menos 'umbral' y más que las personas del directorio,
+    # los reparte entre 'procesos' procesos (por omisión uno
+    # por CPU) con buscarEnProcesos, que comparte con ellos
+    # una copia binaria del directorio en vez de enviárselo.
+    # Si algún RUT no cabe en esa copia (no es un entero de
+    # 64 bits, por ejemplo "12345678-9"), busca con el índice.
+    # ej: buscarPersonas([123, 999]) entrega ["Juan", "RUT NO ENCONTRADO"]
+
+    def buscarPersonas(self, ruts, procesos=None, umbral=UMBRAL_PARALELO):
+        if not isinstance(ruts, (list, tuple)):
+            ruts = list(ruts)
+        procesos = procesos or os.cpu_count() or 1
+        if len(ruts) >= max(umbral, len(self.indice)) and procesos > 1:
+            try:
+                return buscarEnProcesos(self.personas(), ruts, procesos)
+            except (TypeError, OverflowError, ValueError):
+                pass
+
+        obtener = self.indice.get
+        nombres = []
+        for rut in ruts:
+            aux = obtener(rut)
+            nombres.append("RUT NO ENCONTRADO" if aux is None else aux.nombre)
+        return nombres
+
+    # buscarPorNombre: str bool -> iterador de (str, int)
+    # entrega los (nombre, rut) de las personas con ese nombre,
+    # sin distinguir tildes ni mayúsculas ("Mónica" y "monica"
+    # coinciden). Con exacto=True exige la misma escritura.
+    # ej: buscarPorNombre("monica") entrega ("Mónica", 66777)
+
+    def buscarPorNombre(self, nombre, exacto=False):
+        return self.nombres.buscar(nombre, exacto)
+
+    # buscarPorPrefijo: str -> iterador de (str, int)
+    # entrega en orden alfabético los (nombre, rut) de las
+    # personas cuyo nombre comienza con el prefijo indicado.
+    # ej: buscarPorPrefijo("ri") entrega ("Richard", 444555)
+
+    def buscarPorPrefijo(self, prefijo):
+        return self.nombres.buscarPrefijo(prefijo)
@@ -0,0 +1,499 @@
+"""
+Núcleo común de las listas enlazadas del repositorio.
+
+Las listas de ListaEn, ListaDoEn, ListasCiEn, ListasCiDob y ListasRepaso son
+fachadas delgadas sobre estas cuatro clases, que comparten nodos con __slots__,
+un puntero al último nodo y el largo guardado, de modo que len(), agregar al
+final y agregar al inicio cuestan O(1) en todas las variantes. Las operaciones
+masivas (desde_iterable, extender, a_lista y eliminar_todos) recorren o arman
+la cadena de nodos en un solo ciclo.
+"""
+
+
+class NodoSimple:
+    """
+    Nodo de una lista simplemente enlazada: un dato y el enlace al siguiente nodo.
+    """
+    __slots__ = ("dato", "siguiente")
+
+    def __init__(self, dato):
+        self.dato = dato
+        self.siguiente = None
+
+
+class NodoDoble:
+    """
+    Nodo de una lista doblemente enlazada: un dato y los enlaces al siguiente
+    y al anterior nodo.
+    """
+    __slots__ = ("dato", "siguiente", "anterior")
+
+    def __init__(self, dato):
+        self.dato = dato
+        self.siguiente = None
+        self.anterior = None
+
+
+class NucleoSimple:
+    """
+    Lista simplemente enlazada con punteros al primer y al último nodo y largo guardado.
+    Las subclases cambian 'Nodo' para usar otro tipo de nodo y 'circular' para
+    que el último nodo apunte de vuelta al primero.
+    Los métodos que agregan datos retornan el nodo creado, que sirve como
+    identificador para insertar_despues (O(1)), eliminar_nodo y mover_al_frente;
+    estos dos buscan primero el nodo anterior, así que cuestan O(n) salvo para
+    el primer nodo (NucleoDoble los hace O(1)).
+    """
+    Nodo = NodoSimple
+    circular = False
+
+    def __init__(self):
+        self.primero = None
+        self.ultimo = None
+        self.tamano = 0
+
+    @classmethod
+    def desde_iterable(cls, datos):
+        """
+        Crea una lista con los 'datos' en el mismo orden, usando extender.
+        """
+        lista = cls()
+        lista.extender(datos)
+        return lista
+
+    def __len__(self):
+        """
+        Retorna la cantidad de elementos, en O(1).
+        """
+        return self.tamano
+
+    def __iter__(self):
+        """
+        Recorre los datos desde el primero hasta el último. Avanza exactamente
+        'tamano' nodos, así que sirve igual para las listas circulares.
+        """
+        nodo = self.primero
+        for _ in range(self.tamano):
+            yield nodo.dato
+            nodo = nodo.siguiente
+
+    def esta_vacia(self):
+        """
+        Retorna True si la lista no tiene elementos.
+        """
+        return self.tamano == 0
+
+    def obtener_cabeza(self):
+        """
+        Retorna el primer dato de la lista, o None si está vacía.
+        """
+        return self.primero.dato if self.primero else None
+
+    def obtener_cola(self):
+        """
+        Retorna el último dato de la lista, o None si está vacía.
+        """
+        return self.ultimo.dato if self.ultimo else None
+
+    def agregar_final(self, dato):
+        """
+        Agrega 'dato' al final de la lista en O(1), gracias al puntero al último nodo.
+        Retorna el nodo creado.
+        """
+        nuevo_nodo = self.Nodo(dato)
+        if self.tamano == 0:
+            self.primero = nuevo_nodo
+        else:
+            self.ultimo.siguiente = nuevo_nodo
+        self.ultimo = nuevo_nodo
+        if self.circular:
+            nuevo_nodo.siguiente = self.primero
+        self.tamano += 1
+        return nuevo_nodo
+
+    def agregar_inicio(self, dato):
+        """
+        Agrega 'dato' al inicio de la lista en O(1). Retorna el nodo creado.
+        """
+        nuevo_nodo = self.Nodo(dato)
+        if self.tamano == 0:
+            self.ultimo = nuevo_nodo
+        else:
+            nuevo_nodo.siguiente = self.primero
+        self.primero = nuevo_nodo
+        if self.circular:
+            self.ultimo.siguiente = nuevo_nodo
+        self.tamano += 1
+        return nuevo_nodo
+
+    def extender(self, datos):
+        """
+        Agrega todos los 'datos' al final de la lista, en orden. Arma la cadena
+        de nodos en un solo ciclo, sin pasar por agregar_final, y la enlaza a la
+        lista una sola vez.
+        """
+        Nodo = self.Nodo
+        centinela = cola = Nodo(None)
+        n = 0
+        for dato in datos:
+            cola.siguiente = cola = Nodo(dato)
+            n += 1
+        if n:
+            self._enlazar_cadena(centinela.siguiente, cola, n)
+
+    def _enlazar_cadena(self, cabeza, cola, n):
+        """
+        Método auxiliar que enlaza al final de la lista una cadena de 'n' nodos
+        ya unidos entre sí, que va de 'cabeza' a 'cola'.
+        """
+        if self.tamano == 0:
+            self.primero = cabeza
+        else:
+            self.ultimo.siguiente = cabeza
+        self.ultimo = cola
+        cola.siguiente = self.primero if self.circular else None
+        self.tamano += n
+
+    def a_lista(self):
+        """
+        Retorna una lista de Python con los datos, desde el primero hasta el último.
+        """
+        datos = [None] * self.tamano
+        nodo = self.primero
+        for i in range(self.tamano):
+            datos[i] = nodo.dato
+            nodo = nodo.siguiente
+        return datos
+
+    def existe(self, dato):
+        """
+        Retorna True si 'dato' está en la lista.
+        """
+        nodo = self.primero
+        for _ in range(self.tamano):
+            if nodo.dato == dato:
+                return True
+            nodo = nodo.siguiente
+        return False
+
+    def eliminar(self, dato):
+        """
+        Elimina el primer nodo que contiene 'dato'. Retorna True si lo encontró.
+        """
+        # En una lista circular el anterior del primero es el último.
+        anterior = self.ultimo if self.circular else None
+        nodo = self.primero
+        for _ in range(self.tamano):
+            if nodo.dato == dato:
+                self._desenlazar(anterior, nodo)
+                return True
+            anterior, nodo = nodo, nodo.siguiente
+        return False
+
+    def eliminar_todos(self, predicado):
+        """
+        Elimina, en una sola pasada, todos los nodos cuyo dato cumple
+        'predicado(dato)'. Retorna cuántos eliminó.
+        """
+        primero = ultimo = None
+        quedan = 0
+        nodo = self.primero
+        for _ in range(self.tamano):
+            siguiente = nodo.siguiente
+            if not predicado(nodo.dato):
+                if ultimo is None:
+                    primero = nodo
+                else:
+                    ultimo.siguiente = nodo
+                ultimo = nodo
+                quedan += 1
+            nodo = siguiente
+        eliminados = self.tamano - quedan
+        if ultimo is not None:
+            ultimo.siguiente = primero if self.circular else None
+        self.primero, self.ultimo, self.tamano = primero, ultimo, quedan
+        return eliminados
+
+    def insertar_despues(self, nodo, dato):
+        """
+        Agrega 'dato' justo después de 'nodo' en O(1). Retorna el nodo creado.
+        """
+        if nodo is self.ultimo:
+            return self.agregar_final(dato)
+        nuevo_nodo = self.Nodo(dato)
+        nuevo_nodo.siguiente = nodo.siguiente
+        nodo.siguiente = nuevo_nodo
+        self.tamano += 1
+        return nuevo_nodo
+
+    def eliminar_nodo(self, nodo):
+        """
+        Saca 'nodo' de la lista y retorna su dato. Busca el nodo anterior, así
+        que cuesta O(n), salvo si 'nodo' es el primero.
+        """
+        self._desenlazar(self._anterior(nodo), nodo)
+        nodo.siguiente = None
+        return nodo.dato
+
+    def mover_al_frente(self, nodo):
+        """
+        Mueve 'nodo' al inicio de la lista, sin crear nodos nuevos. Busca el
+        nodo anterior, así que cuesta O(n).
+        """
+        if nodo is self.primero:
+            return
+        self._desenlazar(self._anterior(nodo), nodo)
+        nodo.siguiente = self.primero
+        self.primero = nodo
+        if self.circular:
+            self.ultimo.siguiente = nodo
+        self.tamano += 1
+
+    def _anterior(self, nodo):
+        """
+        Método auxiliar que retorna el nodo que precede a 'nodo' (None si es el
+        primero de una lista lineal). Lanza ValueError si no está en la lista.
+        """
+        anterior = self.ultimo if self.circular else None
+        actual = self.primero
+        for _ in range(self.tamano):
+            if actual is nodo:
+                return anterior
+            anterior, actual = actual, actual.siguiente
+        raise ValueError("el nodo no está en la lista")
+
+    def _desenlazar(self, anterior, nodo):
+        """
+        Método auxiliar que saca 'nodo' de la lista, sabiendo que 'anterior' es el
+        nodo que lo precede (None si 'nodo' es el primero de una lista lineal).
+        """
+        if self.tamano == 1:
+            self.primero = None
+            self.ultimo = None
+        else:
+            if anterior is not None:
+                anterior.siguiente = nodo.siguiente
+            if nodo is self.primero:
+                self.primero = nodo.siguiente
+            if nodo is self.ultimo:
+                self.ultimo = anterior
+        self.tamano -= 1
+
+    def imprimir_lista(self):
+        """
+        Muestra los datos de la lista en una sola línea.
+        """
+        if self.tamano == 0:
+            print("La lista está vacía.")
+        else:
+            print(*self, end=" ")
+            print()
+
+
+class NucleoCircularSimple(NucleoSimple):
+    """
+    Lista circular simplemente enlazada: el último nodo apunta al primero.
+    """
+    circular = True
+
+
+class NucleoDoble(NucleoSimple):
+    """
+    Lista doblemente enlazada: cada nodo conoce también a su anterior, así que
+    un nodo se puede desenlazar sin buscar a su predecesor.
+    Los métodos que agregan datos retornan el nodo creado, que sirve como
+    identificador para eliminar_nodo, insertar_despues y mover_al_frente, todos
+    O(1). Un nodo sólo es válido mientras siga en la lista de la que salió.
+    """
+    Nodo = NodoDoble
+
+    def agregar_final(self, dato):
+        """
+        Agrega 'dato' al final de la lista en O(1). Retorna el nodo creado.
+        """
+        nuevo_nodo = self.Nodo(dato)
+        self._enlazar_final(nuevo_nodo)
+        return nuevo_nodo
+
+    def agregar_inicio(self, dato):
+        """
+        Agrega 'dato' al inicio de la lista en O(1). Retorna el nodo creado.
+        """
+        nuevo_nodo = self.Nodo(dato)
+        self._enlazar_inicio(nuevo_nodo)
+        return nuevo_nodo
+
+    def extender(self, datos):
+        """
+        Agrega todos los 'datos' al final de la lista, en orden, armando la
+        cadena (con sus enlaces hacia atrás) en un solo ciclo y enlazándola una vez.
+        """
+        Nodo = self.Nodo
+        centinela = cola = Nodo(None)
+        n = 0
+        for dato in datos:
+            nodo = Nodo(dato)
+            nodo.anterior = cola
+            cola.siguiente = nodo
+            cola = nodo
+            n += 1
+        if n:
+            self._enlazar_cadena(centinela.siguiente, cola, n)
+
+    def _enlazar_cadena(self, cabeza, cola, n):
+        """
+        Método auxiliar que enlaza al final de la lista una cadena de 'n' nodos
+        ya unidos en ambos sentidos, que va de 'cabeza' a 'cola'.
+        """
+        cabeza.anterior = self.ultimo
+        super()._enlazar_cadena(cabeza, cola, n)
+        if self.circular:
+            self.primero.anterior = cola
+
+    def eliminar_todos(self, predicado):
+        """
+        Elimina, en una sola pasada, todos los nodos cuyo dato cumple
+        'predicado(dato)'. Retorna cuántos eliminó. Los nodos eliminados
+        quedan sueltos, igual que con eliminar_nodo.
+        """
+        primero = ultimo = None
+        quedan = 0
+        nodo = self.primero
+        for _ in range(self.tamano):
+            siguiente = nodo.siguiente
+            if predicado(nodo.dato):
+                nodo.siguiente = None
+                nodo.anterior = None
+            else:
+                nodo.anterior = ultimo
+                if ultimo is None:
+                    primero = nodo
+                else:
+                    ultimo.siguiente = nodo
+                ultimo = nodo
+                quedan += 1
+            nodo = siguiente
+        eliminados = self.tamano - quedan
+        if ultimo is not None:
+            if self.circular:
+                ultimo.siguiente = primero
+                primero.anterior = ultimo
+            else:
+                ultimo.siguiente = None
+        self.primero, self.ultimo, self.tamano = primero, ultimo, quedan
+        return eliminados
+
+    def insertar_despues(self, nodo, dato):
+        """
+        Agrega 'dato' justo después de 'nodo' en O(1). Retorna el nodo creado.
+        """
+        if nodo is self.ultimo:
+            return self.agregar_final(dato)
+        nuevo_nodo = self.Nodo(dato)
+        siguiente = nodo.siguiente
+        nuevo_nodo.anterior = nodo
+        nuevo_nodo.siguiente = siguiente
+        siguiente.anterior = nuevo_nodo
+        nodo.siguiente = nuevo_nodo
+        self.tamano += 1
+        return nuevo_nodo
+
+    def eliminar_nodo(self, nodo):
+        """
+        Saca 'nodo' de la lista en O(1), sin buscarlo, y retorna su dato.
+        """
+        self._desenlazar(None, nodo)
+        nodo.siguiente = None
+        nodo.anterior = None
+        return nodo.dato
+
+    def mover_al_frente(self, nodo):
+        """
+        Mueve 'nodo' al inicio de la lista en O(1), sin crear nodos nuevos.
+        """
+        if nodo is not self.primero:
+            self._desenlazar(None, nodo)
+            self._enlazar_inicio(nodo)
+
+    def _enlazar_final(self, nodo):
+        """
+        Método auxiliar que enlaza 'nodo' (ya creado y suelto) al final de la lista.
+        """
+        if self.tamano == 0:
+            self.primero = nodo
+            if self.circular:
+                nodo.siguiente = nodo
+                nodo.anterior = nodo
+            else:
+                nodo.siguiente = None
+                nodo.anterior = None
+        else:
+            nodo.anterior = self.ultimo
+            if self.circular:
+                nodo.siguiente = self.primero
+                self.primero.anterior = nodo
+            else:
+                nodo.siguiente = None
+            self.ultimo.siguiente = nodo
+        self.ultimo = nodo
+        self.tamano += 1
+
+    def _enlazar_inicio(self, nodo):
+        """
+        Método auxiliar que enlaza 'nodo' (ya creado y suelto) al inicio de la lista.
+        """
+        if self.tamano == 0:
+            self.ultimo = nodo
+            if self.circular:
+                nodo.siguiente = nodo
+                nodo.anterior = nodo
+            else:
+                nodo.siguiente = None
+                nodo.anterior = None
+        else:
+            nodo.siguiente = self.primero
+            if self.circular:
+                nodo.anterior = self.ultimo
+                self.ultimo.siguiente = nodo
+            else:
+                nodo.anterior = None
+            self.primero.anterior = nodo
+        self.primero = nodo
+        self.tamano += 1
+
+    def _desenlazar(self, anterior, nodo):
+        """
+        Método auxiliar que saca 'nodo' de la lista usando sus propios enlaces;
+        'anterior' se ignora porque el nodo ya lo conoce.
+        """
+        if self.tamano == 1:
+            self.primero = None
+            self.ultimo = None
+        else:
+            anterior, siguiente = nodo.anterior, nodo.siguiente
+            if anterior is not None:
+                anterior.siguiente = siguiente
+            if siguiente is not None:
+                siguiente.anterior = anterior
+            if nodo is self.primero:
+                self.primero = siguiente
+            if nodo is self.ultimo:
+                self.ultimo = anterior
+        self.tamano -= 1
+
+    def iter_inverso(self):
+        """
+        Recorre los datos desde el último hasta el primero.
+        """
+        nodo = self.ultimo
+        for _ in range(self.tamano):
+            yield nodo.dato
+            nodo = nodo.anterior
+
+
+class NucleoCircularDoble(NucleoDoble):
+    """
+    Lista circular doblemente enlazada: el último nodo apunta al primero y el
+    primero tiene al último como anterior.
+    """
+    circular = True
@@ -0,0 +1,15 @@
+"""
+Listas enlazadas, directorios de personas y cachés.
+
+El paquete no importa sus módulos por adelantado, porque varios definen
+clases con el mismo nombre (ListaCircularSimple en ListasCiEn y ListasCiDob,
+Directorio en DirectorioSimple y DirectorioListaCircularDoble). Se importa
+cada módulo por su nombre:
+
+    from CodigosModelo.ListaEn import ListaEnlazada
+    from CodigosModelo.Cache import CacheLRU
+
+Las demostraciones se ejecutan como módulos, por ejemplo:
+
+    python -m CodigosModelo.ListasRepaso
+"""
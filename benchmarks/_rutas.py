@@ -0,0 +1,12 @@
+"""
+Agrega la raíz del repositorio a sys.path, para que los benchmarks, que se
+ejecutan como scripts desde esta carpeta, puedan importar los paquetes
+Arboles y CodigosModelo.
+"""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
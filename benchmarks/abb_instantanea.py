@@ -0,0 +1,120 @@
+"""
+Mide las instantáneas de ArbolBinarioBusqueda (guardar/cargar y ArbolMapeado)
+contra la forma anterior de persistir un árbol: guardar recorrido_preorden() y
+volver a insertar cada clave al cargar.
+
+Para cada tamaño se usan dos árboles: uno con claves aleatorias (altura
+O(log n)) y uno degenerado, con la forma que deja insertar claves ordenadas (altura n).
+En éste reinsertar cuesta O(n²) y sólo se mide hasta MAX_REINSERCION claves, y
+cada búsqueda cuesta O(n), así que se hacen a lo más PASOS_BUSQUEDA / n.
+Se informa:
+- bytes por nodo del archivo,
+- nodos por segundo al guardar, al cargar y al reinsertar,
+- el tiempo de abrir el archivo con ArbolMapeado y búsquedas por segundo sobre él.
+
+Cada carga se compara con el árbol original (mismo preorden), así que el
+benchmark también verifica la ida y vuelta.
+
+Uso: python benchmarks/abb_instantanea.py [n1 n2 ...]
+"""
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from Arboles import ABBConGrafico as abb
+
+MAX_REINSERCION = 20_000
+BUSQUEDAS = 100_000
+PASOS_BUSQUEDA = 10_000_000
+
+
+def cronometrar(funcion):
+    """
+    Llama a 'funcion()' con el recolector de basura detenido.
+    Retorna (segundos, resultado).
+    """
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        resultado = funcion()
+        return time.perf_counter() - inicio, resultado
+    finally:
+        gc.enable()
+
+
+def arbol_aleatorio(n):
+    claves = random.Random(0).sample(range(10 * n), n)
+    arbol = abb.ArbolBinarioBusqueda()
+    for clave in claves:
+        arbol.insertar(clave)
+    return arbol
+
+
+def arbol_degenerado(n):
+    """
+    Árbol con las claves 0..n-1 en que cada nodo es hijo derecho del anterior.
+    Se arma directamente, porque insertarlas una a una costaría O(n²).
+    """
+    arbol = abb.ArbolBinarioBusqueda()
+    for clave in reversed(range(n)):
+        nodo = abb.Nodo(clave)
+        nodo.derecho = arbol.raiz
+        nodo.tamano = nodo.altura = n - clave
+        arbol.raiz = nodo
+    return arbol
+
+
+def reinsertar(preorden):
+    arbol = abb.ArbolBinarioBusqueda()
+    for clave in preorden:
+        arbol.insertar(clave)
+    return arbol
+
+
+def medir(nombre, arbol, ruta):
+    n = arbol.numero_total_nodos()
+    preorden = arbol.recorrido_preorden()
+
+    segundos_guardar, _ = cronometrar(lambda: arbol.guardar(ruta))
+    segundos_cargar, cargado = cronometrar(lambda: abb.ArbolBinarioBusqueda.cargar(ruta))
+    assert cargado.recorrido_preorden() == preorden
+    del cargado
+    if nombre == "aleatorio" or n <= MAX_REINSERCION:
+        segundos_reinsertar, _ = cronometrar(lambda: reinsertar(preorden))
+        reinsercion = f"{n / segundos_reinsertar:>14,.0f}"
+    else:
+        reinsercion = f"{'(omitido)':>14}"
+
+    segundos_abrir, mapeado = cronometrar(lambda: abb.ArbolMapeado(ruta))
+    cantidad = max(1, min(BUSQUEDAS, PASOS_BUSQUEDA // arbol.altura()))
+    consultas = random.Random(1).choices(preorden, k=cantidad)
+    buscar = mapeado.buscar
+    segundos_buscar, _ = cronometrar(lambda: [buscar(clave) for clave in consultas])
+    mapeado.cerrar()
+
+    print(f"{nombre:<11}{n:>12,}{os.path.getsize(ruta) / n:>8.1f}"
+          f"{n / segundos_guardar:>14,.0f}{n / segundos_cargar:>14,.0f}{reinsercion}"
+          f"{segundos_abrir * 1e6:>10.0f}{len(consultas) / segundos_buscar:>14,.0f}", flush=True)
+
+
+def main():
+    tamanos = [int(n) for n in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    ruta = os.path.join(tempfile.mkdtemp(), "arbol.abbp")
+    print(f"{'árbol':<11}{'n':>12}{'B/nodo':>8}{'guardar/s':>14}{'cargar/s':>14}"
+          f"{'reinsertar/s':>14}{'abrir µs':>10}{'buscar/s':>14}")
+    for n in tamanos:
+        for nombre, construir in (("aleatorio", arbol_aleatorio), ("degenerado", arbol_degenerado)):
+            arbol = construir(n)
+            medir(nombre, arbol, ruta)
+            del arbol
+            gc.collect()
+    os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
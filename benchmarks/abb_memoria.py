@@ -0,0 +1,80 @@
+"""
+Mide la memoria por clave de cada forma de almacenar un árbol de búsqueda binaria.
+
+Uso: python benchmarks/abb_memoria.py [n]      (por omisión n = 1_000_000)
+
+Se comparan:
+- nodos con __dict__ (como era 'Nodo' antes de usar __slots__), como referencia;
+- 'ArbolBinarioBusqueda', cuyos nodos usan __slots__;
+- 'ArbolCompacto', con las claves e índices de los hijos en arreglos 'array'.
+
+Las claves se crean antes de medir, así que los objetos int no se cuentan en
+los árboles de nodos; el árbol compacto, en cambio, copia cada clave en su arreglo.
+"""
+import random
+import sys
+import tracemalloc
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from Arboles import ABBConGrafico as abb
+
+
+class NodoConDict:
+    """
+    Nodo equivalente a 'Nodo' pero sin __slots__, con un __dict__ por instancia.
+    """
+
+    def __init__(self, dato):
+        self.dato = dato
+        self.izquierdo = None
+        self.derecho = None
+        self.tamano = 1
+        self.altura = 1
+
+
+def memoria(construir):
+    """
+    Retorna los bytes que quedan asignados después de llamar a 'construir()'
+    y el objeto que construyó (para que siga vivo mientras se mide).
+    """
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    resultado = construir()
+    usados = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    return usados, resultado
+
+
+def arbol_con_dict(datos):
+    """
+    Construye un 'ArbolBinarioBusqueda' cuyos nodos tienen __dict__, sustituyendo
+    temporalmente la clase 'Nodo' del módulo.
+    """
+    original = abb.Nodo
+    abb.Nodo = NodoConDict
+    try:
+        return abb.ArbolBinarioBusqueda.desde_ordenados(datos)
+    finally:
+        abb.Nodo = original
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    datos = sorted(random.sample(range(10 * n), n))
+    variantes = [
+        ("Nodo con __dict__", lambda: arbol_con_dict(datos)),
+        ("Nodo con __slots__", lambda: abb.ArbolBinarioBusqueda.desde_ordenados(datos)),
+        ("ArbolCompacto (array)", lambda: abb.ArbolCompacto.desde_ordenados(datos)),
+    ]
+    print(f"Memoria para {n} claves enteras")
+    print(f"{'almacenamiento':<25}{'MB':>10}{'bytes/clave':>14}")
+    for nombre, construir in variantes:
+        usados, arbol = memoria(construir)
+        assert arbol.numero_total_nodos() == n
+        print(f"{nombre:<25}{usados / 2**20:>10.1f}{usados / n:>14.1f}")
+        del arbol
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Compara las operaciones iterativas de ArbolBinarioBusqueda con las versiones
+recursivas originales, con datos aleatorios y ordenados.
+
+Uso: python benchmarks/abb_recursivo_vs_iterativo.py [n]
+
+Con datos ordenados el árbol degenera en una lista, así que las versiones
+recursivas sólo se miden hasta un tamaño que no supere el límite de recursión
+de Python; las iterativas se miden además con el tamaño completo.
+"""
+import random
+import sys
+import time
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from Arboles import ABBConGrafico as abb
+
+
+class ArbolRecursivo(abb.ArbolBinarioBusqueda):
+    """
+    Árbol con las implementaciones recursivas originales, usado como referencia.
+    """
+
+    def _insertar(self, dato, nodo):
+        if dato < nodo.dato:
+            if nodo.izquierdo is None:
+                nodo.izquierdo = abb.Nodo(dato)
+            else:
+                self._insertar(dato, nodo.izquierdo)
+        else:
+            if nodo.derecho is None:
+                nodo.derecho = abb.Nodo(dato)
+            else:
+                self._insertar(dato, nodo.derecho)
+
+    def _buscar(self, dato, nodo):
+        if nodo is None:
+            return False
+        elif dato == nodo.dato:
+            return True
+        elif dato < nodo.dato:
+            return self._buscar(dato, nodo.izquierdo)
+        else:
+            return self._buscar(dato, nodo.derecho)
+
+    def _recorrido_preorden(self, nodo):
+        if nodo is None:
+            return []
+        resultado = [nodo.dato]
+        resultado.extend(self._recorrido_preorden(nodo.izquierdo))
+        resultado.extend(self._recorrido_preorden(nodo.derecho))
+        return resultado
+
+    def _recorrido_inorden(self, nodo):
+        if nodo is None:
+            return []
+        resultado = self._recorrido_inorden(nodo.izquierdo)
+        resultado.append(nodo.dato)
+        resultado.extend(self._recorrido_inorden(nodo.derecho))
+        return resultado
+
+    def _recorrido_postorden(self, nodo):
+        if nodo is None:
+            return []
+        resultado = self._recorrido_postorden(nodo.izquierdo)
+        resultado.extend(self._recorrido_postorden(nodo.derecho))
+        resultado.append(nodo.dato)
+        return resultado
+
+    def _numero_total_nodos(self, nodo):
+        if nodo is None:
+            return 0
+        return 1 + self._numero_total_nodos(nodo.izquierdo) + self._numero_total_nodos(nodo.derecho)
+
+    def _altura(self, nodo):
+        if nodo is None:
+            return 0
+        return 1 + max(self._altura(nodo.izquierdo), self._altura(nodo.derecho))
+
+
+def medir(clase, datos):
+    """
+    Retorna un diccionario operación -> segundos para un árbol de tipo 'clase'
+    construido con 'datos'.
+    """
+    tiempos = {}
+    arbol = clase()
+    inicio = time.perf_counter()
+    for dato in datos:
+        arbol.insertar(dato)
+    tiempos["insertar"] = time.perf_counter() - inicio
+
+    operaciones = [
+        ("buscar", lambda: [arbol.buscar(dato) for dato in datos]),
+        ("preorden", arbol.recorrido_preorden),
+        ("inorden", arbol.recorrido_inorden),
+        ("postorden", arbol.recorrido_postorden),
+        ("numero_total_nodos", arbol.numero_total_nodos),
+        ("altura", arbol.altura),
+    ]
+    for nombre, operacion in operaciones:
+        inicio = time.perf_counter()
+        operacion()
+        tiempos[nombre] = time.perf_counter() - inicio
+    return tiempos
+
+
+def comparar(titulo, datos):
+    """
+    Imprime una tabla con los tiempos recursivos, iterativos y la aceleración.
+    """
+    recursivo = medir(ArbolRecursivo, datos)
+    iterativo = medir(abb.ArbolBinarioBusqueda, datos)
+    print(f"\n{titulo} (n = {len(datos)})")
+    print(f"{'operación':<20}{'recursivo (s)':>15}{'iterativo (s)':>15}{'aceleración':>13}")
+    for nombre in recursivo:
+        r, i = recursivo[nombre], iterativo[nombre]
+        print(f"{nombre:<20}{r:>15.4f}{i:>15.4f}{r / i if i else float('inf'):>12.2f}x")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    comparar("Datos aleatorios", random.sample(range(10 * n), n))
+    # Con datos ordenados cada nivel de recursión es un nodo del árbol.
+    n_ordenado = min(n, sys.getrecursionlimit() - 100)
+    comparar("Datos ordenados", list(range(n_ordenado)))
+
+    # Insertar en un árbol degenerado es O(n²), así que se limita el tamaño.
+    datos = list(range(min(n, 10_000)))
+    arbol = abb.ArbolBinarioBusqueda()
+    inicio = time.perf_counter()
+    for dato in datos:
+        arbol.insertar(dato)
+    arbol.recorrido_inorden()
+    print(f"\nÁrbol degenerado de {len(datos)} nodos con la versión iterativa: "
+          f"altura {arbol.altura()}, {time.perf_counter() - inicio:.2f} s (sin RecursionError)")
+
+
+if __name__ == "__main__":
+    main()
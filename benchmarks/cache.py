@@ -0,0 +1,112 @@
+"""
+Compara CacheLRU y CacheLFU con functools.lru_cache y con un LRU hecho sobre
+OrderedDict. Todos atienden la misma secuencia de claves con distribución de
+Zipf (pocas claves muy pedidas y una cola larga) en el patrón "buscar y, si
+falla, calcular y guardar". Informa operaciones por segundo y tasa de aciertos.
+
+Uso: python benchmarks/cache.py [operaciones] [capacidad] [claves distintas]
+"""
+import functools
+import random
+import sys
+import time
+from collections import OrderedDict
+from itertools import accumulate
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from CodigosModelo import Cache as cache
+
+
+def claves_zipf(operaciones, distintas, s=1.1, semilla=0):
+    """
+    Retorna 'operaciones' claves entre 0 y distintas - 1 con distribución de Zipf.
+    """
+    pesos = accumulate(1 / (k ** s) for k in range(1, distintas + 1))
+    return random.Random(semilla).choices(range(distintas), cum_weights=list(pesos), k=operaciones)
+
+
+def calcular(clave):
+    """
+    Valor que se guarda en el caché; barato, para medir sólo el caché.
+    """
+    return clave * 2
+
+
+class LRUOrderedDict:
+    """
+    LRU de referencia: un OrderedDict que se reordena con move_to_end.
+    """
+
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self.datos = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave, defecto=None):
+        valor = self.datos.get(clave, defecto)
+        if valor is defecto:
+            self.fallos += 1
+        else:
+            self.aciertos += 1
+            self.datos.move_to_end(clave)
+        return valor
+
+    def guardar(self, clave, valor):
+        self.datos[clave] = valor
+        self.datos.move_to_end(clave)
+        if len(self.datos) > self.capacidad:
+            self.datos.popitem(last=False)
+
+
+def medir_objeto(c, claves):
+    """
+    Atiende 'claves' con un caché que tiene obtener/guardar.
+    Retorna (segundos, tasa de aciertos).
+    """
+    obtener, guardar = c.obtener, c.guardar
+    inicio = time.perf_counter()
+    for clave in claves:
+        valor = obtener(clave)
+        if valor is None:
+            guardar(clave, calcular(clave))
+    transcurrido = time.perf_counter() - inicio
+    return transcurrido, c.aciertos / (c.aciertos + c.fallos)
+
+
+def medir_lru_cache(capacidad, claves):
+    """
+    Atiende 'claves' con una función decorada con functools.lru_cache.
+    """
+    envuelta = functools.lru_cache(maxsize=capacidad)(calcular)
+    inicio = time.perf_counter()
+    for clave in claves:
+        envuelta(clave)
+    transcurrido = time.perf_counter() - inicio
+    info = envuelta.cache_info()
+    return transcurrido, info.hits / (info.hits + info.misses)
+
+
+def main():
+    operaciones = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    capacidad = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    distintas = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+    claves = claves_zipf(operaciones, distintas)
+    print(f"{operaciones} operaciones, capacidad {capacidad}, {distintas} claves distintas (Zipf)")
+    print(f"{'caché':<22}{'ops/s':>14}{'aciertos':>11}")
+    casos = [
+        ("functools.lru_cache", lambda: medir_lru_cache(capacidad, claves)),
+        ("OrderedDict (LRU)", lambda: medir_objeto(LRUOrderedDict(capacidad), claves)),
+        ("CacheLRU", lambda: medir_objeto(cache.CacheLRU(capacidad), claves)),
+        ("CacheLFU", lambda: medir_objeto(cache.CacheLFU(capacidad), claves)),
+        ("CacheLRU con TTL", lambda: medir_objeto(cache.CacheLRU(capacidad, ttl=3600), claves)),
+        ("CacheLRU con bytes", lambda: medir_objeto(cache.CacheLRU(capacidad, max_bytes=1 << 20), claves)),
+    ]
+    for nombre, medir in casos:
+        segundos, tasa = medir()
+        print(f"{nombre:<22}{operaciones / segundos:>14,.0f}{tasa:>11.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compara tres formas de responder un lote de consultas sobre ArbolBinarioBusqueda
+(buscar) y Directorio (buscarPersona):
+
+- una por una, llamando a buscar/buscarPersona en un ciclo;
+- en bloque en un solo proceso: buscar_muchos/buscarPersonas con procesos=1;
+- en bloque repartido entre varios procesos, que abren una instantánea binaria
+  compartida (ArbolMapeado o DirectorioMapeado).
+
+La mitad de las claves consultadas existen. Los tiempos del camino paralelo
+incluyen escribir la instantánea y levantar los procesos, que es lo que paga
+quien lo usa. Informa millones de consultas por segundo.
+
+Uso: python benchmarks/consultas_masivas.py [n] [consultas] [procesos ...]
+     (por omisión 1 millón de datos, 2 millones de consultas y 2 y 4 procesos)
+"""
+import gc
+import random
+import sys
+import time
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from Arboles import ArbolBinarioBusqueda
+from CodigosModelo.DirectorioSimple import Directorio
+
+
+def cronometrar(funcion):
+    """
+    Llama a 'funcion()' con el recolector de basura detenido.
+    Retorna (segundos, resultado).
+    """
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        resultado = funcion()
+        return time.perf_counter() - inicio, resultado
+    finally:
+        gc.enable()
+
+
+def medir(nombre, una, muchas, consultas, cantidades):
+    """
+    Mide las tres formas y verifica que todas respondan lo mismo.
+    'una' responde una consulta; 'muchas(consultas, procesos, umbral)' un lote.
+    """
+    segundos, esperado = cronometrar(lambda: [una(clave) for clave in consultas])
+    fila = f"{nombre:<22}{len(consultas) / segundos / 1e6:>10.2f}"
+    segundos, respuesta = cronometrar(lambda: muchas(consultas, 1, 0))
+    assert respuesta == esperado
+    fila += f"{len(consultas) / segundos / 1e6:>10.2f}"
+    for procesos in cantidades:
+        segundos, respuesta = cronometrar(lambda: muchas(consultas, procesos, 0))
+        assert respuesta == esperado
+        fila += f"{len(consultas) / segundos / 1e6:>10.2f}"
+    print(fila, flush=True)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000
+    cantidades = [int(p) for p in sys.argv[3:]] or [2, 4]
+    azar = random.Random(0)
+    claves = azar.sample(range(2 * n), n)
+    consultas = azar.choices(range(2 * n), k=m)
+
+    print(f"{n:,} datos, {m:,} consultas (millones de consultas/s)")
+    print(f"{'estructura':<22}{'una a una':>10}{'lote':>10}"
+          + "".join(f"{f'{p} proc.':>10}" for p in cantidades))
+
+    arbol = ArbolBinarioBusqueda.desde_iterable(claves)
+    medir("ArbolBinarioBusqueda", arbol.buscar,
+          lambda c, p, u: arbol.buscar_muchos(c, procesos=p, umbral=u), consultas, cantidades)
+    del arbol
+
+    directorio = Directorio()
+    directorio.agregarPersonas((f"Persona {rut}", rut) for rut in claves)
+    medir("Directorio", directorio.buscarPersona,
+          lambda c, p, u: directorio.buscarPersonas(c, procesos=p, umbral=u), consultas, cantidades)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Prueba de carga multihilo para DirectorioConcurrente: mide cuántas búsquedas
+por segundo se atienden con 1, 4 y 16 hilos lectores mientras un hilo escritor
+agrega lotes de personas en segundo plano. Al final verifica que todas las
+personas agregadas se puedan encontrar y que el anillo quedó bien enlazado.
+
+Uso: python benchmarks/directorio_concurrente.py [n] [segundos]
+"""
+import random
+import sys
+import threading
+import time
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from CodigosModelo import DirectorioConcurrente as concurrente
+
+
+def lector(directorio, ruts, detener, contador, posicion):
+    """
+    Busca RUTs al azar hasta que se active 'detener' y anota cuántas
+    búsquedas hizo en contador[posicion].
+    """
+    buscar = directorio.buscarPersona
+    elegir = random.Random(posicion).choice
+    hechas = 0
+    while not detener.is_set():
+        for _ in range(1000):
+            buscar(elegir(ruts))
+        hechas += 1000
+    contador[posicion] = hechas
+
+
+def escritor(directorio, siguiente_rut, detener, tamano_lote=1000):
+    """
+    Agrega lotes de personas nuevas hasta que se active 'detener'.
+    Retorna, a través de la lista 'siguiente_rut', el primer RUT no usado.
+    """
+    rut = siguiente_rut[0]
+    while not detener.is_set():
+        directorio.agregarPersonas((f"Persona {r}", r) for r in range(rut, rut + tamano_lote))
+        rut += tamano_lote
+    siguiente_rut[0] = rut
+
+
+def medir(n, hilos, segundos):
+    """
+    Retorna las búsquedas por segundo con 'hilos' lectores y un escritor.
+    """
+    directorio = concurrente.DirectorioConcurrente()
+    directorio.agregarPersonas((f"Persona {rut}", rut) for rut in range(n))
+    ruts = list(range(n))
+    detener = threading.Event()
+    contador = [0] * hilos
+    siguiente_rut = [n]
+    trabajadores = [
+        threading.Thread(target=lector, args=(directorio, ruts, detener, contador, i))
+        for i in range(hilos)
+    ]
+    trabajadores.append(threading.Thread(target=escritor, args=(directorio, siguiente_rut, detener)))
+    inicio = time.perf_counter()
+    for hilo in trabajadores:
+        hilo.start()
+    time.sleep(segundos)
+    detener.set()
+    for hilo in trabajadores:
+        hilo.join()
+    transcurrido = time.perf_counter() - inicio
+
+    total = siguiente_rut[0]
+    faltantes = sum(1 for rut in range(total) if directorio.buscarPersona(rut) == "RUT NO ENCONTRADO")
+    en_anillo = sum(1 for _ in directorio.personas())
+    assert faltantes == 0 and en_anillo == total, (faltantes, en_anillo, total)
+    return sum(contador) / transcurrido, total - n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    print(f"Directorio con {n} personas, {segundos} s por medición, 1 escritor en segundo plano")
+    print(f"{'hilos':>6}{'búsquedas/s':>16}{'agregadas':>12}")
+    for hilos in (1, 4, 16):
+        por_segundo, agregadas = medir(n, hilos, segundos)
+        print(f"{hilos:>6}{por_segundo:>16,.0f}{agregadas:>12}")
+
+
+if __name__ == "__main__":
+    main()
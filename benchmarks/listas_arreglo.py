@@ -0,0 +1,104 @@
+"""
+Compara ListaArreglo (arreglos paralelos con lista libre) con las listas de
+nodos objeto (ListaDoEn y ListasRepaso.DoublyLinkedList) en cargas con mucha
+rotación de elementos:
+
+- cola: agregar al final y sacar del inicio
+- pila: agregar al final y sacar del final
+- azar: eliminar nodos al azar por su identificador y agregar otros
+
+Informa operaciones por segundo, recolecciones del recolector de basura
+durante la medición y bytes por elemento de la lista resultante.
+
+Uso: python benchmarks/listas_arreglo.py [n] [operaciones]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from CodigosModelo import ListaArreglo as arreglo
+from CodigosModelo import ListaDoEn as doble
+from CodigosModelo import ListasRepaso as repaso
+
+LISTAS = [
+    ("ListaDoEn", doble.ListaDolementeenlazada),
+    ("DoublyLinkedList", repaso.DoublyLinkedList),
+    ("ListaArreglo", arreglo.ListaArreglo),
+]
+
+
+def cola(lista, nodos, operaciones, elegir):
+    for dato in range(operaciones):
+        lista.agregar_final(dato)
+        lista.eliminar_nodo(lista.primero)
+
+
+def pila(lista, nodos, operaciones, elegir):
+    for dato in range(operaciones):
+        lista.agregar_final(dato)
+        lista.eliminar_nodo(lista.ultimo)
+
+
+def azar(lista, nodos, operaciones, elegir):
+    n = len(nodos)
+    for dato in range(operaciones):
+        i = elegir(n)
+        lista.eliminar_nodo(nodos[i])
+        nodos[i] = lista.agregar_final(dato)
+
+
+CARGAS = [("cola", cola), ("pila", pila), ("azar", azar)]
+
+
+def medir(cls, carga, n, operaciones):
+    """
+    Llena una lista con n elementos y aplica 'carga'. Retorna
+    (operaciones por segundo, recolecciones de basura).
+    """
+    lista = cls()
+    nodos = [lista.agregar_final(dato) for dato in range(n)]
+    elegir = random.Random(0).randrange
+    recolecciones = sum(estadistica["collections"] for estadistica in gc.get_stats())
+    inicio = time.perf_counter()
+    carga(lista, nodos, operaciones, elegir)
+    transcurrido = time.perf_counter() - inicio
+    recolecciones = sum(estadistica["collections"] for estadistica in gc.get_stats()) - recolecciones
+    return operaciones / transcurrido, recolecciones
+
+
+def bytes_por_elemento(cls, n):
+    """
+    Retorna la memoria reservada por una lista de n enteros, dividida por n.
+    """
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    lista = cls()
+    for dato in range(n):
+        lista.agregar_final(dato + 1_000_000)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lista
+    return (despues - antes) / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    operaciones = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    print(f"{n} elementos, {operaciones} operaciones por carga")
+    print(f"{'lista':<18}" + "".join(f"{nombre + ' ops/s':>16}{'gc':>6}" for nombre, _ in CARGAS) + f"{'B/elem':>9}")
+    for nombre, cls in LISTAS:
+        fila = f"{nombre:<18}"
+        for _, carga in CARGAS:
+            por_segundo, recolecciones = medir(cls, carga, n, operaciones)
+            fila += f"{por_segundo:>16,.0f}{recolecciones:>6}"
+        fila += f"{bytes_por_elemento(cls, n):>9.1f}"
+        print(fila)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compara las operaciones masivas del núcleo de listas con su equivalente
+elemento por elemento, para cada variante de lista:
+
+- extender(datos) contra un ciclo de agregar_final
+- a_lista() contra list(lista)
+- eliminar_todos(predicado) contra llamar eliminar(dato) por cada coincidencia
+  (sólo con n chico, porque cada eliminar es O(n))
+
+Uso: python benchmarks/listas_masivas.py [n]
+"""
+import gc
+import sys
+import time
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from CodigosModelo import NucleoListas as nucleo
+
+VARIANTES = [
+    ("simple", nucleo.NucleoSimple),
+    ("circular simple", nucleo.NucleoCircularSimple),
+    ("doble", nucleo.NucleoDoble),
+    ("circular doble", nucleo.NucleoCircularDoble),
+]
+
+
+def cronometrar(funcion):
+    """
+    Retorna los segundos que toma llamar a 'funcion' una vez. Como timeit,
+    apaga el recolector de basura mientras mide, para que sus pasadas sobre
+    millones de nodos vivos no se mezclen con el costo de la operación.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        funcion()
+        return time.perf_counter() - inicio
+    finally:
+        gc.enable()
+
+
+def uno_a_uno(cls, n):
+    lista = cls()
+    agregar = lista.agregar_final
+    for dato in range(n):
+        agregar(dato)
+    return lista
+
+
+def eliminar_uno_a_uno(lista, datos):
+    for dato in datos:
+        lista.eliminar(dato)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_eliminar = min(n, 20_000)
+    print(f"n = {n} (eliminar con n = {n_eliminar}, borrando 1 de cada 10)")
+    print(f"{'lista':<17}{'agregar_final':>14}{'extender':>10}{'list()':>9}{'a_lista':>9}{'eliminar':>10}{'eliminar_todos':>16}")
+    for nombre, cls in VARIANTES:
+        t_uno = cronometrar(lambda: uno_a_uno(cls, n))
+        lista = cls()
+        t_extender = cronometrar(lambda: lista.extender(range(n)))
+        t_list = cronometrar(lambda: list(lista))
+        t_a_lista = cronometrar(lista.a_lista)
+
+        chica = cls.desde_iterable(range(n_eliminar))
+        t_eliminar = cronometrar(lambda: eliminar_uno_a_uno(chica, range(0, n_eliminar, 10)))
+        chica = cls.desde_iterable(range(n_eliminar))
+        t_todos = cronometrar(lambda: chica.eliminar_todos(lambda dato: dato % 10 == 0))
+        print(f"{nombre:<17}{t_uno:>13.3f}s{t_extender:>9.3f}s{t_list:>8.3f}s{t_a_lista:>8.3f}s"
+              f"{t_eliminar:>9.3f}s{t_todos:>15.4f}s")
+
+
+if __name__ == "__main__":
+    main()
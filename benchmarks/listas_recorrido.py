@@ -0,0 +1,61 @@
+"""
+Mide el rendimiento de recorrido de existe() buscando un dato ausente (el peor
+caso: revisa todos los elementos) en ListaDesenrollada y en las listas de un
+nodo por elemento (ListaEn, ListaDoEn y ListasCiEn), con 10 mil, 1 millón y
+10 millones de elementos. Informa millones de elementos revisados por segundo.
+
+Cada lista se construye y se libera antes de pasar a la siguiente; con 10
+millones de elementos una lista de nodos ocupa cerca de 1 GB.
+
+Uso: python benchmarks/listas_recorrido.py [n1 n2 ...]
+"""
+import gc
+import sys
+import time
+
+import _rutas  # noqa: F401  (agrega la raíz del repositorio a sys.path)
+
+from CodigosModelo import ListaEn as simple
+from CodigosModelo import ListaDoEn as doble
+from CodigosModelo import ListasCiEn as circular
+from CodigosModelo import ListaDesenrollada as desenrollada
+
+LISTAS = [
+    ("ListaEn", simple.ListaEnlazada),
+    ("ListaDoEn", doble.ListaDolementeenlazada),
+    ("ListasCiEn", circular.ListaCircularSimple),
+    ("ListaDesenrollada", desenrollada.ListaDesenrollada),
+]
+
+
+def recorridos_por_segundo(lista, n, segundos_minimos=0.5):
+    """
+    Repite existe(-1) hasta juntar 'segundos_minimos' y retorna elementos
+    revisados por segundo.
+    """
+    repeticiones = 0
+    inicio = time.perf_counter()
+    while True:
+        assert not lista.existe(-1)
+        repeticiones += 1
+        transcurrido = time.perf_counter() - inicio
+        if transcurrido >= segundos_minimos:
+            return repeticiones * n / transcurrido
+
+
+def main():
+    tamanos = [int(n) for n in sys.argv[1:]] or [10_000, 1_000_000, 10_000_000]
+    print(f"{'lista':<19}" + "".join(f"{n:>14,}" for n in tamanos) + "   (millones de elementos/s)")
+    for nombre, cls in LISTAS:
+        fila = f"{nombre:<19}"
+        for n in tamanos:
+            lista = cls.desde_iterable(range(n))
+            gc.collect()
+            fila += f"{recorridos_por_segundo(lista, n) / 1e6:>14.1f}"
+            del lista
+            gc.collect()
+        print(fila, flush=True)
+
+
+if __name__ == "__main__":
+    main()
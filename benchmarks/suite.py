@@ -0,0 +1,350 @@
+"""
+Suite de benchmarks de todas las estructuras del repositorio.
+
+Mide insertar, buscar, eliminar y recorrer en los árboles (ArbolBinarioBusqueda,
+ArbolAVL, ArbolCompacto), en todas las listas y en los directorios, para cada
+tamaño de entrada y cada distribución de claves:
+
+- aleatoria:  una permutación al azar de 0..n-1
+- ordenada:   0, 1, ..., n-1
+- inversa:    n-1, ..., 1, 0
+- duplicados: n claves al azar entre 0 y n/10 (cada una se repite ~10 veces)
+
+Cada resultado es el tiempo por operación (el mejor de varias repeticiones).
+Las operaciones que recorren la estructura completa por cada clave (buscar o
+eliminar en una lista, insertar ordenado en un ABB que degenera en lista) se
+miden con una muestra de claves, o se omiten cuando el costo total supera el
+límite de pasos, y el resultado se marca como muestreado u omitido.
+
+Los resultados se guardan en JSON, y 'comparar' marca las regresiones entre
+dos corridas:
+
+    python benchmarks/suite.py correr -o base.json
+    python benchmarks/suite.py correr -o nuevo.json
+    python benchmarks/suite.py comparar base.json nuevo.json --umbral 0.15
+
+'correr' admite --tamanos (por omisión 1e3, 1e4 y 1e5; con --completo llega a
+1e7), --distribuciones, --estructuras, --operaciones y --repeticiones.
+'comparar' termina con código de salida 1 si hay regresiones.
+"""
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from _rutas import RAIZ
+
+from Arboles.ABBConGrafico import ArbolAVL, ArbolBinarioBusqueda, ArbolCompacto
+from CodigosModelo import DirectorioListaCircularDoble, DirectorioSimple
+from CodigosModelo.DirectorioConcurrente import DirectorioConcurrente
+from CodigosModelo.ListaArreglo import ListaArreglo
+from CodigosModelo.ListaDesenrollada import ListaDesenrollada
+from CodigosModelo.ListaDoEn import ListaDolementeenlazada
+from CodigosModelo.ListaEn import ListaEnlazada
+from CodigosModelo.ListasCiDob import ListaCircularSimple as ListaCircularDoble
+from CodigosModelo.ListasCiEn import ListaCircularSimple
+from CodigosModelo.ListasRepaso import CircularLinkedList, DoublyLinkedList, LinkedList
+
+TAMANOS = [1_000, 10_000, 100_000]
+TAMANOS_COMPLETOS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DISTRIBUCIONES = ["aleatoria", "ordenada", "inversa", "duplicados"]
+OPERACIONES = ["insertar", "buscar", "eliminar", "recorrer"]
+
+# Máximo de pasos elementales (nodos visitados) que puede costar una medición;
+# a unos 20 millones de pasos por segundo, menos de un segundo.
+LIMITE_PASOS = 10_000_000
+
+
+def generar_claves(distribucion, n, semilla=0):
+    """
+    Retorna una lista de n claves enteras con la distribución indicada.
+    """
+    azar = random.Random(semilla)
+    if distribucion == "aleatoria":
+        claves = list(range(n))
+        azar.shuffle(claves)
+        return claves
+    if distribucion == "ordenada":
+        return list(range(n))
+    if distribucion == "inversa":
+        return list(range(n - 1, -1, -1))
+    if distribucion == "duplicados":
+        return [azar.randrange(max(1, n // 10)) for _ in range(n)]
+    raise ValueError(f"distribución desconocida: {distribucion}")
+
+
+class Caso:
+    """
+    Describe cómo medir una estructura: cómo construirla insertando claves de a
+    una y cómo buscar, eliminar y recorrer. 'costo' estima cuántos pasos cuesta
+    una operación sobre una estructura de n claves con esa distribución, para
+    decidir si se mide con todas las claves, con una muestra o se omite.
+    """
+
+    def __init__(self, nombre, crear, insertar, buscar, eliminar, recorrer, costo):
+        self.nombre = nombre
+        self.crear = crear
+        self.insertar = insertar
+        self.buscar = buscar
+        self.eliminar = eliminar
+        self.recorrer = recorrer
+        self.costo = costo
+
+
+def costo_arbol(operacion, distribucion, n):
+    # insertar ordenado degenera el ABB en una lista: cada operación es O(n)
+    if distribucion in ("ordenada", "inversa"):
+        return n
+    return max(1, n.bit_length())
+
+
+def costo_balanceado(operacion, distribucion, n):
+    return max(1, n.bit_length())
+
+
+def costo_lista(operacion, distribucion, n):
+    return n if operacion in ("buscar", "eliminar") else 1
+
+
+def costo_desenrollada(operacion, distribucion, n):
+    # buscar y eliminar recorren bloques de 64 con 'in', a velocidad de C
+    return n // 16 if operacion in ("buscar", "eliminar") else 1
+
+
+def costo_directorio(operacion, distribucion, n):
+    return 1
+
+
+def caso_lista(nombre, cls, agregar="agregar_final", eliminar="eliminar", costo=costo_lista):
+    return Caso(
+        nombre,
+        crear=cls,
+        insertar=lambda lista: getattr(lista, agregar),
+        buscar=lambda lista: lista.existe,
+        eliminar=lambda lista: getattr(lista, eliminar),
+        recorrer=iter,
+        costo=costo,
+    )
+
+
+def caso_directorio(nombre, cls):
+    return Caso(
+        nombre,
+        crear=cls,
+        insertar=lambda directorio: lambda rut: directorio.agregarPersona(f"Persona {rut}", rut),
+        buscar=lambda directorio: directorio.buscarPersona,
+        eliminar=None,  # los directorios no tienen eliminación: no se mide
+        recorrer=lambda directorio: directorio.personas(),
+        costo=costo_directorio,
+    )
+
+
+CASOS = [
+    Caso("ArbolBinarioBusqueda", ArbolBinarioBusqueda, lambda a: a.insertar, lambda a: a.buscar,
+         lambda a: a.eliminar, lambda a: a.iter_inorden(), costo_arbol),
+    Caso("ArbolAVL", ArbolAVL, lambda a: a.insertar, lambda a: a.buscar,
+         lambda a: a.eliminar, lambda a: a.iter_inorden(), costo_balanceado),
+    Caso("ArbolCompacto", ArbolCompacto, lambda a: a.insertar, lambda a: a.buscar,
+         None, lambda a: a.iter_inorden(), costo_arbol),
+    caso_lista("ListaEn", ListaEnlazada),
+    caso_lista("ListaDoEn", ListaDolementeenlazada, agregar="agregaralfinal"),
+    caso_lista("ListasCiEn", ListaCircularSimple),
+    caso_lista("ListasCiDob", ListaCircularDoble),
+    caso_lista("LinkedList", LinkedList, agregar="insert_at_end", eliminar="delete_node"),
+    caso_lista("DoublyLinkedList", DoublyLinkedList, agregar="insert_at_end", eliminar="delete_node"),
+    caso_lista("CircularLinkedList", CircularLinkedList, agregar="insert_at_end", eliminar="delete_node"),
+    caso_lista("ListaArreglo", ListaArreglo),
+    caso_lista("ListaDesenrollada", ListaDesenrollada, costo=costo_desenrollada),
+    caso_directorio("DirectorioSimple", DirectorioSimple.Directorio),
+    caso_directorio("DirectorioListaCircularDoble", DirectorioListaCircularDoble.Directorio),
+    caso_directorio("DirectorioConcurrente", DirectorioConcurrente),
+]
+
+
+def cronometrar(funcion):
+    """
+    Retorna los segundos que toma funcion(), con el recolector de basura
+    apagado durante la medición, como timeit.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        funcion()
+        return time.perf_counter() - inicio
+    finally:
+        gc.enable()
+
+
+def construir(caso, claves):
+    estructura = caso.crear()
+    insertar = caso.insertar(estructura)
+    for clave in claves:
+        insertar(clave)
+    return estructura
+
+
+def medir(caso, operacion, claves, distribucion, repeticiones):
+    """
+    Mide 'operacion' del caso sobre 'claves'. Retorna un diccionario con el
+    tiempo por operación, o None si la operación no aplica o se omite.
+    """
+    n = len(claves)
+    if operacion == "eliminar" and caso.eliminar is None:
+        return None
+    insertar_caro = caso.costo("insertar", distribucion, n) * n > LIMITE_PASOS
+    if operacion == "insertar":
+        # si construir todo es muy caro se mide con un prefijo de las claves,
+        # que conserva la forma de la distribución
+        probadas = claves[:math.isqrt(2 * LIMITE_PASOS)] if insertar_caro else claves
+    elif insertar_caro:
+        # no se puede construir la estructura dentro del límite
+        return None
+    elif operacion == "recorrer":
+        probadas = claves
+    else:
+        muestra = min(n, LIMITE_PASOS // caso.costo(operacion, distribucion, n))
+        probadas = claves if muestra == n else random.Random(1).sample(claves, muestra)
+    if not probadas:
+        return None
+
+    tiempos = []
+    estructura = None
+    for _ in range(repeticiones):
+        if operacion == "insertar":
+            tiempos.append(cronometrar(lambda: construir(caso, probadas)))
+            continue
+        if estructura is None or operacion == "eliminar":
+            estructura = construir(caso, claves)
+        if operacion == "buscar":
+            buscar = caso.buscar(estructura)
+            tiempos.append(cronometrar(lambda: [buscar(clave) for clave in probadas]))
+        elif operacion == "eliminar":
+            eliminar = caso.eliminar(estructura)
+            tiempos.append(cronometrar(lambda: [eliminar(clave) for clave in probadas]))
+        else:
+            tiempos.append(cronometrar(lambda: sum(1 for _ in caso.recorrer(estructura))))
+    del estructura
+    operaciones = len(probadas)
+    return {
+        "estructura": caso.nombre,
+        "operacion": operacion,
+        "distribucion": distribucion,
+        "n": n,
+        "operaciones": operaciones,
+        "muestreado": operaciones < n,
+        "ns_por_operacion": min(tiempos) / operaciones * 1e9,
+    }
+
+
+def commit_actual():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def correr(argumentos):
+    tamanos = argumentos.tamanos or (TAMANOS_COMPLETOS if argumentos.completo else TAMANOS)
+    casos = [caso for caso in CASOS if not argumentos.estructuras or caso.nombre in argumentos.estructuras]
+    resultados = []
+    for n in tamanos:
+        for distribucion in argumentos.distribuciones:
+            claves = generar_claves(distribucion, n)
+            for caso in casos:
+                for operacion in argumentos.operaciones:
+                    if operacion == "eliminar" and caso.eliminar is None:
+                        continue
+                    resultado = medir(caso, operacion, claves, distribucion, argumentos.repeticiones)
+                    if resultado is None:
+                        print(f"{caso.nombre:<30}{operacion:<10}{distribucion:<12}{n:>11,}  omitido (muy caro)")
+                        continue
+                    resultados.append(resultado)
+                    marca = " (muestra)" if resultado["muestreado"] else ""
+                    print(f"{caso.nombre:<30}{operacion:<10}{distribucion:<12}{n:>11,}"
+                          f"{resultado['ns_por_operacion']:>12,.0f} ns/op{marca}", flush=True)
+    datos = {
+        "meta": {
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": commit_actual(),
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "repeticiones": argumentos.repeticiones,
+            "limite_pasos": LIMITE_PASOS,
+        },
+        "resultados": resultados,
+    }
+    with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=1, ensure_ascii=False)
+    print(f"\n{len(resultados)} resultados guardados en {argumentos.salida}")
+
+
+def comparar(argumentos):
+    def indexar(ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        return {
+            (r["estructura"], r["operacion"], r["distribucion"], r["n"]): r for r in datos["resultados"]
+        }
+
+    base, nuevo = indexar(argumentos.base), indexar(argumentos.nuevo)
+    regresiones = 0
+    print(f"{'estructura':<30}{'operación':<10}{'distribución':<13}{'n':>11}{'base':>10}{'nuevo':>10}{'cambio':>9}")
+    for clave in sorted(base.keys() & nuevo.keys()):
+        antes, despues = base[clave]["ns_por_operacion"], nuevo[clave]["ns_por_operacion"]
+        cambio = despues / antes - 1
+        if cambio > argumentos.umbral:
+            estado = "  REGRESIÓN"
+            regresiones += 1
+        elif cambio < -argumentos.umbral:
+            estado = "  mejora"
+        else:
+            estado = ""
+        if estado or argumentos.todo:
+            estructura, operacion, distribucion, n = clave
+            print(f"{estructura:<30}{operacion:<10}{distribucion:<13}{n:>11,}{antes:>10,.0f}{despues:>10,.0f}"
+                  f"{cambio:>+9.1%}{estado}")
+    faltantes = len(base.keys() ^ nuevo.keys())
+    if faltantes:
+        print(f"\n{faltantes} mediciones están sólo en una de las dos corridas.")
+    print(f"\n{regresiones} regresiones (umbral {argumentos.umbral:.0%}).")
+    if regresiones:
+        sys.exit(1)
+
+
+def main():
+    analizador = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ordenes = analizador.add_subparsers(dest="orden", required=True)
+
+    orden_correr = ordenes.add_parser("correr", help="ejecuta la suite y guarda los resultados en JSON")
+    orden_correr.add_argument("-o", "--salida", default="benchmarks.json")
+    orden_correr.add_argument("--tamanos", type=lambda texto: int(float(texto)), nargs="+")
+    orden_correr.add_argument("--completo", action="store_true", help="tamaños de 1e3 a 1e7")
+    orden_correr.add_argument("--distribuciones", nargs="+", choices=DISTRIBUCIONES, default=DISTRIBUCIONES)
+    orden_correr.add_argument("--estructuras", nargs="+", choices=[caso.nombre for caso in CASOS])
+    orden_correr.add_argument("--operaciones", nargs="+", choices=OPERACIONES, default=OPERACIONES)
+    orden_correr.add_argument("--repeticiones", type=int, default=3)
+    orden_correr.set_defaults(funcion=correr)
+
+    orden_comparar = ordenes.add_parser("comparar", help="compara dos corridas y marca regresiones")
+    orden_comparar.add_argument("base")
+    orden_comparar.add_argument("nuevo")
+    orden_comparar.add_argument("--umbral", type=float, default=0.10,
+                                help="aumento relativo que cuenta como regresión (0.10 = 10%%)")
+    orden_comparar.add_argument("--todo", action="store_true", help="muestra también lo que no cambió")
+    orden_comparar.set_defaults(funcion=comparar)
+
+    argumentos = analizador.parse_args()
+    argumentos.funcion(argumentos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Verifica que importar cada módulo de los paquetes Arboles y CodigosModelo
+sea barato y no tenga efectos secundarios:
+
+- que tarde menos que el presupuesto (50 ms por omisión),
+- que no cargue matplotlib, networkx ni multiprocessing,
+- que no escriba nada en la salida estándar (no ejecute demostraciones).
+
+Cada módulo se importa en un intérprete nuevo, para medir la importación en
+frío, y se toma el mejor de varios intentos. Termina con código de salida 1 si
+algún módulo no cumple. tests/test_importacion.py verifica con pytest las dos
+últimas condiciones, con 'python -X importtime' y sin medir el tiempo, que
+depende de la carga de la máquina.
+
+Uso: python benchmarks/tiempo_importacion.py [presupuesto_ms] [intentos]
+"""
+import os
+import subprocess
+import sys
+
+from _rutas import RAIZ
+
+PAQUETES = ["Arboles", "CodigosModelo"]
+PROHIBIDOS = ["matplotlib", "networkx", "multiprocessing"]
+PRESUPUESTO = 0.050  # segundos
+INTENTOS = 3
+
+# Se ejecuta en el intérprete hijo: mide la importación e informa en stderr,
+# para que cualquier cosa que aparezca en stdout sea un efecto secundario.
+MEDIR = """
+import sys, time
+inicio = time.perf_counter()
+import {modulo}
+transcurrido = time.perf_counter() - inicio
+cargados = [nombre for nombre in {prohibidos!r} if nombre in sys.modules]
+print(transcurrido, ",".join(cargados), file=sys.stderr)
+"""
+
+
+def modulos():
+    """
+    Retorna los nombres importables de los paquetes y de todos sus módulos.
+    """
+    nombres = []
+    for paquete in PAQUETES:
+        nombres.append(paquete)
+        for archivo in sorted(os.listdir(os.path.join(RAIZ, paquete))):
+            if archivo.endswith(".py") and archivo != "__init__.py":
+                nombres.append(f"{paquete}.{archivo[:-3]}")
+    return nombres
+
+
+def importar(modulo):
+    """
+    Importa 'modulo' en un intérprete nuevo. Retorna (segundos, módulos
+    prohibidos que se cargaron, texto escrito en stdout).
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-c", MEDIR.format(modulo=modulo, prohibidos=PROHIBIDOS)],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    segundos, _, cargados = resultado.stderr.strip().splitlines()[-1].partition(" ")
+    return float(segundos), [nombre for nombre in cargados.split(",") if nombre], resultado.stdout
+
+
+def importados(modulo):
+    """
+    Importa 'modulo' en un intérprete nuevo con 'python -X importtime'.
+    Retorna (nombres de todos los módulos que se importaron, texto escrito en
+    stdout).
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    # cada línea es "import time: propio | acumulado | nombre", con el nombre
+    # sangrado según la profundidad; la primera es el encabezado
+    nombres = [
+        linea.rpartition("|")[2].strip()
+        for linea in resultado.stderr.splitlines()[1:]
+        if linea.startswith("import time:")
+    ]
+    return nombres, resultado.stdout
+
+
+def prohibidos(nombres):
+    """
+    Retorna los nombres de 'nombres' que son paquetes prohibidos o módulos de ellos.
+    """
+    return [nombre for nombre in nombres if nombre.split(".")[0] in PROHIBIDOS]
+
+
+def main():
+    presupuesto = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else PRESUPUESTO
+    intentos = int(sys.argv[2]) if len(sys.argv) > 2 else INTENTOS
+    fallas = 0
+    print(f"{'módulo':<44}{'ms':>8}  estado")
+    for modulo in modulos():
+        mediciones = [importar(modulo) for _ in range(intentos)]
+        segundos = min(medicion[0] for medicion in mediciones)
+        _, cargados, salida = mediciones[0]
+        problemas = []
+        if segundos > presupuesto:
+            problemas.append(f"supera {presupuesto * 1000:.0f} ms")
+        if cargados:
+            problemas.append("carga " + ", ".join(cargados))
+        if salida:
+            problemas.append("escribe en stdout")
+        fallas += bool(problemas)
+        print(f"{modulo:<44}{segundos * 1000:>8.1f}  {'; '.join(problemas) or 'ok'}")
+    if fallas:
+        print(f"\n{fallas} módulo(s) no cumplen.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
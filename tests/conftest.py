@@ -0,0 +1,10 @@
+"""
+Agrega la raíz del repositorio a sys.path, para que las pruebas importen los
+paquetes Arboles y CodigosModelo sin instalarlos (como benchmarks/_rutas.py).
+"""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
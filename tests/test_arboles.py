@@ -0,0 +1,359 @@
+"""
+Pruebas de ArbolBinarioBusqueda y ArbolAVL: inserciones y eliminaciones
+intercaladas al azar (con claves repetidas) contra una lista ordenada de
+referencia, recorridos y consultas sobre un árbol pequeño fijo, y pruebas de
+ArbolCompacto, de las instantáneas y del dibujo.
+"""
+import random
+import sys
+from bisect import bisect_left, insort
+from types import GeneratorType
+
+import pytest
+
+from Arboles import ArbolAVL, ArbolBinarioBusqueda, ArbolCompacto, ArbolMapeado, Nodo
+from Arboles.ABBConGrafico import MAX_PIXELES
+
+CLASES = [ArbolBinarioBusqueda, ArbolAVL]
+
+# árbol fijo de las pruebas de recorridos y consultas; insertado en este orden
+# queda igual en ArbolBinarioBusqueda y en ArbolAVL:
+#            50
+#        30      70
+#      20  40  60  80
+#         35
+FIJO = [50, 30, 70, 20, 40, 60, 80, 35]
+
+
+def arbol_fijo(cls):
+    arbol = cls()
+    for dato in FIJO:
+        arbol.insertar(dato)
+    return arbol
+
+
+def cadena(n):
+    """
+    Retorna un ArbolBinarioBusqueda con los datos 0..n-1 en una cadena hacia la
+    derecha, como la que dejan los datos insertados en orden, armada directamente.
+    """
+    arbol = ArbolBinarioBusqueda()
+    nodos = [Nodo(dato) for dato in range(n)]
+    for nodo, siguiente in zip(nodos, nodos[1:]):
+        nodo.derecho = siguiente
+    for altura, nodo in enumerate(reversed(nodos), 1):
+        nodo.tamano = nodo.altura = altura
+    arbol.raiz = nodos[0] if nodos else None
+    return arbol
+
+
+def verificar_nodos(nodo):
+    """
+    Recorre el subárbol de 'nodo' y verifica que el tamaño y la altura
+    guardados en cada nodo coincidan con los reales. Retorna (tamaño, altura).
+    """
+    if nodo is None:
+        return 0, 0
+    tamano_izquierdo, altura_izquierda = verificar_nodos(nodo.izquierdo)
+    tamano_derecho, altura_derecha = verificar_nodos(nodo.derecho)
+    assert nodo.tamano == 1 + tamano_izquierdo + tamano_derecho
+    assert nodo.altura == 1 + max(altura_izquierda, altura_derecha)
+    return nodo.tamano, nodo.altura
+
+
+def verificar(arbol, referencia):
+    assert arbol.recorrido_inorden() == referencia
+    assert arbol.numero_total_nodos() == len(referencia)
+    tamano, altura = verificar_nodos(arbol.raiz)
+    assert tamano == len(referencia)
+    assert arbol.altura() == altura
+    if isinstance(arbol, ArbolAVL):
+        assert arbol.altura() <= ArbolAVL.altura_maxima(len(referencia))
+
+
+@pytest.mark.parametrize("cls", CLASES)
+@pytest.mark.parametrize("semilla", range(20))
+def test_insertar_y_eliminar_intercalados(cls, semilla):
+    azar = random.Random(semilla)
+    arbol = cls()
+    referencia = []
+    for _ in range(30):
+        for _ in range(azar.randrange(1, 20)):
+            # pocas claves distintas, para que haya muchas repetidas
+            dato = azar.randrange(40)
+            if azar.random() < 0.55:
+                arbol.insertar(dato)
+                insort(referencia, dato)
+            else:
+                i = bisect_left(referencia, dato)
+                estaba = i < len(referencia) and referencia[i] == dato
+                assert arbol.eliminar(dato) is estaba
+                if estaba:
+                    del referencia[i]
+        verificar(arbol, referencia)
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_vaciar_el_arbol(cls):
+    datos = list(range(100)) * 2
+    random.Random(0).shuffle(datos)
+    arbol = cls()
+    for dato in datos:
+        arbol.insertar(dato)
+    referencia = sorted(datos)
+    for dato in datos:
+        assert arbol.eliminar(dato)
+        referencia.remove(dato)
+        verificar(arbol, referencia)
+    assert arbol.raiz is None
+    assert not arbol.eliminar(0)
+
+
+def test_avl_con_datos_ordenados_respeta_la_cota():
+    arbol = ArbolAVL()
+    for n in range(1, 2001):
+        arbol.insertar(n)
+        assert arbol.altura() <= ArbolAVL.altura_maxima(n)
+    verificar(arbol, list(range(1, 2001)))
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_insertar_muchos_en_arbol_vacio_queda_balanceado(cls):
+    arbol = cls()
+    arbol.insertar_muchos(range(2000))
+    verificar(arbol, list(range(2000)))
+    assert arbol.altura() == (2000).bit_length()
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_insertar_muchos_cuenta_la_altura_que_crea_el_lote(cls):
+    # los diez datos caen en el mismo hueco: insertarlos uno a uno haría una cadena
+    arbol = cls()
+    arbol.insertar(100)
+    arbol.insertar_muchos(range(10))
+    verificar(arbol, list(range(10)) + [100])
+    assert arbol.altura() <= 4
+
+
+@pytest.mark.parametrize("cls", CLASES)
+@pytest.mark.parametrize("semilla", range(10))
+def test_insertar_muchos_por_lotes(cls, semilla):
+    azar = random.Random(semilla)
+    arbol = cls()
+    referencia = []
+    for _ in range(10):
+        lote = [azar.randrange(50) for _ in range(azar.randrange(30))]
+        arbol.insertar_muchos(lote)
+        referencia = sorted(referencia + lote)
+        verificar(arbol, referencia)
+
+
+@pytest.mark.parametrize("datos", [
+    [5, -3, 2**63 - 1, -2**63, 0],
+    [0.5, 3, -2.25, 2**53],
+])
+def test_guardar_y_cargar_conservan_las_claves(tmp_path, datos):
+    ruta = tmp_path / "arbol.bin"
+    arbol = ArbolBinarioBusqueda()
+    for dato in datos:
+        arbol.insertar(dato)
+    arbol.guardar(ruta)
+    assert list(ArbolBinarioBusqueda.cargar(ruta).iter_inorden()) == sorted(datos)
+    mapeado = ArbolMapeado(ruta)
+    assert all(mapeado.buscar(dato) for dato in datos)
+    mapeado.cerrar()
+
+
+@pytest.mark.parametrize("datos, tipo", [
+    ([0.5, 2**60 + 1], None),   # un float no representa 2**60 + 1
+    ([1, 2.5], "q"),            # raíz entera, pero hay un real
+    ([1, 2**63], None),         # no cabe en 64 bits
+    (["a", "b"], None),
+])
+def test_guardar_rechaza_claves_que_no_caben_exactamente(tmp_path, datos, tipo):
+    ruta = tmp_path / "arbol.bin"
+    arbol = ArbolBinarioBusqueda()
+    for dato in datos:
+        arbol.insertar(dato)
+    with pytest.raises(ValueError):
+        arbol.guardar(ruta, tipo)
+    assert not ruta.exists()
+
+
+@pytest.mark.parametrize("datos, consultas", [
+    ([0.5, 2**60 + 1, 7], [2**60 + 1, 2**60, 0.5, 7.0, 8]),
+    ([3, 1, 2], [1, 1.5, 2.0, 4]),
+    (["b", "a"], ["a", "c"]),
+])
+def test_buscar_muchos_en_procesos_coincide_con_la_serial(datos, consultas):
+    arbol = ArbolBinarioBusqueda()
+    for dato in datos:
+        arbol.insertar(dato)
+    esperado = [arbol.buscar(consulta) for consulta in consultas]
+    assert arbol.buscar_muchos(consultas, procesos=1) == esperado
+    assert arbol.buscar_muchos(consultas, procesos=2, umbral=1) == esperado
+
+
+def test_mostrar_graficamente_acota_los_pixeles(tmp_path):
+    pytest.importorskip("matplotlib")
+    Image = pytest.importorskip("PIL.Image")
+
+    arbol = cadena(3000)
+    ruta = tmp_path / "arbol.png"
+    arbol.mostrar_graficamente(str(ruta))
+    with Image.open(ruta) as imagen:
+        ancho, alto = imagen.size
+    assert ancho * alto <= MAX_PIXELES
+
+
+def test_operaciones_en_un_arbol_degenerado_no_usan_recursion():
+    # mucho más profundo que el límite de recursión de Python
+    n = 20_000
+    arbol = cadena(n)
+    assert n > sys.getrecursionlimit()
+    assert arbol.buscar(n - 1) and not arbol.buscar(n)
+    assert (arbol.valor_minimo(), arbol.valor_maximo()) == (0, n - 1)
+    assert arbol.recorrido_inorden() == list(range(n))
+    assert arbol.recorrido_preorden() == list(range(n))
+    assert arbol.recorrido_postorden() == list(range(n - 1, -1, -1))
+    arbol.insertar(n)
+    arbol.eliminar(n - 1)
+    arbol.eliminar(0)
+    assert arbol.numero_total_nodos() == n - 1
+    assert arbol.valor_maximo() == n
+    assert arbol.valor_minimo() == 1
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_recorridos_en_profundidad_del_arbol_fijo(cls):
+    arbol = arbol_fijo(cls)
+    assert list(arbol.iter_preorden()) == arbol.recorrido_preorden() == [50, 30, 20, 40, 35, 70, 60, 80]
+    assert list(arbol.iter_inorden()) == arbol.recorrido_inorden() == [20, 30, 35, 40, 50, 60, 70, 80]
+    assert list(arbol.iter_postorden()) == arbol.recorrido_postorden() == [20, 35, 40, 30, 60, 80, 70, 50]
+    assert list(arbol) == sorted(FIJO)
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_recorridos_son_perezosos(cls):
+    arbol = arbol_fijo(cls)
+    for recorrido in (arbol.iter_preorden(), arbol.iter_inorden(), arbol.iter_postorden(), iter(arbol)):
+        assert isinstance(recorrido, GeneratorType)
+    # se puede dejar un recorrido a medias
+    recorrido = arbol.iter_postorden()
+    assert [next(recorrido), next(recorrido)] == [20, 35]
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_recorridos_de_un_arbol_vacio(cls):
+    arbol = cls()
+    assert list(arbol.iter_preorden()) == list(arbol.iter_inorden()) == list(arbol.iter_postorden()) == []
+    assert arbol.recorrido_preorden() == arbol.recorrido_inorden() == arbol.recorrido_postorden() == []
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_recorrido_por_niveles(cls):
+    arbol = arbol_fijo(cls)
+    assert list(arbol.iter_por_niveles()) == arbol.recorrido_por_niveles() == [50, 30, 70, 20, 40, 60, 80, 35]
+    assert list(arbol.iter_por_niveles(por_nivel=True)) == [[50], [30, 70], [20, 40, 60, 80], [35]]
+    vacio = cls()
+    assert vacio.recorrido_por_niveles() == []
+    assert list(vacio.iter_por_niveles(por_nivel=True)) == []
+
+
+def test_recorrido_por_niveles_de_un_arbol_degenerado():
+    arbol = cadena(1000)
+    assert list(arbol.iter_por_niveles(por_nivel=True)) == [[dato] for dato in range(1000)]
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_k_esimo_y_rango(cls):
+    arbol = arbol_fijo(cls)
+    ordenados = sorted(FIJO)
+    assert arbol.numero_total_nodos() == len(FIJO)
+    assert arbol.altura() == 4
+    assert [arbol.k_esimo(k) for k in range(1, len(FIJO) + 1)] == ordenados
+    for k in (0, -1, len(FIJO) + 1):
+        assert arbol.k_esimo(k) is None
+    assert [arbol.rango(dato) for dato in ordenados] == list(range(len(FIJO)))
+    assert (arbol.rango(0), arbol.rango(36), arbol.rango(100)) == (0, 3, len(FIJO))
+    assert all(arbol.k_esimo(arbol.rango(dato) + 1) == dato for dato in FIJO)
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_estadisticas_de_un_arbol_vacio(cls):
+    arbol = cls()
+    assert arbol.numero_total_nodos() == 0
+    assert arbol.altura() == 0
+    assert arbol.k_esimo(1) is None
+    assert arbol.rango(5) == 0
+
+
+@pytest.mark.parametrize("cls", CLASES)
+@pytest.mark.parametrize("desde, hasta, esperado", [
+    (35, 60, [35, 40, 50, 60]),
+    (36, 59, [40, 50]),
+    (0, 100, [20, 30, 35, 40, 50, 60, 70, 80]),
+    (0, 10, []),           # todo el rango bajo el mínimo
+    (90, 100, []),         # todo el rango sobre el máximo
+    (41, 49, []),          # entre dos claves
+    (60, 40, []),          # rango invertido
+    (80, 80, [80]),
+])
+def test_iter_rango(cls, desde, hasta, esperado):
+    assert list(arbol_fijo(cls).iter_rango(desde, hasta)) == esperado
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_piso_techo_minimo_y_maximo(cls):
+    arbol = arbol_fijo(cls)
+    assert [arbol.piso(dato) for dato in (10, 20, 36, 55, 90)] == [None, 20, 35, 50, 80]
+    assert [arbol.techo(dato) for dato in (10, 20, 36, 55, 90)] == [20, 20, 40, 60, None]
+    assert (arbol.valor_minimo(), arbol.valor_maximo()) == (20, 80)
+
+
+@pytest.mark.parametrize("cls", CLASES)
+def test_consultas_en_un_arbol_vacio(cls):
+    arbol = cls()
+    assert list(arbol.iter_rango(0, 100)) == []
+    assert arbol.piso(5) is None and arbol.techo(5) is None
+    assert arbol.valor_minimo() is None and arbol.valor_maximo() is None
+
+
+def test_nodo_no_tiene_dict():
+    assert not hasattr(Nodo(1), "__dict__")
+
+
+def test_arbol_compacto():
+    vacio = ArbolCompacto()
+    assert list(vacio) == [] and vacio.altura() == 0 and vacio.numero_total_nodos() == 0
+    assert vacio.valor_minimo() is None and vacio.valor_maximo() is None
+    assert not vacio.buscar(1)
+
+    arbol = ArbolCompacto()
+    for dato in FIJO:
+        arbol.insertar(dato)
+    assert arbol.recorrido_inorden() == list(arbol) == sorted(FIJO)
+    assert arbol.altura() == 4
+    assert (arbol.valor_minimo(), arbol.valor_maximo()) == (20, 80)
+    assert all(arbol.buscar(dato) for dato in FIJO)
+    assert not any(arbol.buscar(dato) for dato in (0, 36, 100))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 8, 100])
+def test_arbol_compacto_desde_iterable(n):
+    datos = list(range(n))
+    random.Random(n).shuffle(datos)
+    arbol = ArbolCompacto.desde_iterable(datos)
+    assert list(arbol) == sorted(datos)
+    assert arbol.altura() == n.bit_length()
+    assert arbol.numero_total_nodos() == n
+    arbol.insertar(n)
+    assert arbol.buscar(n) and list(arbol)[-1] == n
+
+
+def test_arbol_compacto_de_reales():
+    arbol = ArbolCompacto.desde_iterable([0.5, -1.25, 3.0], tipo="d")
+    assert list(arbol) == [-1.25, 0.5, 3.0]
+    assert arbol.buscar(0.5) and not arbol.buscar(0.25)
+    with pytest.raises(TypeError):
+        ArbolCompacto().insertar(0.5)
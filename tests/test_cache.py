@@ -0,0 +1,153 @@
+"""
+Pruebas de CacheLRU y CacheLFU: orden de desalojo, expiración por tiempo y
+límite de bytes. CacheLFU se compara además con un modelo ingenuo que elige la
+víctima recorriendo todas las entradas.
+"""
+import random
+
+import pytest
+
+from CodigosModelo.Cache import CacheLFU, CacheLRU
+
+CACHES = [CacheLRU, CacheLFU]
+
+
+class Reloj:
+    """
+    Reloj falso para las pruebas de expiración.
+    """
+
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def test_lru_desaloja_la_usada_hace_mas_tiempo():
+    cache = CacheLRU(3)
+    for clave in "abc":
+        cache.guardar(clave, clave.upper())
+    assert cache.obtener("a") == "A"
+    cache.guardar("d", "D")
+    assert "b" not in cache
+    cache.guardar("c", "C2")
+    cache.guardar("e", "E")
+    assert "a" not in cache
+    assert sorted(cache.mapa) == ["c", "d", "e"]
+    assert cache.estadisticas()["desalojos"] == 2
+
+
+def test_lfu_desaloja_la_menos_usada_y_luego_la_mas_antigua():
+    cache = CacheLFU(3)
+    for clave in "abc":
+        cache.guardar(clave, clave)
+    cache.obtener("a")
+    cache.obtener("a")
+    cache.obtener("b")
+    cache.guardar("d", "d")
+    assert "c" not in cache
+    cache.guardar("e", "e")
+    # d y e tienen frecuencia 1; sale d, que llegó antes
+    cache.guardar("f", "f")
+    assert sorted(cache.mapa) == ["a", "b", "f"]
+
+
+def test_lfu_sin_grupo_minimo_tras_eliminar():
+    # al eliminar la única entrada de frecuencia mínima, la víctima siguiente
+    # sale del grupo que sigue, sin buscarlo
+    cache = CacheLFU(3, max_bytes=30, tamano_de=len)
+    cache.guardar("a", "x" * 10)
+    cache.guardar("b", "x" * 10)
+    cache.guardar("c", "x" * 10)
+    for _ in range(3):
+        cache.obtener("b")
+    for _ in range(4):
+        cache.obtener("c")
+    cache.eliminar("a")
+    assert [grupo.frecuencia for grupo in cache.grupos] == [4, 5]
+    # sobrescribir c con un valor mayor obliga a desalojar a b
+    cache.guardar("c", "x" * 25)
+    assert sorted(cache.mapa) == ["c"]
+    assert cache.bytes == 25
+
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_lfu_coincide_con_un_modelo_ingenuo(semilla):
+    azar = random.Random(semilla)
+    capacidad = 5
+    cache = CacheLFU(capacidad)
+    usos = {}
+    tiempo = 0
+    for _ in range(500):
+        tiempo += 1
+        clave = azar.randrange(12)
+        operacion = azar.random()
+        if operacion < 0.5:
+            valor = cache.obtener(clave)
+            if clave in usos:
+                assert valor == clave
+                usos[clave] = (usos[clave][0] + 1, tiempo)
+            else:
+                assert valor is None
+        elif operacion < 0.9:
+            if clave in usos:
+                usos[clave] = (usos[clave][0] + 1, tiempo)
+            elif len(usos) == capacidad:
+                del usos[min(usos, key=usos.get)]
+                usos[clave] = (1, tiempo)
+            else:
+                usos[clave] = (1, tiempo)
+            cache.guardar(clave, clave)
+        else:
+            assert cache.eliminar(clave) == (clave in usos)
+            usos.pop(clave, None)
+        assert sorted(cache.mapa) == sorted(usos)
+        assert all(cache.mapa[clave].dato.frecuencia == usos[clave][0] for clave in usos)
+
+
+@pytest.mark.parametrize("cls", CACHES)
+def test_entradas_expiran(cls):
+    reloj = Reloj()
+    cache = cls(10, ttl=5, reloj=reloj)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2, ttl=20)
+    reloj.ahora = 4
+    assert cache.obtener("a") == 1
+    reloj.ahora = 5
+    assert "a" not in cache
+    assert cache.obtener("a") is None
+    assert cache.obtener("b") == 2
+    cache.guardar("c", 3)
+    reloj.ahora = 30
+    assert cache.purgar_expirados() == 2
+    assert len(cache) == 0
+    estadisticas = cache.estadisticas()
+    assert (estadisticas["expirados"], estadisticas["aciertos"], estadisticas["fallos"]) == (3, 2, 1)
+
+
+@pytest.mark.parametrize("cls", CACHES)
+def test_limite_de_bytes(cls):
+    cache = cls(10, max_bytes=10, tamano_de=len)
+    cache.guardar("a", "xxxx")
+    cache.guardar("b", "xxxx")
+    cache.guardar("c", "xxxx")
+    assert "a" not in cache
+    assert cache.bytes == 8
+    cache.guardar("b", "xxxxxxxx")
+    assert sorted(cache.mapa) == ["b"]
+    assert cache.bytes == 8
+
+
+@pytest.mark.parametrize("cls", CACHES)
+def test_valor_demasiado_grande_no_cambia_el_cache(cls):
+    cache = cls(10, max_bytes=10, tamano_de=len)
+    cache.guardar("a", "xxxx")
+    cache.guardar("b", "yyyy")
+    with pytest.raises(ValueError):
+        cache.guardar("a", "x" * 11)
+    with pytest.raises(ValueError):
+        cache.guardar("c", "x" * 11)
+    assert cache.obtener("a") == "xxxx"
+    assert sorted(cache.mapa) == ["a", "b"]
+    assert cache.bytes == 8
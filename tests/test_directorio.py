@@ -0,0 +1,98 @@
+"""
+Pruebas de los directorios de personas y de sus piezas: IndiceNombres y el
+formato binario de DirectorioBinario.
+"""
+import random
+
+import pytest
+
+from CodigosModelo import DirectorioListaCircularDoble, DirectorioSimple
+from CodigosModelo.DirectorioBinario import DirectorioMapeado, guardarBinario, leerCSV
+from CodigosModelo.DirectorioConcurrente import DirectorioConcurrente
+from CodigosModelo.IndiceNombres import POCAS, IndiceNombres, normalizar
+
+DIRECTORIOS = [DirectorioSimple.Directorio, DirectorioListaCircularDoble.Directorio, DirectorioConcurrente]
+NOMBRES = ["Ana", "ána", "ANA", "Bo", "Cé", "ce", "Zed", "Mónica"]
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_agregar_muchos_mantiene_el_orden(semilla):
+    azar = random.Random(semilla)
+    indice = IndiceNombres()
+    referencia = []
+    for _ in range(6):
+        # alterna lotes chicos (insort) y grandes (mezcla)
+        cantidad = azar.choice([0, 1, POCAS, POCAS + 1, 3 * POCAS])
+        lote = [(azar.choice(NOMBRES), azar.randrange(50)) for _ in range(cantidad)]
+        indice.agregarMuchos(lote)
+        referencia = sorted(referencia + [(normalizar(nombre), nombre, rut) for nombre, rut in lote])
+        assert indice.entradas == referencia
+    assert sorted(indice.buscar("ana")) == sorted(
+        (nombre, rut) for clave, nombre, rut in referencia if clave == "ana")
+
+
+def test_leer_csv_ignora_filas_en_blanco(tmp_path):
+    ruta = tmp_path / "personas.csv"
+    ruta.write_text("nombre,rut\nJuan,123\n\nAna,456\n\n", encoding="utf-8")
+    bloques = list(leerCSV(ruta, tamano_bloque=2, encabezado=True))
+    assert [persona for bloque in bloques for persona in bloque] == [("Juan", 123), ("Ana", 456)]
+    assert all(bloques)
+
+
+@pytest.mark.parametrize("recorte", [None, 0, 10, 16, 30, -1])
+def test_directorio_mapeado_rechaza_archivos_incompletos(tmp_path, recorte):
+    ruta = tmp_path / "personas.bin"
+    guardarBinario(ruta, [("Juan", 123), ("Mónica", 66777)])
+    contenido = ruta.read_bytes()
+    if recorte is None:
+        mapeado = DirectorioMapeado(ruta)
+        assert mapeado.buscarPersona(66777) == "Mónica"
+        mapeado.cerrar()
+        return
+    ruta.write_bytes(contenido[:recorte])
+    with pytest.raises(ValueError, match="no es un directorio binario válido"):
+        DirectorioMapeado(ruta)
+
+
+@pytest.mark.parametrize("cls", DIRECTORIOS)
+def test_directorio_busca_renombra_y_guarda(cls, tmp_path):
+    directorio = cls()
+    directorio.agregarPersona("Juan", 123)
+    directorio.agregarPersonas([("Mónica", 66777), ("Pedro", 154623), ("Ana", 456)])
+    directorio.agregarPersona("Juan José", 123)
+    assert directorio.buscarPersona(123) == "Juan José"
+    assert directorio.buscarPersona(999) == "RUT NO ENCONTRADO"
+    assert directorio.buscarPersonas([66777, 999, 456]) == ["Mónica", "RUT NO ENCONTRADO", "Ana"]
+    assert list(directorio.buscarPorNombre("monica")) == [("Mónica", 66777)]
+    assert list(directorio.buscarPorNombre("juan")) == []
+    assert list(directorio.buscarPorPrefijo("j")) == [("Juan José", 123)]
+    assert sorted(directorio.personas()) == [("Ana", 456), ("Juan José", 123), ("Mónica", 66777), ("Pedro", 154623)]
+
+    ruta = tmp_path / "personas.bin"
+    directorio.guardar(ruta)
+    mapeado = cls.abrir(ruta)
+    assert sorted(mapeado.personas()) == sorted(directorio.personas())
+    mapeado.cerrar()
+
+
+@pytest.mark.parametrize("cls", DIRECTORIOS)
+@pytest.mark.parametrize("rut", ["12345678-9", 2**63])
+def test_buscar_personas_en_procesos_con_ruts_que_no_caben(cls, rut):
+    directorio = cls()
+    directorio.agregarPersonas([("Juan", 123), ("Ana", rut)])
+    ruts = [rut, 123, 999]
+    esperado = ["Ana", "Juan", "RUT NO ENCONTRADO"]
+    assert directorio.buscarPersonas(ruts, procesos=1) == esperado
+    assert directorio.buscarPersonas(ruts, procesos=2, umbral=1) == esperado
+
+
+@pytest.mark.parametrize("buscar, texto", [("buscar", "ana"), ("buscarPrefijo", "a")])
+def test_busqueda_en_curso_no_mezcla_listas(buscar, texto):
+    indice = IndiceNombres()
+    indice.agregarMuchos([("Ana", rut) for rut in range(0, 20, 2)])
+    resultados = getattr(indice, buscar)(texto)
+    vistos = [next(resultados)]
+    # agregarMuchos reemplaza la lista; la búsqueda sigue sobre la anterior
+    indice.agregarMuchos([("Ana", rut) for rut in range(1, 2 * POCAS + 3, 2)])
+    vistos.extend(resultados)
+    assert vistos == [("Ana", rut) for rut in range(0, 20, 2)]
@@ -0,0 +1,24 @@
+"""
+Importar los paquetes no debe tener efectos secundarios (ver
+benchmarks/tiempo_importacion.py): cada módulo de Arboles y CodigosModelo se
+importa en un intérprete nuevo con 'python -X importtime' y no debe cargar
+matplotlib, networkx ni multiprocessing, ni escribir en stdout. El tiempo no se
+verifica aquí, porque depende de la carga de la máquina; lo informa el script.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from tiempo_importacion import importados, modulos, prohibidos  # noqa: E402
+
+
+@pytest.mark.parametrize("modulo", modulos())
+def test_importar_no_carga_modulos_pesados_ni_escribe(modulo):
+    nombres, salida = importados(modulo)
+    assert modulo in nombres
+    cargados = prohibidos(nombres)
+    assert cargados == [], f"{modulo} carga {', '.join(cargados)}"
+    assert salida == "", f"{modulo} escribe en stdout"
@@ -0,0 +1,61 @@
+"""
+Pruebas de la instrumentación opcional.
+"""
+import threading
+
+from Arboles import ArbolAVL, ArbolBinarioBusqueda
+from CodigosModelo.DirectorioConcurrente import DirectorioConcurrente
+from CodigosModelo.Instrumentacion import desinstrumentar, instrumentar
+from CodigosModelo.ListaEn import ListaEnlazada
+
+
+def test_instrumentar_mide_metodos_publicos_y_desinstrumentar_restaura():
+    arbol = ArbolAVL()
+    for dato in range(100):
+        arbol.insertar(dato)
+    estadisticas = instrumentar(arbol)
+    assert arbol.buscar(50)
+    arbol.eliminar(10)  # heredado de ArbolBinarioBusqueda
+    assert set(estadisticas.por_operacion) == {"buscar", "eliminar"}
+    assert estadisticas.por_operacion["buscar"].llamadas == 1
+    desinstrumentar(arbol)
+    assert type(arbol) is ArbolAVL
+    assert type(arbol.raiz).__name__ == "Nodo"
+
+
+def test_classmethods_siguen_funcionando_en_la_clase_contada():
+    lista = ListaEnlazada.desde_iterable(range(5))
+    instrumentar(lista)
+    assert type(lista).desde_iterable([1, 2]).a_lista() == [1, 2]
+    assert isinstance(ArbolBinarioBusqueda.desde_ordenados([1, 2, 3]), ArbolBinarioBusqueda)
+    desinstrumentar(lista)
+
+
+def test_buscar_cuenta_una_comparacion_por_nodo_visitado():
+    arbol = ArbolBinarioBusqueda.desde_ordenados(range(15))
+    estadisticas = instrumentar(arbol)
+    # en el árbol perfecto de 15 nodos, 0 es una hoja a profundidad 3
+    assert arbol.buscar(0)
+    assert not arbol.buscar(-1)
+    resumen = estadisticas.por_operacion["buscar"]
+    assert resumen.comparaciones == 4 + 4
+    assert resumen.visitados == 4 + 4
+    desinstrumentar(arbol)
+
+
+def test_varios_hilos_no_pierden_mediciones():
+    directorio = DirectorioConcurrente()
+    directorio.agregarPersonas((f"Persona {rut}", rut) for rut in range(100))
+    estadisticas = instrumentar(directorio)
+
+    def leer():
+        for rut in range(2000):
+            directorio.buscarPersona(rut % 150)
+
+    hilos = [threading.Thread(target=leer) for _ in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert estadisticas.por_operacion["buscarPersona"].llamadas == 8 * 2000
+    desinstrumentar(directorio)
@@ -0,0 +1,273 @@
+"""
+Pruebas del núcleo común de las listas enlazadas (NucleoListas), de ListaArreglo
+y de ListaDesenrollada.
+"""
+import random
+
+import pytest
+
+from CodigosModelo import ListasCiDob, ListasCiEn
+from CodigosModelo.ListaArreglo import ListaArreglo
+from CodigosModelo.ListaDesenrollada import ListaDesenrollada
+from CodigosModelo.ListaDoEn import ListaDolementeenlazada
+from CodigosModelo.ListaEn import ListaEnlazada, Nodo
+from CodigosModelo.ListasRepaso import CircularLinkedList, DoublyLinkedList, LinkedList
+from CodigosModelo.NucleoListas import NucleoCircularDoble, NucleoCircularSimple, NucleoDoble, NucleoSimple
+
+NUCLEOS = [NucleoSimple, NucleoCircularSimple, NucleoDoble, NucleoCircularDoble]
+FACHADAS = [
+    ListaEnlazada, ListaDolementeenlazada, ListasCiEn.ListaCircularSimple,
+    ListasCiDob.ListaCircularSimple, LinkedList, DoublyLinkedList, CircularLinkedList,
+]
+
+
+def verificar_enlaces(lista, referencia):
+    """
+    Verifica los datos, el largo, los punteros al primero y al último, el cierre
+    de las circulares y, en las dobles, los enlaces hacia atrás.
+    """
+    assert lista.a_lista() == referencia
+    assert list(lista) == referencia
+    assert len(lista) == len(referencia)
+    if not referencia:
+        assert lista.primero is None and lista.ultimo is None
+        return
+    assert lista.primero.dato == referencia[0]
+    assert lista.ultimo.dato == referencia[-1]
+    assert lista.ultimo.siguiente is (lista.primero if lista.circular else None)
+    if isinstance(lista, NucleoDoble):
+        assert lista.primero.anterior is (lista.ultimo if lista.circular else None)
+        assert list(lista.iter_inverso()) == referencia[::-1]
+        nodo = lista.primero
+        for _ in range(len(referencia) - 1):
+            assert nodo.siguiente.anterior is nodo
+            nodo = nodo.siguiente
+
+
+@pytest.mark.parametrize("cls", NUCLEOS)
+def test_agregar_en_ambos_extremos(cls):
+    lista = cls()
+    verificar_enlaces(lista, [])
+    assert lista.obtener_cabeza() is None and lista.obtener_cola() is None
+    lista.agregar_final(2)
+    verificar_enlaces(lista, [2])
+    lista.agregar_inicio(1)
+    lista.agregar_final(3)
+    lista.agregar_inicio(0)
+    verificar_enlaces(lista, [0, 1, 2, 3])
+    assert (lista.obtener_cabeza(), lista.obtener_cola()) == (0, 3)
+    assert lista.existe(2) and not lista.existe(4)
+
+
+@pytest.mark.parametrize("cls", NUCLEOS)
+def test_eliminar_cabeza_cola_y_medio(cls):
+    lista = cls.desde_iterable(range(5))
+    assert lista.eliminar(0)
+    verificar_enlaces(lista, [1, 2, 3, 4])
+    assert lista.eliminar(4)
+    verificar_enlaces(lista, [1, 2, 3])
+    assert lista.eliminar(2)
+    verificar_enlaces(lista, [1, 3])
+    assert not lista.eliminar(7)
+    assert lista.eliminar(3) and lista.eliminar(1)
+    verificar_enlaces(lista, [])
+    lista.agregar_final(8)
+    verificar_enlaces(lista, [8])
+
+
+@pytest.mark.parametrize("cls", [NucleoCircularSimple, NucleoCircularDoble])
+def test_circular_da_la_vuelta(cls):
+    lista = cls.desde_iterable([1, 2, 3])
+    nodo = lista.primero
+    vuelta = []
+    for _ in range(7):
+        vuelta.append(nodo.dato)
+        nodo = nodo.siguiente
+    assert vuelta == [1, 2, 3, 1, 2, 3, 1]
+    lista.eliminar(1)
+    lista.agregar_inicio(0)
+    lista.agregar_final(4)
+    verificar_enlaces(lista, [0, 2, 3, 4])
+    assert lista.ultimo.siguiente.siguiente.dato == 2
+
+
+def test_lista_enlazada_inicio_y_fin_se_pueden_asignar():
+    lista = ListaEnlazada()
+    nodo = Nodo(1)
+    lista.inicio = lista.fin = nodo
+    assert lista.primero is nodo and lista.ultimo is nodo
+    assert lista.inicio is nodo and lista.fin is nodo
+
+
+@pytest.mark.parametrize("cls", FACHADAS)
+def test_insertar_despues_de_un_nodo(cls):
+    lista = cls()
+    uno = lista.agregar_final(1)
+    tres = lista.agregar_final(3)
+    dos = lista.insertar_despues(uno, 2)
+    cuatro = lista.insertar_despues(tres, 4)
+    verificar_enlaces(lista, [1, 2, 3, 4])
+    assert (dos.dato, cuatro.dato) == (2, 4)
+    assert lista.ultimo is cuatro
+
+
+@pytest.mark.parametrize("cls", FACHADAS)
+def test_eliminar_nodo_en_cabeza_cola_y_medio(cls):
+    lista = cls()
+    nodos = [lista.agregar_final(dato) for dato in range(5)]
+    assert lista.eliminar_nodo(nodos[0]) == 0
+    verificar_enlaces(lista, [1, 2, 3, 4])
+    assert lista.eliminar_nodo(nodos[4]) == 4
+    verificar_enlaces(lista, [1, 2, 3])
+    assert lista.eliminar_nodo(nodos[2]) == 2
+    verificar_enlaces(lista, [1, 3])
+    lista.eliminar_nodo(nodos[3])
+    lista.eliminar_nodo(nodos[1])
+    verificar_enlaces(lista, [])
+    nuevo = lista.agregar_inicio(9)
+    verificar_enlaces(lista, [9])
+    assert lista.primero is nuevo
+
+
+@pytest.mark.parametrize("cls", FACHADAS)
+def test_mover_al_frente(cls):
+    lista = cls()
+    nodos = [lista.agregar_final(dato) for dato in range(4)]
+    lista.mover_al_frente(nodos[2])
+    verificar_enlaces(lista, [2, 0, 1, 3])
+    lista.mover_al_frente(nodos[3])
+    verificar_enlaces(lista, [3, 2, 0, 1])
+    lista.mover_al_frente(nodos[3])
+    verificar_enlaces(lista, [3, 2, 0, 1])
+    assert lista.ultimo is nodos[1]
+
+
+def test_eliminar_nodo_ajeno_en_lista_simple():
+    lista = ListaEnlazada.desde_iterable([1, 2])
+    with pytest.raises(ValueError):
+        lista.eliminar_nodo(Nodo(1))
+    verificar_enlaces(lista, [1, 2])
+
+@pytest.mark.parametrize("cls", FACHADAS)
+def test_desde_iterable_y_extender_vacios(cls):
+    lista = cls.desde_iterable(iter([]))
+    verificar_enlaces(lista, [])
+    lista.extender([])
+    verificar_enlaces(lista, [])
+    lista.extender(iter([1, 2]))
+    verificar_enlaces(lista, [1, 2])
+    lista.extender(())
+    verificar_enlaces(lista, [1, 2])
+
+
+@pytest.mark.parametrize("cls", FACHADAS)
+def test_extender_una_lista_con_datos(cls):
+    lista = cls.desde_iterable([1, 2])
+    lista.extender(range(3, 6))
+    verificar_enlaces(lista, [1, 2, 3, 4, 5])
+    # los nodos agregados después siguen enlazándose bien
+    lista.agregar_final(6)
+    lista.agregar_inicio(0)
+    verificar_enlaces(lista, [0, 1, 2, 3, 4, 5, 6])
+
+
+@pytest.mark.parametrize("cls", FACHADAS)
+@pytest.mark.parametrize("predicado, quedan", [
+    (lambda v: v == 0, [1, 2, 3, 4]),
+    (lambda v: v == 4, [0, 1, 2, 3]),
+    (lambda v: v in (0, 4), [1, 2, 3]),
+    (lambda v: v % 2 == 1, [0, 2, 4]),
+    (lambda v: True, []),
+    (lambda v: False, [0, 1, 2, 3, 4]),
+])
+def test_eliminar_todos(cls, predicado, quedan):
+    lista = cls.desde_iterable(range(5))
+    assert lista.eliminar_todos(predicado) == 5 - len(quedan)
+    verificar_enlaces(lista, quedan)
+    lista.agregar_final(9)
+    verificar_enlaces(lista, quedan + [9])
+
+@pytest.mark.parametrize("agregar", ["agregar_final", "agregar_inicio"])
+def test_dato_invalido_no_pierde_posiciones(agregar):
+    lista = ListaArreglo()
+    lista.agregar_final(0)
+    capacidad = lista.capacidad()
+    for _ in range(2 * capacidad):
+        with pytest.raises(TypeError):
+            getattr(lista, agregar)("x")
+    for dato in range(1, capacidad):
+        getattr(lista, agregar)(dato)
+    assert lista.capacidad() == capacidad
+    assert len(lista) == capacidad
+    assert sorted(lista) == list(range(capacidad))
+
+
+def test_insertar_despues_con_dato_invalido():
+    lista = ListaArreglo()
+    primero = lista.agregar_final(1)
+    lista.agregar_final(3)
+    with pytest.raises(TypeError):
+        lista.insertar_despues(primero, "x")
+    lista.insertar_despues(primero, 2)
+    assert list(lista) == [1, 2, 3]
+
+
+def verificar_bloques(lista, referencia, minimo, salvo_extremos=True):
+    """
+    Verifica los datos, el largo y que los bloques estén al menos medio llenos.
+    Con salvo_extremos=False sólo se permite que el último no lo esté.
+    """
+    assert lista.a_lista() == referencia
+    assert len(lista) == len(referencia)
+    tamanos = []
+    bloque = lista.primero
+    while bloque is not None:
+        tamanos.append(len(bloque.datos))
+        bloque = bloque.siguiente
+    assert all(0 < tamano <= lista.capacidad for tamano in tamanos)
+    revisados = tamanos[1:-1] if salvo_extremos else tamanos[:-1]
+    assert all(tamano >= minimo for tamano in revisados), tamanos
+
+
+def test_eliminar_todos_deja_los_bloques_medio_llenos():
+    lista = ListaDesenrollada.desde_iterable(range(384), 64)
+    lista.eliminar_todos(lambda v: (v // 64) % 2 == 0 and v % 64 != 0)
+    referencia = [v for v in range(384) if not ((v // 64) % 2 == 0 and v % 64 != 0)]
+    verificar_bloques(lista, referencia, 32, salvo_extremos=False)
+
+
+@pytest.mark.parametrize("capacidad", [2, 3, 8, 9])
+@pytest.mark.parametrize("semilla", range(15))
+def test_operaciones_al_azar_mantienen_los_bloques(capacidad, semilla):
+    azar = random.Random(semilla)
+    lista = ListaDesenrollada(capacidad)
+    referencia = []
+    for _ in range(300):
+        operacion = azar.random()
+        if operacion < 0.3:
+            dato = azar.randrange(30)
+            lista.agregar_final(dato)
+            referencia.append(dato)
+        elif operacion < 0.4:
+            dato = azar.randrange(30)
+            lista.agregar_inicio(dato)
+            referencia.insert(0, dato)
+        elif operacion < 0.55:
+            posicion, dato = azar.randrange(len(referencia) + 1), azar.randrange(30)
+            lista.insertar(posicion, dato)
+            referencia.insert(posicion, dato)
+        elif operacion < 0.6:
+            datos = [azar.randrange(30) for _ in range(azar.randrange(3 * capacidad))]
+            lista.extender(datos)
+            referencia.extend(datos)
+        elif operacion < 0.95:
+            dato = azar.randrange(30)
+            assert lista.eliminar(dato) is (dato in referencia)
+            if dato in referencia:
+                referencia.remove(dato)
+        else:
+            divisor = azar.randrange(2, 5)
+            lista.eliminar_todos(lambda v: v % divisor == 0)
+            referencia = [v for v in referencia if v % divisor != 0]
+            verificar_bloques(lista, referencia, capacidad // 2, salvo_extremos=False)
+        verificar_bloques(lista, referencia, capacidad // 2)